@@ -1,26 +1,22 @@
 import json
 import os
+import sys
 import re
+import argparse
 from datetime import datetime, timedelta
 from contextlib import redirect_stdout
 
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..")))  # data/
+from common.watermark import Watermark, read_new_lines
+from common.text_filter import clean_party_text
+from common.jsonl import loads, JsonlWriter
+
 # 상대 경로 기준 설정
 INPUT_FILE = "../../a_dirty/data/ppp_all.jsonl"
 OUTPUT_FILE = "../data/ppp_all_cleaned.jsonl"
+WATERMARK_FILE = "../data/ppp_all_cleaned.watermark.json"  # 마지막으로 처리한 입력 위치
 LOG_FILE = "log/ppp_clean.log"
 
-# 유니코드 제거 대상 (깨짐/보이지 않음)
-PROBLEMATIC_UNICODE_PATTERN = r'[\u200B\uFEFF\u00A0\uFFFD]'
-
-# 허용 특수기호 외 제거
-ALLOWED_SYMBOLS = r"\.\?!'\""
-
-def remove_problematic_unicode(text):
-    return re.sub(PROBLEMATIC_UNICODE_PATTERN, '', text)
-
-def remove_disallowed_symbols(text):
-    return re.sub(fr"[^\w\s{ALLOWED_SYMBOLS}\uAC00-\uD7A3]", "", text)
-
 def remove_duplicate_sentences(text):
     seen = set()
     result = []
@@ -33,10 +29,9 @@ def remove_duplicate_sentences(text):
             result.append(line)
     return '\n'.join(result)
 
+# 깨짐/보이지 않는 유니코드 + 허용 특수기호 외 제거 (common/text_filter.py)
 def clean_text(text):
-    text = remove_problematic_unicode(text)
-    text = remove_disallowed_symbols(text)
-    return text.strip()
+    return clean_party_text(text)
 
 def normalize_date(date_str):
     try:
@@ -70,9 +65,9 @@ def clean_entry(entry):
 
 def clean_json_line(line):
     line = line.replace('\\"', '')  # 보조 escape 제거
-    return json.loads(line)
+    return loads(line)
 
-def main():
+def main(full=False):
     if not os.path.exists(INPUT_FILE):
         print(f"[오류] 입력 파일이 없습니다: {INPUT_FILE}")
         return
@@ -80,24 +75,32 @@ def main():
     os.makedirs(os.path.dirname(OUTPUT_FILE), exist_ok=True)
     os.makedirs(os.path.dirname(LOG_FILE), exist_ok=True)
 
-    with open(INPUT_FILE, "r", encoding="utf-8") as infile, \
-         open(OUTPUT_FILE, "w", encoding="utf-8") as outfile:
+    # 크롤러는 입력 파일에 추가만 하므로 지난번에 처리한 위치 이후만 정제해 이어 붙인다
+    watermark = Watermark(WATERMARK_FILE)
+    start = watermark.resume(INPUT_FILE, OUTPUT_FILE, full=full)
+    offset = start
+    print(f"[모드] 증분 (입력 {start}바이트부터)" if start else "[모드] 전체 재생성")
 
-        for line in infile:
+    with JsonlWriter(OUTPUT_FILE, "a" if start else "w") as outfile:
+        for line, offset in read_new_lines(INPUT_FILE, start):
             try:
                 data = clean_json_line(line)
                 cleaned = clean_entry(data)
-                json.dump(cleaned, outfile, ensure_ascii=False)
-                outfile.write("\n")
+                outfile.write(cleaned)
             except json.JSONDecodeError as e:
                 print(f"[경고] JSON 파싱 실패: {e}")
                 continue
 
+    watermark.save(INPUT_FILE, offset, output_offset=os.path.getsize(OUTPUT_FILE))
     print(f"[완료] 전처리 파일 저장: {OUTPUT_FILE}")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="국민의힘 논평 전처리")
+    parser.add_argument("--full", action="store_true", help="워터마크를 무시하고 출력 파일 전체 재생성")
+    args = parser.parse_args()
+
     with open(LOG_FILE, "a", encoding="utf-8") as log_f:
         with redirect_stdout(log_f):
             print("=" * 60)
             print(f"[실행 시각] {(datetime.utcnow() + timedelta(hours=9)).strftime('%Y-%m-%d %H:%M:%S')}")
-            main()
+            main(full=args.full)
@@ -1,32 +1,25 @@
 import json
 import os
-import re
+import sys
+import argparse
 from datetime import datetime, timedelta
 from contextlib import redirect_stdout
 
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..")))  # data/
+from common.watermark import Watermark, read_new_lines
+from common.text_filter import clean_party_text
+from common.jsonl import loads, JsonlWriter
+
 INPUT_FILE = "../../a_dirty/data/reformparty_all.jsonl"
 OUTPUT_FILE = "../data/reformparty_all_cleaned.jsonl"
+WATERMARK_FILE = "../data/reformparty_all_cleaned.watermark.json"  # 마지막으로 처리한 입력 위치
 LOG_FILE = "log/reformparty_clean.log"
 
-ALLOWED_SYMBOLS = r"\.\?!'\""
-
-SMART_QUOTES = re.compile(r'[“”‘’]')
-BOX_DRAWING = re.compile(r'[\u2500-\u257F]')
-BLOCK_ELEMENTS = re.compile(r'[\u2580-\u259F]')
-GEOMETRIC_SHAPES = re.compile(r'[\u25A0-\u25FF]')
-BAD_UNICODE = re.compile(r'[\u200B\uFEFF\u00A0\uFFFD]')
-UNWANTED_SYMBOLS = re.compile(fr"[^\w\s{ALLOWED_SYMBOLS}\uAC00-\uD7A3]")
-
 FORBIDDEN_TITLE_KEYWORDS = ['브리핑', '대변인']
 
+# 스마트 따옴표, 박스/블록/도형 문자, 비정상 유니코드는 모두 허용 문자 밖이라 한 번의 필터로 제거됨 (common/text_filter.py)
 def clean_text(text):
-    text = SMART_QUOTES.sub('', text)
-    text = BOX_DRAWING.sub('', text)
-    text = BLOCK_ELEMENTS.sub('', text)
-    text = GEOMETRIC_SHAPES.sub('', text)
-    text = BAD_UNICODE.sub('', text)
-    text = UNWANTED_SYMBOLS.sub('', text)
-    return text.strip()
+    return clean_party_text(text)
 
 def should_skip(entry):
     title = entry.get("title", "")
@@ -55,9 +48,9 @@ def clean_entry(entry):
 
 def clean_json_line(line):
     line = line.replace('\\"', '')  # JSON escape 제거
-    return json.loads(line)
+    return loads(line)
 
-def main():
+def main(full=False):
     if not os.path.exists(INPUT_FILE):
         print(f"[오류] 입력 파일이 없습니다: {INPUT_FILE}")
         return
@@ -70,10 +63,14 @@ def main():
     skipped_count = 0
     written_count = 0
 
-    with open(INPUT_FILE, "r", encoding="utf-8") as infile, \
-         open(OUTPUT_FILE, "w", encoding="utf-8") as outfile:
+    # 크롤러는 입력 파일에 추가만 하므로 지난번에 처리한 위치 이후만 정제해 이어 붙인다
+    watermark = Watermark(WATERMARK_FILE)
+    start = watermark.resume(INPUT_FILE, OUTPUT_FILE, full=full)
+    offset = start
+    print(f"[모드] 증분 (입력 {start}바이트부터)" if start else "[모드] 전체 재생성")
 
-        for line in infile:
+    with JsonlWriter(OUTPUT_FILE, "a" if start else "w") as outfile:
+        for line, offset in read_new_lines(INPUT_FILE, start):
             total_lines += 1
             line = line.strip()
             if not line:
@@ -89,13 +86,14 @@ def main():
                 else:
                     written_count += 1
                     print(f"[통과] title: {cleaned['title']}")
-                    json.dump(cleaned, outfile, ensure_ascii=False)
-                    outfile.write("\n")
+                    outfile.write(cleaned)
 
             except json.JSONDecodeError as e:
                 print(f"[경고] JSON 파싱 실패: {e}")
                 continue
 
+    watermark.save(INPUT_FILE, offset, output_offset=os.path.getsize(OUTPUT_FILE))
+
     print("=" * 40)
     print(f"[총 입력 라인 수] {total_lines}")
     print(f"[파싱 성공] {parsed_count}")
@@ -104,8 +102,12 @@ def main():
     print(f"[완료] 전처리 파일 저장: {OUTPUT_FILE}")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="개혁신당 논평 전처리")
+    parser.add_argument("--full", action="store_true", help="워터마크를 무시하고 출력 파일 전체 재생성")
+    args = parser.parse_args()
+
     with open(LOG_FILE, "a", encoding="utf-8") as log_f:
         with redirect_stdout(log_f):
             print("=" * 60)
             print(f"[실행 시각] {(datetime.utcnow() + timedelta(hours=9)).strftime('%Y-%m-%d %H:%M:%S')}")
-            main()
+            main(full=args.full)
@@ -1,4 +1,5 @@
 import os
+import sys
 import re
 import json
 import time
@@ -13,6 +14,12 @@ ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 DATA_PATH = os.path.join(ROOT_DIR, "a_dirty", "data", "minjoo_all.jsonl")
 LOG_DIR = os.path.join(ROOT_DIR, "a_dirty", "py", "log")
 LOG_PATH = os.path.join(LOG_DIR, "minjoo_crawl.log")
+INDEX_PATH = os.path.join(ROOT_DIR, "index", "seen_urls.sqlite3")  # 크롤러/전처리/업로더 공용 URL 인덱스
+INDEX_NS = "crawl:minjoo"
+
+sys.path.append(os.path.dirname(ROOT_DIR))  # data/
+from common.url_index import UrlIndex
+from common.jsonl import loads, dumps
 
 # [2] 크롤링 대상 URL 및 날짜 필터
 BASE_URL = "https://theminjoo.kr/main/sub/news/list.php?brd=11&sno={}"
@@ -28,7 +35,7 @@ chrome_options.add_argument("--disable-dev-shm-usage")
 CHROME_DRIVER_PATH = os.getenv("CHROME_DRIVER_PATH")
 driver = webdriver.Chrome(executable_path=CHROME_DRIVER_PATH, options=chrome_options) if CHROME_DRIVER_PATH else webdriver.Chrome(options=chrome_options)
 
-# [4] 기존 저장된 URL 불러오기
+# [4] 기존 저장된 URL 불러오기 (URL 인덱스 최초 생성 시에만 사용)
 def load_saved_urls(path):
     saved_urls = set()
     if not os.path.exists(path):
@@ -36,7 +43,7 @@ def load_saved_urls(path):
     with open(path, "r", encoding="utf-8") as f:
         for line in f:
             try:
-                obj = json.loads(line)
+                obj = loads(line)
                 if "url" in obj:
                     saved_urls.add(obj["url"])
             except json.JSONDecodeError:
@@ -115,7 +122,9 @@ def extract_detail(post_id):
 
 # [6] 크롤링 메인 함수
 def crawl():
-    saved_urls = load_saved_urls(DATA_PATH)
+    url_index = UrlIndex(INDEX_PATH)
+    url_index.seed(INDEX_NS, lambda: load_saved_urls(DATA_PATH))
+    saved_urls = url_index.view(INDEX_NS)
     os.makedirs(os.path.dirname(DATA_PATH), exist_ok=True)
     os.makedirs(LOG_DIR, exist_ok=True)
 
@@ -153,7 +162,8 @@ def crawl():
     if new_data:
         with open(DATA_PATH, "a", encoding="utf-8") as f:
             for item in sorted(new_data, key=lambda x: x["date"]):
-                f.write(json.dumps(item, ensure_ascii=False) + "\n")
+                f.write(dumps(item))
+        url_index.add_many(INDEX_NS, [item["url"] for item in new_data])
         print(f"[완료] {len(new_data)}개 글 저장")
     else:
         print("[완료] 새 글 없음")
@@ -161,6 +171,7 @@ def crawl():
     if duplicate_count > 0:
         print(f"[중복] {duplicate_count}개 글 건너뜀")
 
+    url_index.close()
     driver.quit()
 
 # [7] 실행 (로그 리디렉션)
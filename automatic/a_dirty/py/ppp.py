@@ -1,4 +1,5 @@
 import os
+import sys
 import re
 import json
 import time
@@ -20,6 +21,13 @@ ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 DATA_PATH = os.path.join(ROOT_DIR, "a_dirty", "data", "ppp_all.jsonl")
 LOG_DIR = os.path.join(ROOT_DIR, "a_dirty", "py", "log")
 LOG_PATH = os.path.join(LOG_DIR, "ppp_crawl.log")
+INDEX_PATH = os.path.join(ROOT_DIR, "index", "seen_urls.sqlite3")  # 크롤러/전처리/업로더 공용 URL 인덱스
+INDEX_NS = "crawl:ppp"
+
+sys.path.append(os.path.dirname(ROOT_DIR))  # data/
+from common.url_index import UrlIndex
+from common.jsonl import loads, dumps
+
 os.makedirs(os.path.dirname(DATA_PATH), exist_ok=True)
 os.makedirs(LOG_DIR, exist_ok=True)
 
@@ -36,7 +44,7 @@ def normalize_ppp_url(url):
     parsed = urllib.parse.urlparse(url)
     return f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
 
-# [5] 기존 저장된 URL 불러오기
+# [5] 기존 저장된 URL 불러오기 (URL 인덱스 최초 생성 시에만 사용)
 def load_existing_urls(path):
     urls = set()
     if not os.path.exists(path):
@@ -44,7 +52,7 @@ def load_existing_urls(path):
     with open(path, "r", encoding="utf-8") as f:
         for line in f:
             try:
-                obj = json.loads(line)
+                obj = loads(line)
                 if "url" in obj:
                     norm = normalize_ppp_url(obj["url"].strip())
                     urls.add(norm)
@@ -86,7 +94,9 @@ def extract_detail(detail_url):
 
 # [7] 크롤링 함수
 def crawl_ppp():
-    existing_urls = load_existing_urls(DATA_PATH)
+    url_index = UrlIndex(INDEX_PATH)
+    url_index.seed(INDEX_NS, lambda: load_existing_urls(DATA_PATH))
+    existing_urls = url_index.view(INDEX_NS)
     new_items = []
     log_lines = []
     now = (datetime.utcnow() + timedelta(hours=9)).strftime("%Y-%m-%d %H:%M:%S")
@@ -153,7 +163,8 @@ def crawl_ppp():
     if new_items:
         with open(DATA_PATH, "a", encoding="utf-8") as f:
             for item in sorted(new_items, key=lambda x: x["date"]):
-                f.write(json.dumps(item, ensure_ascii=False) + "\n")
+                f.write(dumps(item))
+        url_index.add_many(INDEX_NS, [item["url"] for item in new_items])
         print(f"[완료] {len(new_items)}개 글 저장")
         log_lines.append(f"[완료] {len(new_items)}개 글 저장")
     else:
@@ -168,6 +179,7 @@ def crawl_ppp():
         for line in log_lines:
             log_file.write(line + "\n")
 
+    url_index.close()
     driver.quit()
 
 if __name__ == "__main__":
@@ -1,4 +1,5 @@
 import os
+import sys
 import re
 import json
 import time
@@ -14,6 +15,12 @@ ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 DATA_PATH = os.path.join(ROOT_DIR, "a_dirty", "data", "reformparty_all.jsonl")
 LOG_DIR = os.path.join(ROOT_DIR, "a_dirty", "py", "log")
 LOG_PATH = os.path.join(LOG_DIR, "reformparty_crawl.log")
+INDEX_PATH = os.path.join(ROOT_DIR, "index", "seen_urls.sqlite3")  # 크롤러/전처리/업로더 공용 URL 인덱스
+INDEX_NS = "crawl:reform"
+
+sys.path.append(os.path.dirname(ROOT_DIR))  # data/
+from common.url_index import UrlIndex
+from common.jsonl import loads, dumps
 BASE_URL = "https://www.reformparty.kr/briefing?page="
 
 # [2] 크롬 드라이버 설정
@@ -23,7 +30,7 @@ chrome_options.add_argument("--no-sandbox")
 chrome_options.add_argument("--disable-dev-shm-usage")
 driver = webdriver.Chrome(options=chrome_options)
 
-# [3] 저장된 URL 불러오기
+# [3] 저장된 URL 불러오기 (URL 인덱스 최초 생성 시에만 사용)
 def load_saved_urls(path):
     saved_urls = set()
     if not os.path.exists(path):
@@ -31,7 +38,7 @@ def load_saved_urls(path):
     with open(path, "r", encoding="utf-8") as f:
         for line in f:
             try:
-                obj = json.loads(line)
+                obj = loads(line)
                 if "url" in obj:
                     saved_urls.add(obj["url"].strip())  # strip 추가
             except json.JSONDecodeError:
@@ -71,7 +78,9 @@ def parse_meta_title(text):
 
 # [6] 크롤링 실행
 def crawl():
-    saved_urls = load_saved_urls(DATA_PATH)
+    url_index = UrlIndex(INDEX_PATH)
+    url_index.seed(INDEX_NS, lambda: load_saved_urls(DATA_PATH))
+    saved_urls = url_index.view(INDEX_NS)
     os.makedirs(os.path.dirname(DATA_PATH), exist_ok=True)
     os.makedirs(LOG_DIR, exist_ok=True)
 
@@ -141,7 +150,8 @@ def crawl():
     if new_data:
         with open(DATA_PATH, "a", encoding="utf-8") as f:
             for item in new_data:
-                f.write(json.dumps(item, ensure_ascii=False) + "\n")
+                f.write(dumps(item))
+        url_index.add_many(INDEX_NS, [item["url"] for item in new_data])
         print(f"[완료] {len(new_data)}개 글 저장")
     else:
         print("[완료] 새 글 없음")
@@ -149,6 +159,7 @@ def crawl():
     if duplicate_count > 0:
         print(f"[중복] {duplicate_count}개 글 건너뜀")
 
+    url_index.close()
     driver.quit()
 
 # [7] 실행 및 로그 저장
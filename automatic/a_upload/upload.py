@@ -1,11 +1,17 @@
 import os
+import sys
 import json
 import glob
-from pymongo import MongoClient
+from pymongo import MongoClient, UpdateOne
+from pymongo.errors import BulkWriteError, OperationFailure
 from dotenv import load_dotenv
 from datetime import datetime
 import pytz
 
+sys.path.append(os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..")))  # data/
+from common.watermark import Watermark, read_new_lines
+from common.jsonl import loads
+
 # ==== [0] KST 기준 현재 시간 ====
 def now_kst():
     return datetime.now(pytz.timezone("Asia/Seoul")).strftime("%Y-%m-%d %H:%M:%S")
@@ -24,6 +30,8 @@ db = client["political_party_commentary"]  # 고정 DB 이름
 base_dir = os.path.dirname(os.path.abspath(__file__))  # /home/ubuntu/data/automatic/a_upload
 data_folder = os.path.normpath(os.path.join(base_dir, "..", "a_clean", "data"))  # ../a_clean/data
 log_file_path = os.path.join(base_dir, "log", "upload_log.log")  # ./log/upload_log.log
+state_dir = os.path.join(base_dir, "state")  # ./state/<파일명>.watermark.json (파일별 업로드 위치)
+BATCH_SIZE = 500
 
 file_collection_map = {
     "minjoo_all_cleaned.jsonl": "minjoo",
@@ -38,7 +46,51 @@ def write_log(message):
     with open(log_file_path, "a", encoding="utf-8") as log_file:
         log_file.write(f"[{timestamp}] {message}\n")
 
-# ==== [5] 업로드 실행 ====
+# ==== [5] 배치 업로드 (url 고유 인덱스 + 순서 없는 insert_many, 중복 키는 건너뜀) ====
+# 고유 인덱스를 만들 수 없으면(기존 중복 url 등) insert_many는 중복을 막지 못하므로 url 기준 upsert로 올린다.
+def ensure_url_index(collection):
+    try:
+        collection.create_index("url", unique=True)
+        return True
+    except OperationFailure as e:
+        write_log(f"{collection.name} url 고유 인덱스 생성 실패 → url 기준 upsert로 업로드: {e}")
+        return False
+
+def insert_batch(collection, docs, unique_index=True):
+    if not docs:
+        return 0, 0, 0
+    try:
+        if unique_index:
+            result = collection.insert_many(docs, ordered=False)
+            return len(result.inserted_ids), 0, 0
+        requests = [UpdateOne({"url": doc["url"]}, {"$setOnInsert": doc}, upsert=True) for doc in docs]
+        upserted = collection.bulk_write(requests, ordered=False).upserted_count
+        return upserted, len(docs) - upserted, 0
+    except BulkWriteError as e:
+        errors = e.details.get("writeErrors", [])
+        duplicated = sum(1 for err in errors if err.get("code") == 11000)
+        failed = len(errors) - duplicated
+        for err in errors:
+            if err.get("code") != 11000:
+                write_log(f"{collection.name} 업로드 오류: {err.get('errmsg')}")
+        inserted = e.details.get("nInserted", 0) + e.details.get("nUpserted", 0)
+        return inserted, len(docs) - inserted - failed, failed
+
+# 워터마크 offset 직전의 마지막 url (저장해 둔 last_url과 같아야 이어서 읽을 수 있음)
+def url_before(file_path, offset, window=65536):
+    with open(file_path, "rb") as f:
+        f.seek(max(0, offset - window))
+        lines = f.read(offset - max(0, offset - window)).split(b"\n")
+    for line in reversed(lines[1:] if offset > window else lines):  # 잘린 첫 줄 제외
+        try:
+            url = loads(line).get("url", "").strip()
+        except (json.JSONDecodeError, AttributeError):
+            continue
+        if url:
+            return url
+    return None
+
+# ==== [6] 업로드 실행: 워터마크 이후 새로 추가된 줄만 ====
 total_inserted = 0
 
 for filename, collection_name in file_collection_map.items():
@@ -48,35 +100,63 @@ for filename, collection_name in file_collection_map.items():
         continue
 
     collection = db[collection_name]
-    existing_urls = set(doc["url"] for doc in collection.find({}, {"url": 1}))
+    unique_index = ensure_url_index(collection)
+
+    # 전처리 결과가 새로 만들어졌으면(--full 등) 지문이 달라져 처음부터 읽고, 기존 문서는 중복 키로 건너뛴다
+    watermark = Watermark(os.path.join(state_dir, f"{filename}.watermark.json"))
+    start = watermark.resume_offset(file_path)
+    last_url = watermark.get("last_url", "") if start else ""
+    if start and last_url and url_before(file_path, start) != last_url:
+        write_log(f"'{filename}' 워터마크 위치의 url이 last_url과 다름 → 처음부터 (기존 문서는 중복으로 건너뜀)")
+        start, last_url = 0, ""
+    offset = start
 
     inserted_count = 0
     skipped_count = 0
     failed_count = 0
     parse_error_count = 0
+    batch = []
+    batch_last_url = last_url
+    end = start
+
+    for line, end in read_new_lines(file_path, start):
+        try:
+            doc = loads(line)
+            url = doc.get("url", "").strip()
+            if url:
+                batch.append(doc)
+                batch_last_url = url
+            else:
+                skipped_count += 1
+        except json.JSONDecodeError:
+            parse_error_count += 1
+
+        if len(batch) >= BATCH_SIZE:
+            inserted, skipped, failed = insert_batch(collection, batch, unique_index)
+            inserted_count += inserted
+            skipped_count += skipped
+            failed_count += failed
+            batch = []
+            if failed:
+                # 실패한 문서가 다음 실행에서 다시 시도되도록 워터마크를 옮기지 않음
+                break
+            offset, last_url = end, batch_last_url
+            watermark.save(file_path, offset, last_url=last_url)
 
-    with open(file_path, "r", encoding="utf-8") as f:
-        for i, line in enumerate(f, start=1):
-            try:
-                doc = json.loads(line.strip())
-                url = doc.get("url", "").strip()
-                if not url:
-                    skipped_count += 1
-                    continue
-                if url in existing_urls:
-                    skipped_count += 1
-                    continue
-                collection.insert_one(doc)
-                inserted_count += 1
-            except json.JSONDecodeError:
-                parse_error_count += 1
-            except Exception as e:
-                failed_count += 1
+    if not failed_count:
+        inserted, skipped, failed = insert_batch(collection, batch, unique_index)
+        inserted_count += inserted
+        skipped_count += skipped
+        failed_count += failed
+        if not failed:
+            offset, last_url = end, batch_last_url
+            watermark.save(file_path, offset, last_url=last_url)
 
     total_inserted += inserted_count
     write_log(
         f"'{filename}' 파일: {inserted_count}건 업로드, "
-        f"중복 {skipped_count}건, 실패 {failed_count}건, JSON 오류 {parse_error_count}건"
+        f"중복 {skipped_count}건, 실패 {failed_count}건, JSON 오류 {parse_error_count}건 "
+        f"(offset {start} → {offset})"
     )
 
 write_log(f"전체 업로드 완료: 총 {total_inserted}건 업로드됨\n")
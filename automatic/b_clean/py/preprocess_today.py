@@ -1,5 +1,5 @@
 import os
-import json
+import sys
 import re
 import pytz
 from datetime import datetime
@@ -21,6 +21,10 @@ input_path = os.path.join(DIRTY_DIR, f"editorial_{date_str}.jsonl")
 output_path = os.path.join(CLEAN_DIR, f"{date_str}.jsonl")
 log_path = os.path.join(LOG_DIR, f"preprocess_{date_str}.log")
 
+sys.path.append(os.path.dirname(ROOT_DIR))                         # ~/data
+from common.text_filter import clean_editorial_text as clean_text
+from common.jsonl import loads, JsonlWriter
+
 # === 로그 함수 ===
 def log(msg):
     timestamp = datetime.now(korea).strftime("%H:%M:%S")
@@ -29,24 +33,7 @@ def log(msg):
         f.write(line + "\n")
     print(line)
 
-# === 유니코드 치환 및 특수문자 필터 ===
-UNICODE_REPLACEMENTS = {
-    '‘': "'", '’': "'", '“': '', '”': '',
-    '…': '...', '–': '-', '—': '-',
-    '·': '', '″': '', '′': "'",
-    '\u00A0': ' ',
-}
-ALLOWED_SPECIALS = ".,?!()':%"
-HANJA_RE = r'\u4e00-\u9fff'
-
-def clean_text(text):
-    for orig, repl in UNICODE_REPLACEMENTS.items():
-        text = text.replace(orig, repl)
-    return ''.join(
-        c for c in text
-        if c.isalnum() or c in ALLOWED_SPECIALS or re.match(f"[{HANJA_RE}]", c) or c.isspace()
-    ).strip()
-
+# === 제목 / 본문 정리 (유니코드 치환 및 특수문자 필터: common/text_filter.py) ===
 def clean_title(title):
     title = re.sub(r"\[.*?\]", "", title).strip()
     return clean_text(title)
@@ -64,11 +51,11 @@ def preprocess():
     total = 0
     saved = 0
 
-    with open(input_path, "r", encoding="utf-8") as fin, open(output_path, "w", encoding="utf-8") as fout:
+    with open(input_path, "rb") as fin, JsonlWriter(output_path) as fout:
         for line in fin:
             try:
                 total += 1
-                data = json.loads(line)
+                data = loads(line)
                 title = data.get("title", "").strip()
                 content = data.get("content", "").strip()
                 press = data.get("press", "").strip()
@@ -90,7 +77,7 @@ def preprocess():
 
                 data["title"] = title_clean
                 data["content"] = content_clean
-                fout.write(json.dumps(data, ensure_ascii=False) + "\n")
+                fout.write(data)
                 saved += 1
 
             except Exception as e:
@@ -1,6 +1,6 @@
 import os
+import sys
 import time
-import json
 import re
 import pytz
 from datetime import datetime
@@ -18,6 +18,9 @@ LOG_DIR = os.path.join(BASE_DIR, "log")
 os.makedirs(DATA_DIR, exist_ok=True)
 os.makedirs(LOG_DIR, exist_ok=True)
 
+sys.path.append(os.path.dirname(ROOT_DIR))  # data/
+from common.jsonl import dumps, iter_urls
+
 # === 날짜 설정 ===
 korea = pytz.timezone("Asia/Seoul")
 now = datetime.now(korea)
@@ -67,8 +70,7 @@ def is_english(text):
 def load_seen_urls(path):
     if not os.path.exists(path):
         return set()
-    with open(path, "r", encoding="utf-8") as f:
-        return set(json.loads(line)["url"] for line in f if line.strip())
+    return set(iter_urls(path))
 
 # === 스크롤 함수 ===
 def scroll_to_bottom(driver):
@@ -142,7 +144,7 @@ def crawl_today():
 
     with open(output_path, "a", encoding="utf-8") as f:
         for article in articles:
-            f.write(json.dumps(article, ensure_ascii=False) + "\n")
+            f.write(dumps(article))
             log(f"[✓] 저장됨: {article['title']}")
 
     log(f"[✔] 완료 - 저장: {len(articles)}개")
@@ -1,6 +1,8 @@
 import os
+import sys
 import json
-from pymongo import MongoClient
+from pymongo import MongoClient, UpdateOne
+from pymongo.errors import BulkWriteError, OperationFailure
 from dotenv import load_dotenv
 from datetime import datetime
 import pytz
@@ -19,6 +21,9 @@ LOG_DIR = os.path.join(BASE_DIR, "log")
 LOG_PATH = os.path.join(LOG_DIR, f"upload_{date_str}.log")
 os.makedirs(LOG_DIR, exist_ok=True)
 
+sys.path.append(os.path.dirname(ROOT_DIR))                        # ~/data
+from common.jsonl import loads
+
 # === [3] 로그 함수 정의 ===
 def log(message):
     timestamp = datetime.now(korea).strftime("%Y-%m-%d %H:%M:%S")
@@ -42,34 +47,64 @@ if not os.path.exists(INPUT_PATH):
     log(f"파일 없음: {INPUT_PATH} → 업로드 생략")
     exit()
 
-# === [6] 이미 존재하는 url 목록 가져오기 ===
-existing_urls = set()
-for doc in collection.find({}, {"url": 1}):
-    existing_urls.add(doc["url"])
+# === [6] url 고유 인덱스 보장 ===
+# 요약 워커(summary/summary_worker.py)도 같은 컬렉션에 url 기준 upsert로 쓰므로,
+# 두 쪽이 동시에 같은 사설을 올려도 고유 인덱스 덕분에 한 건만 남는다.
+try:
+    collection.create_index("url", unique=True)
+except OperationFailure as e:
+    log(f"url 고유 인덱스 생성 실패: {e}")
+
+BATCH_SIZE = 500
 
-# === [7] 파일 읽고 업로드 시도 ===
+def flush_batch(batch):
+    """url 기준 upsert ($setOnInsert): 이미 있으면(요약 워커가 먼저 올린 경우 포함) 건드리지 않음"""
+    if not batch:
+        return 0, 0, 0
+    requests = [UpdateOne({"url": doc["url"]}, {"$setOnInsert": doc}, upsert=True) for doc in batch]
+    failed_count = 0
+    try:
+        details = collection.bulk_write(requests, ordered=False).bulk_api_result
+    except BulkWriteError as e:
+        details = e.details
+        for err in details.get("writeErrors", []):
+            if err.get("code") != 11000:  # 중복 키는 건너뛴 것으로 처리
+                failed_count += 1
+                log(f"업로드 오류: {err.get('errmsg')}")
+    inserted_count = details.get("nUpserted", 0)
+    return inserted_count, len(batch) - inserted_count - failed_count, failed_count
+
+# === [7] 파일 읽고 업로드 ===
 inserted = 0
 skipped = 0
 failed = 0
 parse_errors = 0
+batch = []
 
-with open(INPUT_PATH, "r", encoding="utf-8") as f:
+with open(INPUT_PATH, "rb") as f:
     for line in f:
         try:
-            doc = json.loads(line.strip())
-            url = doc.get("url", "").strip()
-            if not url:
-                skipped += 1
-                continue
-            if url in existing_urls:
-                skipped += 1
-                continue
-            collection.insert_one(doc)
-            inserted += 1
+            doc = loads(line)
         except json.JSONDecodeError:
             parse_errors += 1
-        except Exception as e:
-            failed += 1
+            continue
+        url = doc.get("url", "").strip()
+        if not url:
+            skipped += 1
+            continue
+        doc["url"] = url
+        batch.append(doc)
+        if len(batch) >= BATCH_SIZE:
+            batch_inserted, batch_skipped, batch_failed = flush_batch(batch)
+            inserted += batch_inserted
+            skipped += batch_skipped
+            failed += batch_failed
+            batch = []
+
+batch_inserted, batch_skipped, batch_failed = flush_batch(batch)
+inserted += batch_inserted
+skipped += batch_skipped
+failed += batch_failed
 
 # === [8] 결과 기록 ===
 log(f"{date_str}.jsonl → 업로드 완료: {inserted}건")
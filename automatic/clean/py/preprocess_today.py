@@ -1,7 +1,6 @@
 import os
-import json
+import sys
 import re
-import unicodedata
 import pytz
 from datetime import datetime
 
@@ -16,6 +15,13 @@ BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
 INPUT_PATH = os.path.normpath(os.path.join(BASE_DIR, "..", "..", "dirty", "data", f"{date_str}.jsonl"))
 OUTPUT_PATH = os.path.normpath(os.path.join(BASE_DIR, "..", "data", f"cleaned_{date_str}.jsonl"))
+INDEX_PATH = os.path.normpath(os.path.join(BASE_DIR, "..", "..", "index", "seen_urls.sqlite3"))
+INDEX_NS = "clean:news"
+
+sys.path.append(os.path.normpath(os.path.join(BASE_DIR, "..", "..", "..")))  # data/
+from common.url_index import UrlIndex
+from common.text_filter import clean_news_text as clean_text
+from common.jsonl import iter_jsonl, iter_urls, JsonlWriter
 
 # --- 로그 설정 ---
 LOG_DIR = os.path.join(BASE_DIR, "log")  # dirty/py/log
@@ -29,32 +35,13 @@ def log(msg):
         f.write(formatted + "\n")
     print(formatted)
 
-# --- 정규식 및 필터 정의 ---
-KEEP_SYMBOLS = set(".:,?!'()")
+# --- 정규식 및 필터 정의 (문자 필터: common/text_filter.py) ---
 EMAIL_REGEX = re.compile(r"\S+@\S+\.\S+")
 NEWS_AGENCY_REGEX = re.compile(r"[가-힣]{2,10}(일보|뉴스)")
 STRICT_REPORTER_REGEX = re.compile(r"^[가-힣]{2,4}(·[가-힣]{2,4})*\s?기자$")
 SHORT_KOREAN_NAME_REGEX = re.compile(r"^[가-힣]{2,4}$")
 QA_PATTERN = re.compile(r"\b(Q:|A:)\b", re.IGNORECASE)
 
-def remove_invisible_spaces(text):
-    invisible_chars = {
-        '\u00A0', '\u2000', '\u2001', '\u2002', '\u2003', '\u2004',
-        '\u2005', '\u2006', '\u2007', '\u2008', '\u2009', '\u200A',
-        '\u202F', '\u205F', '\u3000', '\u200B', '\u200C', '\u200D',
-        '\u2060', '\ufeff'
-    }
-    return ''.join(ch for ch in text if ch not in invisible_chars and unicodedata.category(ch) != 'Cf')
-
-def clean_text(text):
-    text = remove_invisible_spaces(text)
-    return ''.join(
-        ch for ch in text if (
-            ch.isalnum() or ch.isspace() or ch in KEEP_SYMBOLS or
-            '가' <= ch <= '힣' or 'ㄱ' <= ch <= 'ㅎ' or 'ㅏ' <= ch <= 'ㅣ'
-        )
-    )
-
 def remove_end_info(text):
     lines = text.strip().splitlines()
     cleaned = []
@@ -96,30 +83,54 @@ def process_record(record):
     record["content"] = content
     return record
 
+def load_urls(path):
+    if not os.path.exists(path):
+        return set()
+    return set(iter_urls(path))
+
+def warn_decode_error(path, line_no, line, e):
+    log(f"[경고] JSON 파싱 실패 (라인 {line_no}): {e}")
+
 def main():
     if not os.path.exists(INPUT_PATH):
         log(f"[!] 입력 파일 없음: {INPUT_PATH}")
         return
 
     os.makedirs(os.path.dirname(OUTPUT_PATH), exist_ok=True)
-    count_in, count_out = 0, 0
-
-    with open(INPUT_PATH, 'r', encoding='utf-8') as infile, \
-         open(OUTPUT_PATH, 'w', encoding='utf-8') as outfile:
-
-        for i, line in enumerate(infile, start=1):
-            try:
-                record = json.loads(line)
-                count_in += 1
-                cleaned = process_record(record)
-                if cleaned:
-                    outfile.write(json.dumps(cleaned, ensure_ascii=False) + '\n')
-                    count_out += 1
-            except json.JSONDecodeError as e:
-                log(f"[경고] JSON 파싱 실패 (라인 {i}): {e}")
+    count_in, count_out, count_seen = 0, 0, 0
+
+    # 이미 전처리한 URL은 공용 URL 인덱스로 건너뛰고 새 기사만 이어 붙인다
+    url_index = UrlIndex(INDEX_PATH)
+    url_index.seed(INDEX_NS, lambda: load_urls(OUTPUT_PATH))
+    # 출력 파일이 없으면 오늘 파일 전체를 다시 만든다
+    rebuild = not os.path.exists(OUTPUT_PATH)
+    processed = []
+
+    # 출력 파일을 flush한 직후에 해당 URL들을 인덱스에 기록한다
+    # (중간에 죽어도 파일에 쓴 줄과 인덱스가 어긋나지 않도록)
+    def commit(outfile):
+        outfile.flush()
+        url_index.add_many(INDEX_NS, processed)
+        processed.clear()
+
+    with JsonlWriter(OUTPUT_PATH, "a") as outfile:
+        for record in iter_jsonl(INPUT_PATH, on_error=warn_decode_error):
+            count_in += 1
+            url = record.get("url", "")
+            if not rebuild and url and url_index.contains(INDEX_NS, url):
+                count_seen += 1
                 continue
-
-    log(f"[✓] 전처리 완료: {count_out}개 저장 ({count_in}개 중) → {OUTPUT_PATH}")
+            cleaned = process_record(record)
+            if cleaned:
+                outfile.write(cleaned)
+                count_out += 1
+            processed.append(url)
+            if len(processed) >= outfile.batch_size:
+                commit(outfile)
+        commit(outfile)
+
+    url_index.close()
+    log(f"[✓] 전처리 완료: {count_out}개 추가 저장 ({count_in}개 중, 기존 처리 {count_seen}개) → {OUTPUT_PATH}")
 
 if __name__ == "__main__":
     main()
@@ -1,12 +1,11 @@
 import os
+import sys
 import time
-import json
 import re
+import asyncio
+import argparse
 import pytz
 from datetime import datetime
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from bs4 import BeautifulSoup
 
 # --- 경로 설정 ---
@@ -15,6 +14,17 @@ ROOT_DIR = os.path.dirname(os.path.dirname(BASE_DIR))  # automatic
 CHROMEDRIVER_PATH = os.path.join(ROOT_DIR, "chromedriver-linux", "chromedriver")
 OUTPUT_DIR = os.path.join(ROOT_DIR, "dirty", "data")  # automatic/dirty/data
 os.makedirs(OUTPUT_DIR, exist_ok=True)
+INDEX_PATH = os.path.join(ROOT_DIR, "index", "seen_urls.sqlite3")  # 크롤러/전처리/업로더 공용 URL 인덱스
+INDEX_NS = "crawl:news"
+
+sys.path.append(os.path.dirname(ROOT_DIR))  # data/ (공용 common 모듈)
+from common.fetcher import ArticleFetcher, NAVER_ARTICLE_REQUIRED
+from common.async_fetcher import AsyncFetcher, run_pipeline
+from common.url_index import UrlIndex
+from common.jsonl import dumps, iter_urls
+
+# 목록 페이지 주소 (로컬 fixture 서버로 처리량 측정 시 NAVER_LIST_URL로 교체)
+NAVER_LIST_URL = os.getenv("NAVER_LIST_URL", "https://news.naver.com/main/list.naver")
 
 # --- 날짜 설정 (오늘 날짜, 한국 시간 기준) ---
 korea = pytz.timezone("Asia/Seoul")
@@ -36,13 +46,8 @@ def log(msg):
     print(formatted)
 
 
-# --- Selenium 드라이버 설정 ---
-options = Options()
-options.add_argument("--headless")
-options.add_argument("--no-sandbox")
-options.add_argument("--disable-dev-shm-usage")
-service = Service(CHROMEDRIVER_PATH)
-driver = webdriver.Chrome(service=service, options=options)
+# --- Selenium 대체 수집기 설정 (필수 요소 누락 시에만 드라이버 실행) ---
+fetcher = ArticleFetcher(chromedriver_path=CHROMEDRIVER_PATH)
 
 # --- 영문 필터 함수 ---
 def is_english(text):
@@ -95,121 +100,167 @@ def clean_content(content_elem, press):
     return content
 
 
-# --- 저장된 URL 불러오기 (중복 방지용) ---
+# --- 저장된 URL 불러오기 (URL 인덱스 최초 생성 시에만 사용) ---
 def load_seen_links(filepath):
     if not os.path.exists(filepath):
         return set()
-    with open(filepath, "r", encoding="utf-8") as f:
-        return set(json.loads(line)["url"] for line in f if '"url":' in line)
+    return set(iter_urls(filepath))
+
+
+# --- 목록 페이지 파서: 오래된 기사부터 (페이지 내 역순) ---
+def parse_article_links(html):
+    soup = BeautifulSoup(html, "html.parser")
+    article_tags = soup.select("ul.type06_headline li dt > a") + soup.select(
+        "ul.type06 li dt > a"
+    )
+    article_links = [
+        a.get("href")
+        for a in article_tags
+        if a.get("href", "").startswith(("https://", "http://"))
+    ]
+    if not article_links:
+        log("[i] 기사 없는 목록 페이지 (건너뜀)")
+    return list(reversed(article_links))
+
+
+# --- 상세 페이지 파서: (상태, 레코드 또는 메시지) 반환 ---
+def parse_article(link, detail):
+    press_tag = detail.select_one(".media_end_head_top_logo img")
+    title_tag = detail.select_one("#title_area")
+    content_elem = detail.select_one("article#dic_area")
+
+    if not (press_tag and title_tag and content_elem):
+        return "failed", f"[!] 필수 요소 없음: {link}"
+
+    press = press_tag["alt"]
+    title_raw = title_tag.get_text(strip=True)
+    if not title_raw:
+        return "failed", f"[!] 제목 없음: {link}"
+
+    if re.match(r"^\[(포토뉴스|포토 뉴스|포토|사진)\]", title_raw):
+        return "skipped", None
+    if is_english(title_raw):
+        return "skipped", None
+
+    title = clean_title(title_raw)
+    date_tag = detail.select_one("span._ARTICLE_DATE_TIME")
+    if not date_tag or not date_tag.get("data-date-time"):
+        return "failed", f"[!] 날짜 정보 없음: {link}"
+    date_raw = date_tag.get("data-date-time")
+    dt = datetime.strptime(date_raw, "%Y-%m-%d %H:%M:%S")
+    time_fmt = dt.strftime("%H:%M")
+    content = clean_content(content_elem, press)
+    if is_english(content):
+        return "skipped", None
+
+    emails = list(set(re.findall(r"[\w\.-]+@[\w\.-]+", detail.prettify())))
+    journalist = emails if emails else []
+
+    record = {
+        "press": press,
+        "title": title,
+        "journalist": journalist,
+        "date": date_fmt,
+        "time": time_fmt,
+        "content": content,
+        "url": link,
+    }
+    return "saved", record
+
+
+# --- 상세 페이지 수집 워커: HTTP로 받고 필수 요소가 없으면 Selenium 대체 ---
+async def fetch_article(async_fetcher, link, selenium_lock):
+    try:
+        html = await async_fetcher.get_text(link)
+        detail = await asyncio.to_thread(BeautifulSoup, html, "html.parser")
+    except Exception:
+        detail = None
+
+    if detail is None or not all(detail.select_one(sel) for sel in NAVER_ARTICLE_REQUIRED):
+        # 드라이버는 하나뿐이므로 한 번에 하나씩만 사용
+        async with selenium_lock:
+            detail = await asyncio.to_thread(fetcher.fetch_selenium, link)
+
+    try:
+        return link, *parse_article(link, detail)
+    except Exception as e:
+        return link, "failed", f"[!] 예외 발생 - {link}: {e}"
 
 
 # --- 메인 크롤링 함수 ---
-def crawl_today():
-    log(f"[=] 크롤링 시작: {date_str}")
-    output_path = os.path.join(OUTPUT_DIR, f"{date_str}.jsonl")
-    seen_links = load_seen_links(output_path)
+async def crawl_today_async(output_path, workers, rate, index_path):
+    log(f"[=] 크롤링 시작: {date_str} (워커 {workers}개, 호스트당 초당 {rate}회)")
+    url_index = UrlIndex(index_path)
+    if url_index.seed(INDEX_NS, lambda: load_seen_links(output_path)):
+        log(f"[i] URL 인덱스 생성: {url_index.count(INDEX_NS)}개")
+    seen_links = url_index.view(INDEX_NS)
 
     section = "100"  # 정치면
     MAX_PAGE = 25  # 최대 페이지 수
-    saved, skipped, failed = 0, 0, 0
+    counts = {"saved": 0, "skipped": 0, "failed": 0}
+    started = time.monotonic()
 
     # 오래된 기사부터 최신 기사 순으로 (페이지 번호 역순)
+    list_urls = [
+        f"{NAVER_LIST_URL}?mode=LS2D&mid=shm&listType=paper&sid1={section}&date={date_str}&page={page}"
+        for page in range(MAX_PAGE, 0, -1)
+    ]
+    selenium_lock = asyncio.Lock()
+
     with open(output_path, "a", encoding="utf-8") as f_out:
-        for page in range(MAX_PAGE, 0, -1):
-            url = f"https://news.naver.com/main/list.naver?mode=LS2D&mid=shm&listType=paper&sid1={section}&date={date_str}&page={page}"
-            log(f"[i] 페이지 {page} 요청 중: {url}")
-            driver.get(url)
-            time.sleep(1)
-
-            soup = BeautifulSoup(driver.page_source, "html.parser")
-            article_tags = soup.select("ul.type06_headline li dt > a") + soup.select(
-                "ul.type06 li dt > a"
+        def write(result):
+            link, status, value = result
+            counts[status] += 1
+            if status == "saved":
+                f_out.write(dumps(value))
+                f_out.flush()
+                url_index.add(INDEX_NS, link)
+                log(f"[✓] 저장됨: {value['title']}")
+            elif value:
+                log(value)
+
+        async def fetch_detail(async_fetcher, link):
+            return await fetch_article(async_fetcher, link, selenium_lock)
+
+        def log_error(url, e):
+            log(f"[!] 수집 실패 - {url}: {e!r}")
+
+        async with AsyncFetcher(rate=rate, burst=workers, max_connections=workers * 2) as async_fetcher:
+            listed = await run_pipeline(
+                async_fetcher, list_urls, parse_article_links, fetch_detail, write,
+                workers=workers, seen=seen_links, on_error=log_error,
             )
-            article_links = [
-                a.get("href")
-                for a in article_tags
-                if a.get("href", "").startswith("https://")
-            ]
-
-            if not article_links:
-                log("[✓] 더 이상 기사 없음. 종료.")
-                break
-
-            for link in reversed(article_links):
-                if link in seen_links:
-                    skipped += 1
-                    continue
-                seen_links.add(link)
-
-                try:
-                    driver.get(link)
-                    time.sleep(1)
-                    detail = BeautifulSoup(driver.page_source, "html.parser")
-                    press_tag = detail.select_one(".media_end_head_top_logo img")
-                    title_tag = detail.select_one("#title_area")
-                    content_elem = detail.select_one("article#dic_area")
-
-                    if not (press_tag and title_tag and content_elem):
-                        log(f"[!] 필수 요소 없음: {link}")
-                        failed += 1
-                        continue
-
-                    press = press_tag["alt"]
-                    title_raw = title_tag.get_text(strip=True)
-                    if not title_raw:
-                        log(f"[!] 제목 없음: {link}")
-                        failed += 1
-                        continue
-
-                    if re.match(r"^\[(포토뉴스|포토 뉴스|포토|사진)\]", title_raw):
-                        skipped += 1
-                        continue
-                    if is_english(title_raw):
-                        skipped += 1
-                        continue
-
-                    title = clean_title(title_raw)
-                    date_tag = detail.select_one("span._ARTICLE_DATE_TIME")
-                    if not date_tag or not date_tag.get("data-date-time"):
-                        log(f"[!] 날짜 정보 없음: {link}")
-                        failed += 1
-                        continue
-                    date_raw = date_tag.get("data-date-time")
-                    dt = datetime.strptime(date_raw, "%Y-%m-%d %H:%M:%S")
-                    time_fmt = dt.strftime("%H:%M")
-                    content = clean_content(content_elem, press)
-                    if is_english(content):
-                        skipped += 1
-                        continue
-
-                    emails = list(
-                        set(re.findall(r"[\w\.-]+@[\w\.-]+", detail.prettify()))
-                    )
-                    journalist = emails if emails else []
-
-                    record = {
-                        "press": press,
-                        "title": title,
-                        "journalist": journalist,
-                        "date": date_fmt,
-                        "time": time_fmt,
-                        "content": content,
-                        "url": link,
-                    }
-
-                    f_out.write(json.dumps(record, ensure_ascii=False) + "\n")
-                    saved += 1
-                    log(f"[✓] 저장됨: {title}")
-
-                except Exception as e:
-                    log(f"[!] 예외 발생 - {link}: {e}")
-                    failed += 1
-                    continue
-
-    log(f"[✓] {date_str} 크롤링 완료 - 저장: {saved}개 | 중복/제외: {skipped}개 | 실패: {failed}개")
+
+    url_index.close()
+    elapsed = time.monotonic() - started
+    fetched = listed["listed"] - listed["duplicated"]
+    counts["skipped"] += listed["duplicated"]
+    counts["failed"] += listed["failed"]
+    log(
+        f"[✓] {date_str} 크롤링 완료 - 저장: {counts['saved']}개 | "
+        f"중복/제외: {counts['skipped']}개 | 실패: {counts['failed']}개 | "
+        f"목록 페이지 실패: {listed['list_failed']}개"
+    )
+    log(
+        f"[i] 소요 {elapsed:.1f}초 ({fetched / max(elapsed, 1e-9):.1f} 기사/초) | "
+        f"HTTP 요청: {async_fetcher.stats['requests']}회 | 재시도: {async_fetcher.stats['retries']}회 | "
+        f"Selenium: {fetcher.stats['selenium']}회"
+    )
+
+
+def crawl_today(output_path=None, workers=8, rate=5.0, index_path=INDEX_PATH):
+    output_path = output_path or os.path.join(OUTPUT_DIR, f"{date_str}.jsonl")
+    asyncio.run(crawl_today_async(output_path, workers, rate, index_path))
 
 
 # --- 실행 ---
 if __name__ == "__main__":
-    crawl_today()
-    driver.quit()
+    parser = argparse.ArgumentParser(description="네이버 정치 뉴스 당일 크롤링")
+    parser.add_argument("--workers", type=int, default=8, help="상세 페이지 동시 수집 워커 수")
+    parser.add_argument("--rate", type=float, default=5.0, help="호스트당 초당 최대 요청 수")
+    parser.add_argument("--output", default=None, help="저장 경로 (기본: dirty/data/YYYYMMDD.jsonl)")
+    parser.add_argument("--index", default=INDEX_PATH, help="URL 인덱스 경로 (기본: automatic/index/seen_urls.sqlite3)")
+    args = parser.parse_args()
+
+    crawl_today(args.output, args.workers, args.rate, args.index)
+    fetcher.close()
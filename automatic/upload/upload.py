@@ -1,7 +1,8 @@
 import os
-import json
+import sys
 import glob
-from pymongo import MongoClient
+from pymongo import MongoClient, UpdateOne
+from pymongo.errors import BulkWriteError, OperationFailure
 from dotenv import load_dotenv
 from datetime import datetime
 import pytz  # [추가]
@@ -12,6 +13,15 @@ today = datetime.now(korea)
 date_str = today.strftime("%Y%m%d")
 base_dir = os.path.dirname(os.path.abspath(__file__))
 
+sys.path.append(os.path.normpath(os.path.join(base_dir, "..", "..")))  # data/
+from common.url_index import UrlIndex
+from common.watermark import Watermark, read_new_lines
+from common.jsonl import loads
+
+INDEX_PATH = os.path.normpath(os.path.join(base_dir, "..", "index", "seen_urls.sqlite3"))
+INDEX_NS = "upload:news"
+STATE_DIR = os.path.join(base_dir, "state")  # ./state/<파일명>.watermark.json (파일별 업로드 위치)
+
 log_dir = os.path.join(base_dir, "log")
 os.makedirs(log_dir, exist_ok=True)
 log_path = os.path.join(log_dir, f"upload_{date_str}.log")
@@ -37,55 +47,113 @@ db = client["news_article_daily"]
 data_folder = os.path.normpath(os.path.join(base_dir, "..", "clean", "data"))
 jsonl_files = sorted(glob.glob(os.path.join(data_folder, "cleaned_20*.jsonl")))
 
-# --- 전체 중복 URL 사전 로드 ---
-log("[=] 모든 날짜에서 중복 URL 로딩 중...")
-all_urls = set()
-for collection_name in db.list_collection_names():
-    for doc in db[collection_name].find({}, {"url": 1}):
-        if "url" in doc:
-            all_urls.add(doc["url"])
-log(f"[✓] 전체 URL 개수: {len(all_urls)}개")
-
-# --- 업로드 수행 ---
+# --- 업로드된 URL 인덱스 (로컬 사전 필터, 최종 중복 판단은 DB의 url 고유 인덱스) ---
+# 날짜별 컬렉션 사이의 중복은 DB 인덱스로 막을 수 없으므로, 처음 한 번은 이미 올라간 url로 채운다.
+def load_uploaded_urls():
+    for name in db.list_collection_names():
+        for doc in db[name].find({}, {"url": 1, "_id": 0}):
+            if doc.get("url"):
+                yield doc["url"]
+
+url_index = UrlIndex(INDEX_PATH)
+if url_index.seed(INDEX_NS, load_uploaded_urls):
+    log(f"[i] URL 인덱스 생성 (DB 기준): {url_index.count(INDEX_NS)}개")
+BATCH_SIZE = 500
+
+# --- 컬렉션별 url 고유 인덱스 보장 ---
+def ensure_url_index(collection):
+    try:
+        collection.create_index("url", unique=True)
+    except OperationFailure as e:
+        # 기존 데이터에 중복 url이 있으면 고유 인덱스를 만들 수 없음 → upsert 필터로만 중복 방지
+        log(f"[!] {collection.name} url 고유 인덱스 생성 실패: {e}")
+
+# --- 배치 업로드: url 기준 upsert ($setOnInsert), 이미 있으면 건드리지 않음 ---
+def flush_batch(collection, batch):
+    if not batch:
+        return 0, 0, 0
+    requests = [UpdateOne({"url": doc["url"]}, {"$setOnInsert": doc}, upsert=True) for doc in batch]
+    failed_idx = set()
+    try:
+        result = collection.bulk_write(requests, ordered=False)
+        details = result.bulk_api_result
+    except BulkWriteError as e:
+        details = e.details
+        for err in details.get("writeErrors", []):
+            if err.get("code") != 11000:  # 중복 키는 건너뛴 것으로 처리
+                failed_idx.add(err["index"])
+                log(f"[!] 업로드 오류: {err.get('errmsg')}")
+
+    inserted = details.get("nUpserted", 0)
+    failed = len(failed_idx)
+    skipped = len(batch) - inserted - failed
+    url_index.add_many(INDEX_NS, [doc["url"] for i, doc in enumerate(batch) if i not in failed_idx])
+    return inserted, skipped, failed
+
+# --- 업로드 수행: 파일별 워터마크 이후 새로 추가된 줄만 ---
 total_inserted = 0
 total_skipped = 0
 
 for file_path in jsonl_files:
     filename = os.path.basename(file_path)
+    watermark = Watermark(os.path.join(STATE_DIR, f"{filename}.watermark.json"))
+    start = watermark.resume_offset(file_path)
+    if start == os.path.getsize(file_path):
+        continue  # 지난 실행 이후 추가된 줄 없음
+
     date_str = filename.replace("cleaned_", "").replace(".jsonl", "")
     collection = db[date_str]
+    ensure_url_index(collection)
 
     inserted_count = 0
     skipped_count = 0
-
-    with open(file_path, "r", encoding="utf-8") as f:
-        for i, line in enumerate(f, start=1):
-            try:
-                doc = json.loads(line.strip())
-                url = doc.get("url", "")
-                if not url:
-                    continue
-                if url in all_urls:
-                    skipped_count += 1
-                    continue
-
-                for field in ["press", "title", "journalist", "date", "time", "content", "url"]:
-                    if field not in doc:
-                        doc[field] = ""
-
-                collection.insert_one(doc)
-                all_urls.add(url)
-                inserted_count += 1
-
-            except json.JSONDecodeError:
-                log(f"[!] JSON 파싱 오류 (라인 {i}) - {filename}")
-                continue
-            except Exception as e:
-                log(f"[!] 업로드 오류: {e}")
-                continue
+    failed_count = 0
+    batch = []
+    offset = end = start
+
+    for line, end in read_new_lines(file_path, start):
+        try:
+            doc = loads(line)
+        except ValueError:
+            log(f"[!] JSON 파싱 오류 (byte {end - len(line.encode('utf-8'))}) - {filename}")
+            continue
+        url = doc.get("url", "")
+        if not url:
+            continue
+        if url_index.contains(INDEX_NS, url):
+            skipped_count += 1
+            continue
+
+        for field in ["press", "title", "journalist", "date", "time", "content", "url"]:
+            if field not in doc:
+                doc[field] = ""
+
+        batch.append(doc)
+        if len(batch) >= BATCH_SIZE:
+            inserted, skipped, failed = flush_batch(collection, batch)
+            inserted_count += inserted
+            skipped_count += skipped
+            failed_count += failed
+            batch = []
+            if failed:
+                # 실패한 문서가 다음 실행에서 다시 시도되도록 워터마크를 옮기지 않음
+                break
+            offset = end
+            watermark.save(file_path, offset)
+
+    if not failed_count:
+        inserted, skipped, failed = flush_batch(collection, batch)
+        inserted_count += inserted
+        skipped_count += skipped
+        failed_count += failed
+        if not failed:
+            offset = end
+            watermark.save(file_path, offset)
 
     total_inserted += inserted_count
     total_skipped += skipped_count
-    log(f"[•] {filename} → 저장: {inserted_count}건, 중복 제외: {skipped_count}건")
+    log(f"[•] {filename} → 저장: {inserted_count}건, 중복 제외: {skipped_count}건, 실패: {failed_count}건 "
+        f"(offset {start} → {offset})")
 
+url_index.close()
 log(f"[✓] 총 업로드 완료: {total_inserted}건 (중복 제외된 기사: {total_skipped}건)")
@@ -0,0 +1,264 @@
+import io
+import os
+import re
+import sys
+import json
+import argparse
+from datetime import datetime
+
+import zstandard
+
+from common.jsonl import loads, dumpb, iter_jsonl, warn_decode_error
+
+DEFAULT_ROOT = os.getenv("RAW_ARCHIVE_DIR", os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "archive")))
+SEGMENT_RECORDS = 50_000
+BUFFER_RECORDS = 200_000  # 모든 파티션 버퍼를 합친 상한 (넘으면 버퍼 전체를 세그먼트로 기록)
+ZSTD_LEVEL = 10
+UNKNOWN_DATE = "00000000"
+
+
+# --- 원본(크롤링) 데이터 아카이브: 날짜별 파티션 + zstd 압축 JSONL 세그먼트 ---
+# <root>/<source>/manifest.json
+# <root>/<source>/<YYYYMMDD>/part-00000.jsonl.zst, part-00001.jsonl.zst, ...
+# 세그먼트는 한 번 쓰면 바꾸지 않고(추가 전용), 새 레코드는 새 세그먼트로 쓴 뒤 manifest를 원자적으로 교체한다.
+# manifest: {"source": ..., "partitions": {"YYYYMMDD": [{"file", "records", "bytes", "raw_bytes", "created"}, ...]}}
+
+
+def partition_key(record, field="date"):
+    """레코드 날짜 필드에서 YYYYMMDD 추출 (2025-06-01, 2025.06.01, 20250601 10:00 등). 없으면 00000000"""
+    digits = re.sub(r"\D", "", str(record.get(field) or ""))
+    return digits[:8] if len(digits) >= 8 else UNKNOWN_DATE
+
+
+def load_manifest(source_dir):
+    path = os.path.join(source_dir, "manifest.json")
+    if not os.path.exists(path):
+        return {"source": os.path.basename(source_dir), "partitions": {}}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_manifest(source_dir, manifest):
+    path = os.path.join(source_dir, "manifest.json")
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1)
+    os.replace(tmp_path, path)
+
+
+# --- 쓰기: 파티션별로 모았다가 segment_records마다(또는 flush/close 시) 세그먼트 하나씩 기록 ---
+# 여러 파티션에 흩어진 입력(월 단위 누적 파일 등)으로 메모리가 커지지 않도록, 버퍼 전체가 buffer_records를 넘으면 모두 기록한다.
+# 한 source에는 한 번에 하나의 writer만 쓴다고 가정한다.
+# replace=True: 이번에 기록하는 파티션의 기존 세그먼트를 새 세그먼트로 교체 (같은 기간/누적 파일을 다시 적재할 때).
+#   새 세그먼트를 모두 쓴 뒤 flush에서 manifest를 한 번에 교체하고, 그다음에 기존 파일을 지운다.
+#   중간에 중단되면 manifest는 기존 세그먼트를 그대로 가리키고, 새 파일만 참조 없이 남는다.
+class ArchiveWriter:
+    def __init__(self, source, root=DEFAULT_ROOT, date_field="date",
+                 segment_records=SEGMENT_RECORDS, level=ZSTD_LEVEL, replace=False,
+                 buffer_records=BUFFER_RECORDS):
+        self.source_dir = os.path.join(root, source)
+        os.makedirs(self.source_dir, exist_ok=True)
+        self.manifest = load_manifest(self.source_dir)
+        self.date_field = date_field
+        self.segment_records = segment_records
+        self.buffer_records = buffer_records
+        self.compressor = zstandard.ZstdCompressor(level=level)
+        self.replace = replace
+        self.replaced = set()  # 이번 writer에서 기존 세그먼트를 교체한 파티션
+        self.obsolete = []  # manifest 교체 후 지울 기존 세그먼트 파일
+        self.buffers = {}
+        self.buffered = 0
+        self.count = 0
+
+    def write(self, record, key=None):
+        """key(YYYYMMDD)를 주면 날짜 필드 대신 그 파티션에 기록"""
+        key = key or partition_key(record, self.date_field)
+        lines = self.buffers.setdefault(key, [])
+        lines.append(dumpb(record))
+        self.buffered += 1
+        self.count += 1
+        if len(lines) >= self.segment_records:
+            self._write_segment(key)
+        elif self.buffered >= self.buffer_records:
+            self._write_buffers()
+        else:
+            return
+        if not self.replace:
+            save_manifest(self.source_dir, self.manifest)
+
+    def write_many(self, records):
+        for record in records:
+            self.write(record)
+
+    def _write_segment(self, key):
+        lines = self.buffers.pop(key, None)
+        if not lines:
+            return
+        self.buffered -= len(lines)
+        segments = self.manifest["partitions"].setdefault(key, [])
+        if self.replace and key not in self.replaced:
+            self.obsolete.extend(s["file"] for s in segments)
+            segments.clear()
+            self.replaced.add(key)
+
+        # 아직 지우지 않은 기존 파일과 겹치지 않는 다음 번호
+        number = 0
+        while True:
+            name = f"{key}/part-{number:05d}.jsonl.zst"
+            path = os.path.join(self.source_dir, name)
+            if name not in self.obsolete and not any(s["file"] == name for s in segments) \
+                    and not os.path.exists(path):
+                break
+            number += 1
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        raw = b"".join(lines)
+        data = self.compressor.compress(raw)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+        segments.append({
+            "file": name,
+            "records": len(lines),
+            "bytes": len(data),
+            "raw_bytes": len(raw),
+            "created": datetime.now().isoformat(timespec="seconds"),
+        })
+
+    def _write_buffers(self):
+        for key in sorted(self.buffers):
+            self._write_segment(key)
+
+    def flush(self):
+        self._write_buffers()
+        save_manifest(self.source_dir, self.manifest)
+        for name in self.obsolete:
+            path = os.path.join(self.source_dir, name)
+            if os.path.exists(path):
+                os.remove(path)
+        self.obsolete = []
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+# --- 읽기 ---
+def iter_segment(path, on_error=warn_decode_error):
+    """zstd 세그먼트 하나를 레코드 단위로 (압축을 풀면서 스트리밍)"""
+    with open(path, "rb") as f:
+        reader = io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(f))
+        for line_no, line in enumerate(reader, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield loads(line)
+            except ValueError as e:
+                if on_error is not None:
+                    on_error(path, line_no, line, e)
+
+
+def segments(source, root=DEFAULT_ROOT, start=None, end=None):
+    """[start, end] 날짜(YYYYMMDD 또는 YYYYMM 앞부분) 범위의 세그먼트 경로를 날짜, 기록 순서대로"""
+    source_dir = os.path.join(root, source)
+    manifest = load_manifest(source_dir)
+    for key in sorted(manifest["partitions"]):
+        if start and key[:len(start)] < start:
+            continue
+        if end and key[:len(end)] > end:
+            continue
+        for segment in manifest["partitions"][key]:
+            yield os.path.join(source_dir, segment["file"])
+
+
+def iter_archive(source, root=DEFAULT_ROOT, start=None, end=None, on_error=warn_decode_error):
+    """여러 파티션을 이어서 하나의 레코드 스트림으로"""
+    for path in segments(source, root, start, end):
+        yield from iter_segment(path, on_error)
+
+
+def iter_records(spec, on_error=warn_decode_error):
+    """archive:<source>[:start[:end]] 또는 .jsonl.zst 세그먼트 (일반 JSONL은 common.jsonl.iter_jsonl)"""
+    if spec.startswith("archive:"):
+        source, _, period = spec[len("archive:"):].partition(":")
+        start, _, end = period.partition(":")
+        return iter_archive(source, start=start or None, end=end or start or None, on_error=on_error)
+    return iter_segment(spec, on_error)
+
+
+def stats(source, root=DEFAULT_ROOT):
+    manifest = load_manifest(os.path.join(root, source))
+    parts = manifest["partitions"]
+    all_segments = [s for key in parts for s in parts[key]]
+    raw = sum(s["raw_bytes"] for s in all_segments)
+    compressed = sum(s["bytes"] for s in all_segments)
+    return {
+        "source": source,
+        "partitions": len(parts),
+        "segments": len(all_segments),
+        "records": sum(s["records"] for s in all_segments),
+        "raw_bytes": raw,
+        "bytes": compressed,
+        "ratio": round(raw / compressed, 2) if compressed else 0,
+        "first": min(parts) if parts else None,
+        "last": max(parts) if parts else None,
+    }
+
+
+# 실행 예 (data/ 에서):
+#   python -m common.archive import news news_crawler/dirty/data/merged_2024*.jsonl
+#   python -m common.archive import minjoo automatic/a_dirty/data/minjoo_all.jsonl
+#   python -m common.archive stat news
+#   python -m common.archive export news --start 202403 --end 202403 -o merged_202403.jsonl
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="날짜별 zstd JSONL 원본 아카이브")
+    parser.add_argument("--root", default=DEFAULT_ROOT, help="아카이브 폴더 (기본: data/archive, RAW_ARCHIVE_DIR)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_import = sub.add_parser("import", help="JSONL 파일을 아카이브에 적재 (기록하는 날짜 파티션은 교체)")
+    p_import.add_argument("source", help="소스 이름 (news, editorial, minjoo 등)")
+    p_import.add_argument("files", nargs="+")
+    p_import.add_argument("--date-field", default="date")
+    p_import.add_argument("--segment-records", type=int, default=SEGMENT_RECORDS)
+    p_import.add_argument("--level", type=int, default=ZSTD_LEVEL, help="zstd 압축 레벨")
+    p_import.add_argument("--append", action="store_true",
+                          help="기존 파티션을 교체하지 않고 세그먼트 추가 (이미 적재한 레코드가 없는 파일만)")
+
+    p_stat = sub.add_parser("stat", help="파티션 / 세그먼트 / 압축률 요약")
+    p_stat.add_argument("source")
+
+    p_export = sub.add_parser("export", help="기간의 레코드를 JSONL로 풀어 쓰기 (기존 스크립트 입력용)")
+    p_export.add_argument("source")
+    p_export.add_argument("--start", help="YYYYMM 또는 YYYYMMDD")
+    p_export.add_argument("--end", help="YYYYMM 또는 YYYYMMDD")
+    p_export.add_argument("-o", "--output", help="출력 파일 (생략하면 표준 출력)")
+    args = parser.parse_args()
+
+    if args.command == "import":
+        with ArchiveWriter(args.source, args.root, args.date_field, args.segment_records, args.level,
+                           replace=not args.append) as writer:
+            for path in args.files:
+                before = writer.count
+                writer.write_many(iter_jsonl(path))
+                writer.flush()  # 입력 파일마다 확정 (여러 파일을 한 번에 적재해도 메모리에 쌓지 않음)
+                print(f"[✓] {path}: {writer.count - before}건")
+        print(json.dumps(stats(args.source, args.root), ensure_ascii=False))
+    elif args.command == "stat":
+        print(json.dumps(stats(args.source, args.root), ensure_ascii=False, indent=2))
+    elif args.command == "export":
+        out = open(args.output, "wb") if args.output else sys.stdout.buffer
+        count = 0
+        for record in iter_archive(args.source, args.root, args.start, args.end):
+            out.write(dumpb(record))
+            count += 1
+        if args.output:
+            out.close()
+            print(f"[✓] {count}건 → {args.output}")
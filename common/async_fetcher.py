@@ -0,0 +1,170 @@
+import time
+import random
+import asyncio
+from urllib.parse import urlparse
+
+import aiohttp
+
+from common.fetcher import DEFAULT_HEADERS
+
+# 재시도 대상 HTTP 상태 코드
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+# --- 호스트별 토큰 버킷 (초당 rate개, 최대 burst개까지 몰아서 허용) ---
+class TokenBucket:
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class HostRateLimiter:
+    def __init__(self, rate=5.0, burst=5):
+        self.rate = rate
+        self.burst = burst
+        self.buckets = {}
+
+    async def acquire(self, url):
+        host = urlparse(url).netloc
+        if host not in self.buckets:
+            self.buckets[host] = TokenBucket(self.rate, self.burst)
+        await self.buckets[host].acquire()
+
+
+class RetryableStatus(Exception):
+    pass
+
+
+# --- 커넥션 풀 + 호스트별 속도 제한 + 지수 백오프(지터) 비동기 수집기 ---
+class AsyncFetcher:
+    def __init__(self, rate=5.0, burst=5, max_connections=20, timeout=10, retries=3, backoff=0.5):
+        self.limiter = HostRateLimiter(rate, burst)
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.session = None
+        self.stats = {"requests": 0, "retries": 0, "failed": 0}
+
+    async def __aenter__(self):
+        connector = aiohttp.TCPConnector(limit=self.max_connections)
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            headers=DEFAULT_HEADERS,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+        )
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.session.close()
+
+    async def get_text(self, url):
+        for attempt in range(self.retries + 1):
+            await self.limiter.acquire(url)
+            self.stats["requests"] += 1
+            try:
+                async with self.session.get(url) as resp:
+                    if resp.status in RETRY_STATUS:
+                        raise RetryableStatus(f"HTTP {resp.status}")
+                    resp.raise_for_status()
+                    return await resp.text(encoding=resp.charset or "utf-8")
+            except (aiohttp.ClientError, asyncio.TimeoutError, RetryableStatus):
+                if attempt == self.retries:
+                    self.stats["failed"] += 1
+                    raise
+                self.stats["retries"] += 1
+                delay = self.backoff * (2 ** attempt)
+                await asyncio.sleep(delay * random.uniform(0.5, 1.5))
+
+
+# --- 순서 보장 기록기: 번호 순서대로만 write 호출 ---
+class OrderedWriter:
+    def __init__(self, write):
+        self.write = write
+        self.pending = {}
+        self.next_seq = 0
+
+    def put(self, seq, result):
+        self.pending[seq] = result
+        while self.next_seq in self.pending:
+            result = self.pending.pop(self.next_seq)
+            if result is not None:
+                self.write(result)
+            self.next_seq += 1
+
+
+# --- 목록 → 큐 → 상세 워커 → 순서 보장 기록 파이프라인 ---
+# list_urls: 오래된 순서의 목록 페이지 URL
+# parse_list(html) -> 오래된 순서의 상세 URL 리스트 (빈 리스트면 목록 종료)
+# fetch_detail(fetcher, link) -> 기록할 결과 (None이면 건너뜀)
+# on_error(url, e): 목록/상세 페이지 수집 중 예외 (개수는 반환값의 list_failed / failed)
+def print_error(url, e):
+    print(f"[!] 수집 실패 - {url}: {e!r}")
+
+
+async def run_pipeline(fetcher, list_urls, parse_list, fetch_detail, write,
+                       workers=8, queue_size=100, seen=None, on_error=print_error):
+    queue = asyncio.Queue(maxsize=queue_size)
+    writer = OrderedWriter(write)
+    seen = seen if seen is not None else set()
+    counts = {"listed": 0, "duplicated": 0, "list_failed": 0, "failed": 0}
+
+    async def produce():
+        seq = 0
+        # 목록 페이지는 동시에 요청하되 처리는 주어진 순서대로
+        pages = [asyncio.ensure_future(fetcher.get_text(url)) for url in list_urls]
+        try:
+            for url, page in zip(list_urls, pages):
+                try:
+                    html = await page
+                except Exception as e:
+                    counts["list_failed"] += 1
+                    on_error(url, e)
+                    continue
+                links = parse_list(html)
+                if not links:
+                    break
+                for link in links:
+                    counts["listed"] += 1
+                    if link in seen:
+                        counts["duplicated"] += 1
+                        continue
+                    seen.add(link)
+                    await queue.put((seq, link))
+                    seq += 1
+        finally:
+            for page in pages:
+                page.cancel()
+            for _ in range(workers):
+                await queue.put(None)
+
+    async def consume():
+        while True:
+            item = await queue.get()
+            if item is None:
+                break
+            seq, link = item
+            try:
+                result = await fetch_detail(fetcher, link)
+            except Exception as e:
+                counts["failed"] += 1
+                on_error(link, e)
+                result = None
+            writer.put(seq, result)
+
+    await asyncio.gather(produce(), *(consume() for _ in range(workers)))
+    return counts
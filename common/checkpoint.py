@@ -0,0 +1,124 @@
+import os
+import json
+
+from common.jsonl import dumps
+
+
+# --- 크롤링 체크포인트 (append-only JSONL) ---
+# 기록 형식
+#   {"start": url}                 상세 페이지 수집 시작 (in-flight)
+#   {"done": url, "offset": n}     상세 페이지 처리 완료, 출력 파일은 n 바이트까지 확정
+#   {"unit": key, "offset": n}     (날짜, 페이지) 등 작업 단위 완료
+#   {"base": true, "offset": n}    체크포인트 없이 시작했을 때 기존 출력 파일 크기
+# 재시작 시 출력 파일을 마지막 확정 offset으로 잘라 중복/깨진 줄을 없애고,
+# 완료된 단위와 URL은 다시 요청하지 않는다.
+class CrawlCheckpoint:
+    def __init__(self, path):
+        self.path = path
+        self.units = set()
+        self.done_urls = set()
+        self.in_flight = set()
+        self.offset = 0
+        self.existed = os.path.exists(path)
+        self._load()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._file = open(path, "a", encoding="utf-8")
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    event = json.loads(line)
+                except json.JSONDecodeError:
+                    # 기록 도중 중단된 마지막 줄
+                    continue
+                if "start" in event:
+                    self.in_flight.add(event["start"])
+                elif "done" in event:
+                    self.in_flight.discard(event["done"])
+                    self.done_urls.add(event["done"])
+                elif "unit" in event:
+                    self.units.add(event["unit"])
+                if "offset" in event:
+                    self.offset = event["offset"]
+
+    def _write(self, event):
+        self._file.write(json.dumps(event, ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    def restore_output(self, output_path):
+        size = os.path.getsize(output_path) if os.path.exists(output_path) else 0
+        if not self.existed:
+            # 체크포인트 도입 이전 출력은 그대로 두고 현재 크기부터 기록
+            self.offset = size
+            self._write({"base": True, "offset": size})
+            return
+        if size < self.offset:
+            # 출력 파일이 사라졌거나 줄어든 경우: 체크포인트를 믿을 수 없으므로 처음부터
+            print(f"[!] 체크포인트보다 출력 파일이 짧음 → 초기화: {self.path}")
+            self.reset()
+            self.restore_output(output_path)
+            return
+        if size > self.offset:
+            with open(output_path, "r+b") as f:
+                f.truncate(self.offset)
+
+    def reset(self):
+        self.units.clear()
+        self.done_urls.clear()
+        self.in_flight.clear()
+        self.offset = 0
+        self._file.close()
+        self._file = open(self.path, "w", encoding="utf-8")
+        self.existed = False
+
+    def is_unit_done(self, unit):
+        return unit in self.units
+
+    def is_url_done(self, url):
+        return url in self.done_urls
+
+    def start_url(self, url):
+        self.in_flight.add(url)
+        self._write({"start": url})
+
+    def finish_url(self, url, offset):
+        self.in_flight.discard(url)
+        self.done_urls.add(url)
+        self.offset = offset
+        self._write({"done": url, "offset": offset})
+
+    # --- 상세 페이지 하나 수집: 완료 기록 확인 → 시작 기록 → 수집/저장 → 완료 기록 ---
+    # fetch_record(url)가 레코드를 돌려주면 저장 후 완료로 기록하고, None이면(의도적 제외) 저장 없이 완료로 기록한다.
+    # 예외가 나면 완료로 기록하지 않으므로 다음 실행에서 다시 요청한다 (일시적 오류로 기사를 잃지 않음).
+    # 반환: 이미 완료했거나 처리에 성공하면 True, 실패하면 False (실패가 있는 작업 단위는 완료로 기록하지 말 것)
+    def crawl_url(self, url, out, fetch_record, on_error=None):
+        if self.is_url_done(url):
+            return True
+        self.start_url(url)
+        try:
+            record = fetch_record(url)
+        except Exception as e:
+            if on_error is not None:
+                on_error(url, e)
+            return False
+        if record:
+            out.write(dumps(record))
+        out.flush()
+        self.finish_url(url, out.tell())
+        return True
+
+    def finish_unit(self, unit, offset):
+        self.units.add(unit)
+        self.offset = offset
+        self._write({"unit": unit, "offset": offset})
+
+    def close(self):
+        self._file.close()
+
+    def remove(self):
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
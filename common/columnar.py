@@ -0,0 +1,391 @@
+import os
+import re
+import json
+import glob
+import argparse
+from datetime import date, timedelta
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from common.jsonl import iter_jsonl
+
+DATA_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), ".."))  # data/
+DEFAULT_ROOT = os.getenv("COLUMNAR_DIR", os.path.join(DATA_DIR, "columnar"))
+BATCH_ROWS = 50_000
+ROW_GROUP_ROWS = 100_000
+UNKNOWN_MONTH = "000000"
+
+
+# --- 전처리/요약 결과 JSONL → 분석용 Parquet 데이터셋 ---
+# <root>/<stage>/source=<news|editorial|party>/month=<YYYYMM>/<입력 파일 이름>.parquet
+# stage: cleaned (전처리 결과), summarized (요약 결과)
+# 월은 파일 이름이 아니라 레코드의 date로 정한다 (정당 논평처럼 여러 달이 한 파일에 누적된 경우).
+# 입력 파일 하나가 월마다 파일 하나를 만들므로, 같은 입력을 다시 내보내면 해당 파일만 교체된다.
+# press / party / spokesperson은 값 종류가 적어 사전(dictionary) 인코딩으로 저장한다.
+
+DICT = pa.dictionary(pa.int32(), pa.string())
+SCHEMA = pa.schema([
+    ("press", DICT),
+    ("party", DICT),
+    ("spokesperson", DICT),
+    ("title", pa.string()),
+    ("journalist", pa.list_(pa.string())),
+    ("date", pa.date32()),
+    ("time", pa.string()),
+    ("content", pa.string()),
+    ("url", pa.string()),
+])
+SUMMARY_SCHEMA = SCHEMA.append(pa.field("summary", pa.string()))
+PARTITIONING = ds.partitioning(pa.schema([("source", pa.string()), ("month", pa.string())]), flavor="hive")
+
+# stage → [(source, 입력 glob)] (export에 파일을 주지 않으면 전부)
+INPUTS = {
+    "cleaned": [
+        ("news", os.path.join(DATA_DIR, "news_crawler", "clean", "data", "cleaned_*.jsonl")),
+        ("news", os.path.join(DATA_DIR, "automatic", "clean", "data", "cleaned_*.jsonl")),
+        ("editorial", os.path.join(DATA_DIR, "opinion", "clean", "output", "editorial_*_cleaned.jsonl")),
+        ("editorial", os.path.join(DATA_DIR, "automatic", "b_clean", "data", "*.jsonl")),
+        ("party", os.path.join(DATA_DIR, "automatic", "a_clean", "data", "*_all_cleaned.jsonl")),
+    ],
+    "summarized": [
+        ("news", os.path.join(DATA_DIR, "summary", "output", "summarized_[0-9]*.jsonl")),
+        ("editorial", os.path.join(DATA_DIR, "summary", "output", "summarized_opinion_*.jsonl")),
+        ("party", os.path.join(DATA_DIR, "summary", "output", "summarized_party_*.jsonl")),
+        ("news", os.path.join(DATA_DIR, "summary", "output", "daily", "summarized_news_*.jsonl")),
+        ("editorial", os.path.join(DATA_DIR, "summary", "output", "daily", "summarized_editorial_*.jsonl")),
+    ],
+}
+
+
+def infer_source(path):
+    """파일 이름으로 (stage, source) 추정 (모르면 None)"""
+    name = os.path.basename(path)
+    if name.startswith("summarized_"):
+        rest = name[len("summarized_"):]
+        if rest.startswith(("opinion_", "editorial_")):
+            return "summarized", "editorial"
+        if rest.startswith("party_"):
+            return "summarized", "party"
+        return "summarized", "news"
+    if name.endswith("_all_cleaned.jsonl"):
+        return "cleaned", "party"
+    if name.startswith("editorial_"):
+        return "cleaned", "editorial"
+    if name.startswith("cleaned_"):
+        return "cleaned", "news"
+    return None
+
+
+# ===== 쓰기 =====
+def parse_date(value):
+    """2025-06-01, 2025.06.01, 20250601 10:00 등 → date (없거나 잘못되면 None)"""
+    digits = re.sub(r"\D", "", str(value or ""))
+    if len(digits) < 8:
+        return None
+    try:
+        return date(int(digits[:4]), int(digits[4:6]), int(digits[6:8]))
+    except ValueError:
+        return None
+
+
+def to_columns(records, schema):
+    columns = {name: [] for name in schema.names}
+    for record in records:
+        for name in schema.names:
+            value = record.get(name)
+            if name == "date":
+                value = parse_date(value)
+            elif name == "journalist":
+                value = [value] if isinstance(value, str) else [str(v) for v in value or []]
+            elif value is not None and not isinstance(value, str):
+                value = str(value)
+            columns[name].append(value)
+    return pa.table(columns, schema=schema)
+
+
+class _MonthWriters:
+    # 월별 ParquetWriter (임시 파일에 row group을 이어 쓰고, 끝나면 한꺼번에 교체)
+    def __init__(self, dataset_dir, source, name, schema):
+        self.dataset_dir = dataset_dir
+        self.source = source
+        self.name = name
+        self.schema = schema
+        self.writers = {}
+
+    def path(self, month):
+        return os.path.join(self.dataset_dir, f"source={self.source}", f"month={month}", f"{self.name}.parquet")
+
+    def tmp_path(self, month):
+        # '.'으로 시작하는 임시 파일은 쓰는 도중에 데이터셋을 읽어도 보이지 않음
+        path = self.path(month)
+        return os.path.join(os.path.dirname(path), f".{os.path.basename(path)}.tmp")
+
+    def write(self, month, table):
+        if month not in self.writers:
+            os.makedirs(os.path.dirname(self.path(month)), exist_ok=True)
+            self.writers[month] = pq.ParquetWriter(
+                self.tmp_path(month), self.schema, compression="zstd",
+                use_dictionary=["press", "party", "spokesperson"],
+            )
+        self.writers[month].write_table(table, row_group_size=ROW_GROUP_ROWS)
+
+    def commit(self):
+        for month, writer in self.writers.items():
+            writer.close()
+            os.replace(self.tmp_path(month), self.path(month))
+        return sorted(self.writers)
+
+    def abort(self):
+        for month, writer in self.writers.items():
+            writer.close()
+            os.remove(self.tmp_path(month))
+
+
+def write_batch(writers, records, schema):
+    # 월별로 나눈 뒤 날짜 순으로 정렬해서 기록 (row group의 date 통계가 좁아져 기간 필터가 잘 걸림)
+    by_month = {}
+    for record in records:
+        d = parse_date(record.get("date"))
+        by_month.setdefault(d.strftime("%Y%m") if d else UNKNOWN_MONTH, []).append(record)
+    for month, rows in by_month.items():
+        writers.write(month, to_columns(rows, schema).sort_by("date"))
+
+
+def output_name(path):
+    name = os.path.basename(path)
+    return name[:-len(".jsonl")] if name.endswith(".jsonl") else name
+
+
+def export_file(path, stage, source, root=DEFAULT_ROOT, batch_rows=BATCH_ROWS):
+    """JSONL 파일 하나를 내보내고 (레코드 수, 월 목록) 반환"""
+    schema = SUMMARY_SCHEMA if stage == "summarized" else SCHEMA
+    writers = _MonthWriters(os.path.join(root, stage), source, output_name(path), schema)
+    count = 0
+    batch = []
+    try:
+        for record in iter_jsonl(path):
+            if not isinstance(record, dict):
+                continue
+            batch.append(record)
+            if len(batch) >= batch_rows:
+                write_batch(writers, batch, schema)
+                count += len(batch)
+                batch = []
+        if batch:
+            write_batch(writers, batch, schema)
+            count += len(batch)
+    except BaseException:
+        writers.abort()
+        raise
+    return count, writers.commit()
+
+
+# 내보낸 입력 파일별 기록: {"signature": [크기, 수정 시각], "source": ..., "months": [...]}
+# 바뀐 파일만 다시 내보내고, 이번에 나오지 않은 월의 이전 출력 파일은 지운다.
+# '_'로 시작하는 파일은 pyarrow 데이터셋 탐색에서 제외된다.
+def load_exported(dataset_dir):
+    path = os.path.join(dataset_dir, "_exported.json")
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_exported(dataset_dir, exported):
+    os.makedirs(dataset_dir, exist_ok=True)
+    path = os.path.join(dataset_dir, "_exported.json")
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(exported, f, ensure_ascii=False, indent=1)
+    os.replace(path + ".tmp", path)
+
+
+def export(jobs, root=DEFAULT_ROOT, force=False):
+    """jobs: [(입력 경로, stage, source)]"""
+    total = 0
+    exported = {}
+    for path, stage, source in jobs:
+        dataset_dir = os.path.join(root, stage)
+        if dataset_dir not in exported:
+            exported[dataset_dir] = load_exported(dataset_dir)
+        stat = os.stat(path)
+        signature = [stat.st_size, stat.st_mtime_ns]
+        key = os.path.abspath(path)
+        previous = exported[dataset_dir].get(key)
+        if not isinstance(previous, dict):
+            previous = {}  # 이전 형식([크기, 수정 시각])이면 다시 내보냄
+        if not force and previous.get("signature") == signature and previous.get("source") == source:
+            print(f"[✓] {path} 변경 없음, 건너뜀")
+            continue
+
+        count, months = export_file(path, stage, source, root)
+        removed = remove_stale(dataset_dir, output_name(path), previous, source, months)
+        exported[dataset_dir][key] = {"signature": signature, "source": source, "months": months}
+        save_exported(dataset_dir, exported[dataset_dir])
+        total += count
+        print(f"[✓] {path} → {stage}/source={source} ({count}건, {len(months)}개월"
+              + (f", 이전 출력 {removed}개 삭제)" if removed else ")"))
+    return total
+
+
+def remove_stale(dataset_dir, name, previous, source, months):
+    """이전 내보내기에서 만들었지만 이번에는 나오지 않은 (source, 월) 파일 삭제"""
+    removed = 0
+    old_source = previous.get("source", source)
+    for month in previous.get("months", []):
+        if old_source == source and month in months:
+            continue
+        path = os.path.join(dataset_dir, f"source={old_source}", f"month={month}", f"{name}.parquet")
+        if os.path.exists(path):
+            os.remove(path)
+            removed += 1
+    return removed
+
+
+def default_jobs(stages):
+    jobs = []
+    for stage in stages:
+        for source, pattern in INPUTS[stage]:
+            jobs.extend((path, stage, source) for path in sorted(glob.glob(pattern)))
+    return jobs
+
+
+# ===== 읽기: 필요한 열만, date / source 조건은 파티션·row group 통계로 먼저 걸러냄 =====
+def month_bounds(start=None, end=None):
+    """YYYYMM / YYYYMMDD / YYYY-MM-DD 범위 → (시작 날짜, 끝 날짜) (YYYYMM이면 그 달 전체)
+
+    형식이 맞지 않으면(예: 2024, 20241301) 조건을 빼지 않고 ValueError
+    """
+    def bound(value, last):
+        digits = re.sub(r"\D", "", str(value))
+        try:
+            if len(digits) == 6:
+                first = date(int(digits[:4]), int(digits[4:]), 1)
+                if not last:
+                    return first
+                return (first.replace(day=28) + timedelta(days=4)).replace(day=1) - timedelta(days=1)
+            if len(digits) == 8:
+                return date(int(digits[:4]), int(digits[4:6]), int(digits[6:]))
+        except ValueError:
+            pass
+        raise ValueError(f"날짜 범위 형식 오류: {value!r} (YYYYMM, YYYYMMDD, YYYY-MM-DD)")
+    return (bound(start, False) if start else None), (bound(end, True) if end else None)
+
+
+def build_filter(source=None, start=None, end=None, **equals):
+    """source는 이름 하나 또는 목록, start/end는 날짜 범위 (양 끝 포함), 나머지는 열 == 값 조건"""
+    start_date, end_date = month_bounds(start, end)
+    conditions = []
+    if source:
+        sources = [source] if isinstance(source, str) else list(source)
+        conditions.append(ds.field("source").isin(sources))
+    # month 파티션 조건으로 폴더 단위 제외, date 조건으로 row group 단위 제외
+    if start_date:
+        conditions.append(ds.field("month") >= start_date.strftime("%Y%m"))
+        conditions.append(ds.field("date") >= start_date)
+    if end_date:
+        conditions.append(ds.field("month") <= end_date.strftime("%Y%m"))
+        conditions.append(ds.field("date") <= end_date)
+    for name, value in equals.items():
+        conditions.append(ds.field(name) == value)
+    expression = None
+    for condition in conditions:
+        expression = condition if expression is None else expression & condition
+    return expression
+
+
+def open_dataset(stage="cleaned", root=DEFAULT_ROOT):
+    schema = SUMMARY_SCHEMA if stage == "summarized" else SCHEMA
+    return ds.dataset(
+        os.path.join(root, stage), format="parquet", partitioning=PARTITIONING,
+        schema=schema.append(pa.field("source", pa.string())).append(pa.field("month", pa.string())),
+    )
+
+
+def scanner(stage="cleaned", columns=None, source=None, start=None, end=None, root=DEFAULT_ROOT, **equals):
+    return open_dataset(stage, root).scanner(columns=columns, filter=build_filter(source, start, end, **equals))
+
+
+def read_table(stage="cleaned", columns=None, source=None, start=None, end=None, root=DEFAULT_ROOT, **equals):
+    """조건에 맞는 행의 지정 열을 pyarrow.Table로
+
+    read_table("cleaned", ["press", "date"], source="news", start="202403", end="202405")
+    read_table("summarized", ["title", "summary"], source="party", party="국민의힘")
+    """
+    return scanner(stage, columns, source, start, end, root, **equals).to_table()
+
+
+def iter_batches(stage="cleaned", columns=None, source=None, start=None, end=None, root=DEFAULT_ROOT, **equals):
+    """read_table과 같은 조건을 RecordBatch 단위로 (전체를 메모리에 올리지 않음)"""
+    yield from scanner(stage, columns, source, start, end, root, **equals).to_batches()
+
+
+def value_counts(column, stage="cleaned", source=None, start=None, end=None, root=DEFAULT_ROOT):
+    """한 열의 값별 건수 (열 하나만 읽음) → [(값, 건수)] 많은 순"""
+    table = read_table(stage, [column], source, start, end, root)
+    counts = table.column(column).combine_chunks()
+    if pa.types.is_dictionary(counts.type):
+        counts = counts.dictionary_decode()
+    pairs = [(row["values"], row["counts"]) for row in counts.value_counts().to_pylist()]
+    return sorted(pairs, key=lambda pair: -pair[1])
+
+
+# 실행 예 (data/ 에서):
+#   python -m common.columnar export                         # 전처리 / 요약 결과 전체 (바뀐 파일만)
+#   python -m common.columnar export --stage summarized summary/output/summarized_202403.jsonl
+#   python -m common.columnar scan cleaned --columns press date --source news --start 202403 --end 202403
+#   python -m common.columnar count cleaned press --source news
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="전처리 / 요약 결과의 Parquet 내보내기 및 조회")
+    parser.add_argument("--root", default=DEFAULT_ROOT, help="데이터셋 폴더 (기본: data/columnar, COLUMNAR_DIR)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_export = sub.add_parser("export", help="JSONL → Parquet (파일을 주지 않으면 알려진 출력 전체)")
+    p_export.add_argument("files", nargs="*")
+    p_export.add_argument("--stage", choices=INPUTS.keys(), help="파일을 줄 때 stage (기본: 파일 이름으로 추정)")
+    p_export.add_argument("--source", help="파일을 줄 때 source (기본: 파일 이름으로 추정)")
+    p_export.add_argument("--force", action="store_true", help="변경 없는 파일도 다시 내보냄")
+
+    p_scan = sub.add_parser("scan", help="조건에 맞는 행 수와 앞부분 출력")
+    p_scan.add_argument("stage", choices=INPUTS.keys())
+    p_scan.add_argument("--columns", nargs="+")
+    p_scan.add_argument("--source")
+    p_scan.add_argument("--start", help="YYYYMM 또는 YYYYMMDD")
+    p_scan.add_argument("--end", help="YYYYMM 또는 YYYYMMDD")
+    p_scan.add_argument("-n", type=int, default=5, help="출력할 행 수")
+
+    p_count = sub.add_parser("count", help="한 열의 값별 건수")
+    p_count.add_argument("stage", choices=INPUTS.keys())
+    p_count.add_argument("column")
+    p_count.add_argument("--source")
+    p_count.add_argument("--start")
+    p_count.add_argument("--end")
+    args = parser.parse_args()
+    if args.command in ("scan", "count"):
+        try:
+            month_bounds(args.start, args.end)
+        except ValueError as e:
+            parser.error(str(e))
+
+    if args.command == "export":
+        if args.files:
+            jobs = []
+            for path in args.files:
+                stage, source = infer_source(path) or (None, None)
+                stage, source = args.stage or stage, args.source or source
+                if not (stage and source):
+                    raise SystemExit(f"[ERROR] {path}: --stage / --source를 지정하세요.")
+                jobs.append((path, stage, source))
+        else:
+            jobs = default_jobs(INPUTS.keys())
+        total = export(jobs, args.root, args.force)
+        print(f"[✓] 내보내기 완료. (총 {total}건)")
+    elif args.command == "scan":
+        table = read_table(args.stage, args.columns, args.source, args.start, args.end, args.root)
+        print(f"[i] {table.num_rows}행")
+        for row in table.slice(0, args.n).to_pylist():
+            print(json.dumps(row, ensure_ascii=False, default=str))
+    elif args.command == "count":
+        for value, n in value_counts(args.column, args.stage, args.source, args.start, args.end, args.root):
+            print(f"{n:>10}  {value}")
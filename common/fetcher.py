@@ -0,0 +1,103 @@
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup
+
+# --- 기본 요청 헤더 (일반 브라우저와 동일하게) ---
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
+}
+
+# --- 네이버 기사 상세 페이지 필수 요소 (서버 렌더링 영역) ---
+NAVER_ARTICLE_REQUIRED = (
+    ".media_end_head_top_logo img",
+    "#title_area",
+    "article#dic_area",
+    "span._ARTICLE_DATE_TIME",
+)
+
+
+# --- HTTP 우선, 필요 시 Selenium으로 대체하는 페이지 수집기 ---
+class ArticleFetcher:
+    def __init__(self, chromedriver_path=None, use_selenium=True, pool_size=10,
+                 timeout=10, retries=2, selenium_wait=1):
+        # keep-alive 커넥션 풀을 재사용하는 세션
+        self.session = requests.Session()
+        retry = Retry(
+            total=retries,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=("GET",),
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update(DEFAULT_HEADERS)
+
+        self.timeout = timeout
+        self.chromedriver_path = chromedriver_path
+        self.use_selenium = use_selenium
+        self.selenium_wait = selenium_wait
+        self._driver = None
+        self.stats = {"http": 0, "selenium": 0, "failed": 0}
+
+    # 크롬 드라이버는 처음 필요할 때만 띄운다
+    @property
+    def driver(self):
+        if self._driver is None:
+            from selenium import webdriver
+            from selenium.webdriver.chrome.options import Options
+            from selenium.webdriver.chrome.service import Service
+
+            options = Options()
+            options.add_argument("--headless")
+            options.add_argument("--no-sandbox")
+            options.add_argument("--disable-dev-shm-usage")
+            if self.chromedriver_path:
+                self._driver = webdriver.Chrome(service=Service(self.chromedriver_path), options=options)
+            else:
+                self._driver = webdriver.Chrome(options=options)
+        return self._driver
+
+    def get_html(self, url):
+        resp = self.session.get(url, timeout=self.timeout)
+        resp.raise_for_status()
+        # charset 헤더가 없으면 requests가 ISO-8859-1로 추정하므로 UTF-8로 고정
+        if not resp.encoding or resp.encoding.lower() == "iso-8859-1":
+            resp.encoding = "utf-8"
+        return resp.text
+
+    def fetch(self, url, required=()):
+        soup = None
+        try:
+            soup = BeautifulSoup(self.get_html(url), "html.parser")
+            if all(soup.select_one(selector) for selector in required):
+                self.stats["http"] += 1
+                return soup
+        except requests.RequestException:
+            soup = None
+
+        # 필수 요소가 없거나 요청이 실패한 경우에만 Selenium 사용
+        if not self.use_selenium:
+            if soup is None:
+                self.stats["failed"] += 1
+            return soup
+        return self.fetch_selenium(url)
+
+    def fetch_selenium(self, url):
+        self.driver.get(url)
+        time.sleep(self.selenium_wait)
+        self.stats["selenium"] += 1
+        return BeautifulSoup(self.driver.page_source, "html.parser")
+
+    def close(self):
+        self.session.close()
+        if self._driver is not None:
+            self._driver.quit()
+            self._driver = None
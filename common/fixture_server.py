@@ -0,0 +1,81 @@
+import time
+import argparse
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+# 네이버 목록/기사 페이지를 흉내 내는 로컬 테스트 서버
+# 사용 예:
+#   python3 -m common.fixture_server --port 8765 --pages 5 --per-page 20 --latency 0.2
+#   NAVER_LIST_URL=http://127.0.0.1:8765/main/list.naver \
+#       python3 automatic/dirty/py/crawl_today_hourly.py --workers 16 --rate 100 --output /tmp/bench.jsonl
+
+LIST_TEMPLATE = """<html><body><div class="list_body">
+<ul class="type06_headline">{items}</ul>
+</div></body></html>"""
+
+ITEM_TEMPLATE = '<li><dl><dt><a href="{href}">기사 {no}</a></dt></dl></li>'
+
+ARTICLE_TEMPLATE = """<html><body>
+<div class="media_end_head_top_logo"><img alt="테스트일보"></div>
+<h2 id="title_area"><span>국회 본회의 법안 처리 {no}</span></h2>
+<span class="_ARTICLE_DATE_TIME" data-date-time="2025-06-18 {hh:02d}:{mm:02d}:00"></span>
+<article id="dic_area">
+여야가 본회의에서 법안 {no}건을 처리했다.<br>
+정부는 후속 조치를 신속히 마련하겠다고 밝혔다.<br>
+홍길동 기자 test{no}@example.com
+</article>
+</body></html>"""
+
+
+def make_handler(pages, per_page, latency):
+    class FixtureHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive
+
+        def _send(self, status, body):
+            data = body.encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            time.sleep(latency)
+            parsed = urlparse(self.path)
+            host = f"http://{self.headers.get('Host')}"
+
+            if parsed.path == "/main/list.naver":
+                # 네이버처럼 마지막 페이지를 넘으면 마지막 페이지를 다시 보여 준다
+                page = min(int(parse_qs(parsed.query).get("page", ["1"])[0]), pages)
+                if page < 1:
+                    return self._send(200, LIST_TEMPLATE.format(items=""))
+                items = "".join(
+                    ITEM_TEMPLATE.format(href=f"{host}/article/{page}/{i}", no=(page - 1) * per_page + i)
+                    for i in range(per_page)
+                )
+                return self._send(200, LIST_TEMPLATE.format(items=items))
+
+            if parsed.path.startswith("/article/"):
+                _, _, page, i = parsed.path.split("/")
+                no = (int(page) - 1) * per_page + int(i)
+                return self._send(200, ARTICLE_TEMPLATE.format(no=no, hh=no // 60 % 24, mm=no % 60))
+
+            self._send(404, "not found")
+
+        def log_message(self, *args):
+            pass
+
+    return FixtureHandler
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="크롤러 처리량 측정용 로컬 fixture 서버")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--pages", type=int, default=5, help="기사가 있는 목록 페이지 수")
+    parser.add_argument("--per-page", type=int, default=20, help="목록 페이지당 기사 수")
+    parser.add_argument("--latency", type=float, default=0.2, help="응답 지연(초)")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), make_handler(args.pages, args.per_page, args.latency))
+    print(f"[INFO] fixture 서버 실행: http://127.0.0.1:{args.port}/main/list.naver")
+    server.serve_forever()
@@ -0,0 +1,112 @@
+import json
+
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json으로 동작 (출력 형식만 다르고 내용은 같음)
+    orjson = None
+
+WRITE_BATCH = 1000
+
+
+# --- 한 줄 디코드 / 인코드 ---
+# orjson이 거부하는 입력(NaN 리터럴, 64비트를 넘는 정수, 문자열이 아닌 키 등)은 표준 json으로 다시 시도한다.
+# 깨진 UTF-8 bytes도 UnicodeDecodeError 대신 json.JSONDecodeError로 알린다 (호출부는 JSONDecodeError만 잡음).
+def loads(data):
+    """str 또는 bytes 한 줄을 파싱 (실패 시 json.JSONDecodeError)"""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    try:
+        return json.loads(data)
+    except UnicodeDecodeError as e:
+        raise json.JSONDecodeError(f"UTF-8 디코딩 실패: {e.reason}", "", e.start) from None
+
+
+def dumpb(record):
+    """레코드 → 개행 포함 UTF-8 bytes 한 줄"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+        except orjson.JSONEncodeError:
+            pass
+    return (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def dumps(record):
+    """레코드 → 개행 포함 str 한 줄 (텍스트 모드 파일용)"""
+    return dumpb(record).decode("utf-8")
+
+
+def warn_decode_error(path, line_no, line, error):
+    print(f"[경고] JSON 파싱 실패 ({path} 라인 {line_no}): {error}")
+
+
+# --- 스트리밍 읽기: 한 줄씩 레코드 반환, 깨진 줄은 줄 번호와 함께 보고하고 건너뜀 ---
+# path가 zstd 세그먼트(*.jsonl.zst)나 "archive:<source>[:시작[:끝]]"이면 원본 아카이브(common/archive.py)에서 읽는다.
+def iter_jsonl(path, on_error=warn_decode_error):
+    if path.startswith("archive:") or path.endswith(".zst"):
+        from common.archive import iter_records  # zstandard는 아카이브를 읽을 때만 필요
+        yield from iter_records(path, on_error)
+        return
+    with open(path, "rb") as f:
+        for line_no, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield loads(line)
+            except ValueError as e:
+                if on_error is not None:
+                    on_error(path, line_no, line, e)
+
+
+def iter_urls(path):
+    """JSONL 파일의 url 값만 (이미 처리한 URL 집합 만들기용)"""
+    for record in iter_jsonl(path, on_error=None):
+        url = record.get("url") if isinstance(record, dict) else None
+        if url:
+            yield url
+
+
+# --- 묶음 쓰기: 인코드한 줄을 모아 batch_size마다 한 번에 기록 ---
+class JsonlWriter:
+    def __init__(self, path, mode="w", batch_size=WRITE_BATCH):
+        self.path = path
+        self.file = open(path, mode + "b")
+        self.batch_size = batch_size
+        self.buffer = []
+        self.count = 0
+
+    def write(self, record):
+        self.buffer.append(dumpb(record))
+        self.count += 1
+        if len(self.buffer) >= self.batch_size:
+            self._write_buffer()
+
+    def write_many(self, records):
+        for record in records:
+            self.write(record)
+
+    def _write_buffer(self):
+        if self.buffer:
+            self.file.write(b"".join(self.buffer))
+            self.buffer = []
+
+    def flush(self):
+        self._write_buffer()
+        self.file.flush()
+
+    def fileno(self):
+        return self.file.fileno()
+
+    def close(self):
+        if not self.file.closed:
+            self.flush()
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,88 @@
+import unicodedata
+
+
+# --- 문자 단위 필터를 str.translate 테이블로 ---
+# 문자마다 남길지/바꿀지를 판정하는 함수(keep)를 처음 본 문자에 대해서만 호출하고 결과를 저장한다.
+# 이후 같은 문자는 translate가 C 수준에서 바로 찾으므로, 전처리 결과는 기존 문자 단위 루프와 완전히 같다.
+class CharTable(dict):
+    def __init__(self, keep, replacements=None):
+        super().__init__()
+        self.keep = keep
+        self.replacements = replacements or {}
+
+    def __missing__(self, code):
+        ch = chr(code)
+        # 치환 후 남길 문자만 이어 붙임 (치환 결과가 다시 치환 대상이 되는 경우는 없음)
+        out = "".join(c for c in self.replacements.get(ch, ch) if self.keep(c))
+        value = code if out == ch else (out or None)
+        self[code] = value
+        return value
+
+
+# ===== 뉴스 (automatic/clean, news_crawler/clean) =====
+INVISIBLE_CHARS = {
+    '\u00A0', '\u2000', '\u2001', '\u2002', '\u2003', '\u2004',
+    '\u2005', '\u2006', '\u2007', '\u2008', '\u2009', '\u200A',
+    '\u202F', '\u205F', '\u3000',  # 넓은 공백 계열
+    '\u200B', '\u200C', '\u200D', '\u2060', '\uFEFF'  # 제로폭 문자
+}
+NEWS_KEEP_SYMBOLS = set(".:,?!'()")
+
+
+def _visible(ch):
+    return ch not in INVISIBLE_CHARS and unicodedata.category(ch) != 'Cf'
+
+
+def _news_keep(ch):
+    return _visible(ch) and (
+        ch.isalnum() or ch.isspace() or ch in NEWS_KEEP_SYMBOLS or
+        '가' <= ch <= '힣' or 'ㄱ' <= ch <= 'ㅎ' or 'ㅏ' <= ch <= 'ㅣ'
+    )
+
+
+# ===== 사설 (automatic/b_clean, opinion/clean) =====
+EDITORIAL_REPLACEMENTS = {
+    '‘': "'", '’': "'", '“': '', '”': '',
+    '…': '...', '–': '-', '—': '-',
+    '·': '', '″': '', '′': "'",
+    '\u00A0': ' ',  # non-breaking space
+}
+EDITORIAL_ALLOWED_SPECIALS = ".,?!()':%"
+
+
+def _editorial_keep(ch):
+    return ch.isalnum() or ch in EDITORIAL_ALLOWED_SPECIALS or '\u4E00' <= ch <= '\u9FFF' or ch.isspace()
+
+
+# ===== 정당 논평 (automatic/a_clean) =====
+# re의 [^\w\s...]와 같은 판정: \w = isalnum() 또는 '_', \s = isspace()
+PARTY_PROBLEMATIC_UNICODE = set('\u200B\uFEFF\u00A0\uFFFD')
+PARTY_ALLOWED_SYMBOLS = set(".?!'\"")
+
+
+def _party_keep(ch):
+    return ch not in PARTY_PROBLEMATIC_UNICODE and (
+        ch.isalnum() or ch == '_' or ch.isspace() or ch in PARTY_ALLOWED_SYMBOLS or '가' <= ch <= '힣'
+    )
+
+
+INVISIBLE_TABLE = CharTable(_visible)
+NEWS_TABLE = CharTable(_news_keep)
+EDITORIAL_TABLE = CharTable(_editorial_keep, EDITORIAL_REPLACEMENTS)
+PARTY_TABLE = CharTable(_party_keep)
+
+
+def remove_invisible_spaces(text):
+    return text.translate(INVISIBLE_TABLE)
+
+
+def clean_news_text(text):
+    return text.translate(NEWS_TABLE)
+
+
+def clean_editorial_text(text):
+    return text.translate(EDITORIAL_TABLE).strip()
+
+
+def clean_party_text(text):
+    return text.translate(PARTY_TABLE).strip()
@@ -0,0 +1,83 @@
+import os
+import sqlite3
+from urllib.parse import urlsplit, urlunsplit
+
+
+# --- URL 정규화: 앞뒤 공백, scheme/host 대소문자, #fragment 차이를 무시 ---
+def normalize_url(url):
+    parts = urlsplit(url.strip())
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, parts.query, ""))
+
+
+# --- 단계별(네임스페이스) 처리 완료 URL 인덱스 (SQLite) ---
+# 네임스페이스 예: "crawl:news", "clean:news", "upload:news", "crawl:minjoo"
+# 기존 JSONL 전체를 매번 다시 읽는 대신, 처음 한 번만 seed 하고 이후에는 추가만 한다.
+class UrlIndex:
+    def __init__(self, path, check_same_thread=True):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        # 여러 스레드에서 쓸 때는 check_same_thread=False (sqlite3 기본 빌드는 직렬화 모드)
+        self.conn = sqlite3.connect(path, timeout=30, check_same_thread=check_same_thread)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS urls ("
+            "ns TEXT NOT NULL, url TEXT NOT NULL, PRIMARY KEY (ns, url)"
+            ") WITHOUT ROWID"
+        )
+        self.conn.execute("CREATE TABLE IF NOT EXISTS seeded (ns TEXT PRIMARY KEY)")
+        self.conn.commit()
+
+    def contains(self, ns, url):
+        row = self.conn.execute(
+            "SELECT 1 FROM urls WHERE ns = ? AND url = ?", (ns, normalize_url(url))
+        ).fetchone()
+        return row is not None
+
+    def add(self, ns, url):
+        self.conn.execute("INSERT OR IGNORE INTO urls (ns, url) VALUES (?, ?)", (ns, normalize_url(url)))
+        self.conn.commit()
+
+    def add_many(self, ns, urls):
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO urls (ns, url) VALUES (?, ?)",
+            ((ns, normalize_url(url)) for url in urls if url),
+        )
+        self.conn.commit()
+
+    def count(self, ns):
+        return self.conn.execute("SELECT COUNT(*) FROM urls WHERE ns = ?", (ns,)).fetchone()[0]
+
+    def is_seeded(self, ns):
+        return self.conn.execute("SELECT 1 FROM seeded WHERE ns = ?", (ns,)).fetchone() is not None
+
+    # 네임스페이스를 처음 쓸 때 한 번만 기존 데이터로 채운다 (load_urls는 URL iterable을 반환하는 함수)
+    def seed(self, ns, load_urls):
+        if self.is_seeded(ns):
+            return False
+        self.add_many(ns, load_urls())
+        self.conn.execute("INSERT OR IGNORE INTO seeded (ns) VALUES (?)", (ns,))
+        self.conn.commit()
+        return True
+
+    def view(self, ns):
+        return UrlIndexView(self, ns)
+
+    def close(self):
+        self.conn.close()
+
+
+# --- `in` / add 를 지원하는 집합 형태 뷰 ---
+# add는 이번 실행 메모리에만 기록하고, 영구 기록은 UrlIndex.add로 따로 한다
+# (저장에 실패한 URL은 다음 실행에서 다시 시도되도록).
+class UrlIndexView:
+    def __init__(self, index, ns):
+        self.index = index
+        self.ns = ns
+        self.local = set()
+
+    def __contains__(self, url):
+        return normalize_url(url) in self.local or self.index.contains(self.ns, url)
+
+    def add(self, url):
+        self.local.add(normalize_url(url))
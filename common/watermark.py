@@ -0,0 +1,92 @@
+import os
+import json
+import hashlib
+
+FINGERPRINT_WINDOW = 4096
+
+
+# --- 파일 지문: 앞부분 + offset 직전 구간의 해시 ---
+# 입력 파일이 새로 만들어지거나(앞부분 변경) 처리한 구간이 바뀌면(offset 직전 변경) 달라진다.
+def file_fingerprint(path, offset, window=FINGERPRINT_WINDOW):
+    with open(path, "rb") as f:
+        head = f.read(min(window, offset))
+        tail_start = max(0, offset - window)
+        f.seek(tail_start)
+        tail = f.read(offset - tail_start)
+    return hashlib.sha1(head + b"|" + tail).hexdigest()
+
+
+# --- 추가 전용 입력 파일에서 offset 이후의 완성된 줄만 읽기 ---
+# (줄, 해당 줄 끝의 byte offset)을 반환. 개행 없이 끝나는 마지막 줄은 기록 중인 것으로 보고 다음 실행으로 넘긴다.
+def read_new_lines(path, offset):
+    with open(path, "rb") as f:
+        f.seek(offset)
+        for raw in f:
+            if not raw.endswith(b"\n"):
+                break
+            offset += len(raw)
+            yield raw.decode("utf-8"), offset
+
+
+# --- 입력 처리 위치 워터마크 (JSON) ---
+# 기록 형식: {"offset": n, "fingerprint": "...", ...단계별 추가 정보}
+# 저장은 임시 파일 + os.replace로 원자적으로 한다.
+class Watermark:
+    def __init__(self, path):
+        self.path = path
+        self.state = {}
+        if os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    self.state = json.load(f)
+            except (OSError, ValueError):
+                print(f"[!] 워터마크 파일 손상 → 처음부터: {path}")
+                self.state = {}
+
+    def get(self, key, default=None):
+        return self.state.get(key, default)
+
+    # 이어서 읽을 입력 offset (입력 파일이 바뀌었으면 0)
+    def resume_offset(self, input_path):
+        offset = self.state.get("offset", 0)
+        if not offset or not os.path.exists(input_path):
+            return 0
+        if os.path.getsize(input_path) < offset:
+            print(f"[!] 입력 파일이 워터마크보다 짧음 → 처음부터: {input_path}")
+            return 0
+        if file_fingerprint(input_path, offset) != self.state.get("fingerprint"):
+            print(f"[!] 입력 파일 지문 불일치 → 처음부터: {input_path}")
+            return 0
+        return offset
+
+    # 증분 출력용: 입력 offset을 돌려주고, 출력 파일을 마지막 확정 크기로 자른다.
+    # 0을 반환하면 출력 파일을 새로 써야 한다 (full 모드, 첫 실행, 입력/출력 불일치).
+    def resume(self, input_path, output_path, full=False):
+        if full:
+            return 0
+        offset = self.resume_offset(input_path)
+        if not offset:
+            return 0
+        output_offset = self.state.get("output_offset", 0)
+        size = os.path.getsize(output_path) if os.path.exists(output_path) else -1
+        if size < output_offset:
+            print(f"[!] 출력 파일이 워터마크보다 짧음 → 처음부터: {output_path}")
+            return 0
+        if size > output_offset:
+            # 워터마크 저장 전에 중단된 실행이 덧붙인 줄 제거
+            with open(output_path, "r+b") as f:
+                f.truncate(output_offset)
+        return offset
+
+    def save(self, input_path, offset, **extra):
+        self.state = {"offset": offset, "fingerprint": file_fingerprint(input_path, offset), **extra}
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.state, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def clear(self):
+        self.state = {}
+        if os.path.exists(self.path):
+            os.remove(self.path)
@@ -0,0 +1,181 @@
+import os
+import sys
+import json
+import glob
+import fnmatch
+import shutil
+import argparse
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+sys.path.append(os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..")))  # data/
+from common.jsonl import loads, JsonlWriter
+from news_rules import process_record
+
+# --- 설정 ---
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_INPUT_DIR = os.path.normpath(os.path.join(BASE_DIR, "..", "..", "dirty", "data"))
+DEFAULT_OUTPUT_DIR = os.path.normpath(os.path.join(BASE_DIR, "..", "data"))
+SHARD_SIZE_MB = 32
+
+
+# --- 입력 파일을 줄 경계에 맞춘 byte 구간으로 분할 ---
+def shard_ranges(path, shard_size):
+    size = os.path.getsize(path)
+    bounds = [0]
+    with open(path, "rb") as f:
+        while bounds[-1] + shard_size < size:
+            f.seek(bounds[-1] + shard_size)
+            f.readline()  # 다음 줄의 시작으로 이동
+            if f.tell() >= size:
+                break
+            bounds.append(f.tell())
+    bounds.append(size)
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+# --- 워커: [start, end) 구간의 줄을 전처리해 shard 파일로 저장 ---
+def clean_shard(input_path, start, end, shard_path):
+    read, written, failed = 0, 0, 0
+    with open(input_path, "rb") as infile, JsonlWriter(shard_path) as outfile:
+        infile.seek(start)
+        offset = start
+        while offset < end:
+            raw = infile.readline()
+            if not raw:
+                break
+            line_offset = offset
+            offset += len(raw)
+            read += 1
+            try:
+                cleaned = process_record(loads(raw))
+                if cleaned:
+                    outfile.write(cleaned)
+                    written += 1
+            except json.JSONDecodeError as e:
+                failed += 1
+                print(f"[경고] JSON 파싱 실패 ({os.path.basename(input_path)} byte {line_offset}): {e}")
+    return read, written, failed
+
+
+# --- 워커(--archive): zstd 세그먼트 하나를 shard 하나로 (세그먼트가 이미 적당한 크기로 나뉘어 있음) ---
+def clean_segment(segment_path, shard_path):
+    from common.archive import iter_segment  # zstandard는 --archive 사용 시에만 필요
+    read, written, failed = 0, 0, 0
+
+    def on_error(path, line_no, line, e):
+        nonlocal failed
+        failed += 1
+        print(f"[경고] JSON 파싱 실패 ({path} 라인 {line_no}): {e}")
+
+    with JsonlWriter(shard_path) as outfile:
+        for record in iter_segment(segment_path, on_error):
+            read += 1
+            cleaned = process_record(record)
+            if cleaned:
+                outfile.write(cleaned)
+                written += 1
+    return read + failed, written, failed
+
+
+# --- 월별 병합: shard 출력을 원래 순서대로 이어 붙임 ---
+def merge_shards(shard_paths, output_path):
+    tmp_path = output_path + ".tmp"
+    with open(tmp_path, "wb") as f_out:
+        for shard_path in shard_paths:
+            with open(shard_path, "rb") as f_in:
+                shutil.copyfileobj(f_in, f_out)
+    os.replace(tmp_path, output_path)
+    for shard_path in shard_paths:
+        os.remove(shard_path)
+
+
+def find_months(patterns, input_dir):
+    # 패턴 예: 202403, 2024*, 2025[0-5]*
+    months = {}
+    for pattern in patterns:
+        for path in glob.glob(os.path.join(input_dir, f"merged_{pattern}.jsonl")):
+            month = os.path.basename(path)[len("merged_"):-len(".jsonl")]
+            months[month] = path
+    return dict(sorted(months.items()))
+
+
+def find_archive_months(patterns, source):
+    # 아카이브 manifest의 날짜 파티션을 월별 세그먼트 목록으로 (날짜 순)
+    from common.archive import load_manifest, DEFAULT_ROOT
+    source_dir = os.path.join(DEFAULT_ROOT, source)
+    partitions = load_manifest(source_dir)["partitions"]
+    months = defaultdict(list)
+    for day in sorted(partitions):
+        if any(fnmatch.fnmatch(day[:6], pattern) for pattern in patterns):
+            months[day[:6]].extend(os.path.join(source_dir, s["file"]) for s in partitions[day])
+    return dict(months)
+
+
+def clean_months(patterns, workers, shard_size_mb, input_dir, output_dir, archive=None):
+    months = find_archive_months(patterns, archive) if archive else find_months(patterns, input_dir)
+    if not months:
+        where = f"archive:{archive}" if archive else f"{input_dir}/merged_{{{','.join(patterns)}}}.jsonl"
+        print(f"[!] 입력 없음: {where}")
+        return
+
+    shard_dir = os.path.join(output_dir, "shards")
+    os.makedirs(shard_dir, exist_ok=True)
+
+    # 모든 월의 shard를 한 작업 목록으로 (큰 달이 끝날 때까지 다른 코어가 놀지 않도록)
+    jobs = []
+    shards = {}
+    for month, source in months.items():
+        if archive:
+            # 아카이브는 세그먼트 하나가 작업 하나
+            shards[month] = [os.path.join(shard_dir, f"{month}_{i:05d}.jsonl") for i in range(len(source))]
+            jobs.extend((month, clean_segment, (segment, shard_path))
+                        for segment, shard_path in zip(source, shards[month]))
+            continue
+        ranges = shard_ranges(source, int(shard_size_mb * 1024 * 1024))
+        shards[month] = [os.path.join(shard_dir, f"{month}_{i:05d}.jsonl") for i in range(len(ranges))]
+        jobs.extend((month, clean_shard, (source, start, end, shard_path))
+                    for (start, end), shard_path in zip(ranges, shards[month]))
+    remaining = {month: len(paths) for month, paths in shards.items()}
+    counts = defaultdict(lambda: [0, 0, 0])
+    failed_months = set()
+
+    print(f"[=] 전처리 시작: {len(months)}개월, shard {len(jobs)}개, 워커 {workers}개")
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(fn, *fn_args): month for month, fn, fn_args in jobs}
+        for future in as_completed(futures):
+            month = futures[future]
+            try:
+                for i, n in enumerate(future.result()):
+                    counts[month][i] += n
+            except Exception as e:
+                failed_months.add(month)
+                print(f"[!] {month} shard 처리 실패: {e}")
+
+            # 해당 월의 모든 shard가 끝나면 바로 병합
+            remaining[month] -= 1
+            if remaining[month] == 0:
+                if month in failed_months:
+                    print(f"[!] {month} 실패한 shard가 있어 병합하지 않음 (기존 출력 유지)")
+                    continue
+                output_path = os.path.join(output_dir, f"cleaned_{month}.jsonl")
+                merge_shards(shards[month], output_path)
+                read, written, failed = counts[month]
+                print(f"[✓] {month} 전처리 완료: {output_path} ({read}줄 → {written}건, 파싱 실패 {failed}줄)")
+
+    total = sum(c[1] for c in counts.values())
+    print(f"[✓] 전체 전처리 완료. ({len(months) - len(failed_months)}/{len(months)}개월, 총 {total}건)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="월별 merged 파일 병렬 전처리 (줄 경계 shard + 프로세스 풀)")
+    parser.add_argument("months", nargs="+", help="월 또는 glob 패턴 (예: 202403, 2024*, '*')")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="동시 실행 워커(프로세스) 수")
+    parser.add_argument("--shard-size", type=float, default=SHARD_SIZE_MB, help="shard 크기 (MB)")
+    parser.add_argument("--input-dir", default=DEFAULT_INPUT_DIR, help="merged_YYYYMM.jsonl 폴더")
+    parser.add_argument("--output-dir", default=DEFAULT_OUTPUT_DIR, help="cleaned_YYYYMM.jsonl 저장 폴더")
+    parser.add_argument("--archive", metavar="SOURCE",
+                        help="merged 파일 대신 원본 아카이브(data/archive/SOURCE)의 월별 파티션을 입력으로 (예: news)")
+    args = parser.parse_args()
+
+    clean_months(args.months, args.workers, args.shard_size, args.input_dir, args.output_dir, args.archive)
@@ -0,0 +1,61 @@
+# ===========================
+# 뉴스 전처리 규칙 (월별 스크립트 YYYYMM.py와 병렬 실행기 clean_months.py가 함께 사용)
+# ===========================
+import os
+import re
+import sys
+
+sys.path.append(os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..")))  # data/
+# 문자 필터 (invisible 공백 / 허용 문자): common/text_filter.py
+from common.text_filter import clean_news_text as clean_text
+
+# 제거 패턴들
+EMAIL_REGEX = re.compile(r"\S+@\S+\.\S+")
+NEWS_AGENCY_REGEX = re.compile(r"[가-힣]{2,10}(일보|뉴스)")
+STRICT_REPORTER_REGEX = re.compile(r"^[가-힣]{2,4}(·[가-힣]{2,4})*\s?기자$")
+SHORT_KOREAN_NAME_REGEX = re.compile(r"^[가-힣]{2,4}$")
+QA_PATTERN = re.compile(r"\b(Q:|A:)\b", re.IGNORECASE)
+
+
+def remove_end_info(text):
+    lines = text.strip().splitlines()
+    cleaned = []
+    for line in lines:
+        stripped = line.strip()
+        if not stripped:
+            continue
+        if (
+            EMAIL_REGEX.search(stripped) or
+            NEWS_AGENCY_REGEX.search(stripped) or
+            STRICT_REPORTER_REGEX.fullmatch(stripped) or
+            (SHORT_KOREAN_NAME_REGEX.fullmatch(stripped) and len(stripped) <= 4)
+        ):
+            continue
+        if stripped.endswith("기자") and len(stripped) < 25:
+            continue
+        cleaned.append(stripped)
+    return '\n'.join(cleaned).strip()
+
+
+def process_record(record):
+    content = record.get("content", "")
+    if QA_PATTERN.search(content):
+        return None
+
+    if record.get("press") == "국제신문" and content.lstrip().startswith("-"):
+        first_line_end = content.find('\n')
+        if first_line_end != -1:
+            content = content[first_line_end+1:].lstrip()
+        else:
+            return None
+
+    record["title"] = clean_text(record["title"])
+
+    content = clean_text(content)
+    content = remove_end_info(content)
+
+    if not content.strip():
+        return None
+
+    record["content"] = content
+    return record
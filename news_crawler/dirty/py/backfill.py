@@ -0,0 +1,324 @@
+import os
+import sys
+import re
+import argparse
+from multiprocessing.util import Finalize
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..")))  # data/
+from common.fetcher import ArticleFetcher, NAVER_ARTICLE_REQUIRED
+from common.checkpoint import CrawlCheckpoint
+from common.jsonl import iter_jsonl
+
+# --- 설정 ---
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_OUTPUT_DIR = os.path.normpath(os.path.join(BASE_DIR, "..", "data"))
+section = "100"
+MAX_PAGE = 25
+
+# 목록 페이지 주소 (로컬 fixture 서버로 처리량 측정 시 NAVER_LIST_URL로 교체)
+NAVER_LIST_URL = os.getenv("NAVER_LIST_URL", "https://news.naver.com/main/list.naver")
+
+# 워커 프로세스마다 하나씩 생성되는 수집기
+fetcher = None
+backend = "http"
+
+
+# --- 유틸 함수 ---
+def is_english(text):
+    return re.fullmatch(r'[A-Za-z0-9\s\W]+', text or '')
+
+def clean_title(title):
+    return re.sub(r'[\[【].+?[\]】]', '', title).strip()
+
+def clean_content(content_elem, press):
+    for tag in content_elem.select(
+        'script, style, .ad_area, em.img_desc, span.end_photo_org, '
+        'strong.media_end_summary, table, '
+        'div.ab_sub_heading, div.ab_sub_headingline, div.ab_box_article, '
+        'div[style*="border-left"], span[style*="border-left"], b'
+    ):
+        tag.decompose()
+
+    raw_text = content_elem.get_text(separator="\n", strip=True)
+    lines = raw_text.splitlines()
+
+    clean_lines = []
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        if re.match(r"^[\[\(【●◆■▶△#]", line):
+            continue
+        if line.startswith('#'):
+            continue
+        if any(suffix in line for suffix in ["기자", "@", "편집국종합"]) and re.search(r'\b기자\b|\b@\b', line):
+            continue
+        if re.search(r"\b기자\b.*@", line):
+            continue
+        if line.startswith("그림:"):
+            continue
+        clean_lines.append(line)
+
+    content = " ".join(clean_lines)
+    content = re.sub(r"\s+", " ", content).strip()
+
+    if press == "이데일리":
+        content = re.sub(r'^\[이데일리\s.*?기자\]\s*', '', content)
+
+    return content
+
+
+# --- 상세 페이지 → 레코드 (제외 대상이면 None) ---
+def parse_article(link, detail):
+    press_tag = detail.select_one('.media_end_head_top_logo img')
+    title_tag = detail.select_one('#title_area')
+    content_elem = detail.select_one('article#dic_area')
+
+    if not (press_tag and title_tag and content_elem):
+        print(f"[!] 필수 요소 없음: {link}")
+        return None
+
+    press = press_tag['alt']
+    title_raw = title_tag.get_text(strip=True)
+
+    if re.match(r'^\[(포토뉴스|포토 뉴스|포토|사진)\]', title_raw):
+        print(f"[x] 제외 (포토류): {title_raw}")
+        return None
+    if is_english(title_raw):
+        print(f"[x] 제외 (영문 제목): {title_raw}")
+        return None
+
+    title = clean_title(title_raw)
+
+    date_raw = detail.select_one('span._ARTICLE_DATE_TIME').get('data-date-time')
+    dt = datetime.strptime(date_raw, "%Y-%m-%d %H:%M:%S")
+    date_str_fmt = dt.strftime("%Y-%m-%d")
+    time_str_fmt = dt.strftime("%H:%M")
+
+    content = clean_content(content_elem, press)
+    if is_english(content):
+        print(f"[x] 제외 (영문 본문): {title}")
+        return None
+
+    emails = list(set(re.findall(r'[\w\.-]+@[\w\.-]+', detail.prettify())))
+    journalist = emails if emails else []
+
+    return {
+        "press": press,
+        "title": title,
+        "journalist": journalist,
+        "date": date_str_fmt,
+        "time": time_str_fmt,
+        "content": content,
+        "url": link
+    }
+
+
+# --- 워커 초기화: 프로세스별 HTTP 세션 / 브라우저 ---
+def init_worker(worker_backend):
+    global fetcher, backend
+    backend = worker_backend
+    fetcher = ArticleFetcher()
+    # 워커 종료 시 브라우저가 남지 않도록 정리
+    Finalize(fetcher, fetcher.close, exitpriority=10)
+
+def fetch_page(url, required=()):
+    if backend == "selenium":
+        return fetcher.fetch_selenium(url)
+    return fetcher.fetch(url, required=required)
+
+
+# --- 하루치 크롤링 → parts/YYYYMMDD.jsonl ---
+# 진행 상황은 parts/YYYYMMDD.ckpt에 (날짜, 페이지) 단위와 URL 단위로 기록되며,
+# 중단 후 다시 실행하면 끝난 페이지/URL은 건너뛰고 이어서 수집한다.
+def crawl_day(date_str, parts_dir):
+    part_path = os.path.join(parts_dir, f"{date_str}.jsonl")
+    if os.path.exists(part_path):
+        print(f"[✓] {date_str} 이미 완료됨, 건너뜀")
+        return date_str, 0
+
+    print(f"[=] 날짜: {date_str}")
+    tmp_path = part_path + ".tmp"
+    ckpt = CrawlCheckpoint(os.path.join(parts_dir, f"{date_str}.ckpt"))
+    ckpt.restore_output(tmp_path)
+    if ckpt.units or ckpt.done_urls:
+        print(f"[i] {date_str} 이어서 수집: 완료 페이지 {len(ckpt.units)}개, "
+              f"완료 URL {len(ckpt.done_urls)}개, 재요청 URL {len(ckpt.in_flight)}개")
+    seen_links = set()
+    saved = 0
+    failed = 0
+
+    def fetch_record(link):
+        nonlocal saved
+        record = parse_article(link, fetch_page(link, required=NAVER_ARTICLE_REQUIRED))
+        if record:
+            saved += 1
+        return record
+
+    def log_error(link, e):
+        print(f"[!] 예외 발생 - {link}: {e}")
+
+    with open(tmp_path, 'a', encoding='utf-8') as f_out:
+        for page in range(1, MAX_PAGE + 1):
+            unit = f"{date_str}:{page}"
+            if ckpt.is_unit_done(unit):
+                continue
+
+            url = f"{NAVER_LIST_URL}?mode=LS2D&mid=shm&listType=paper&sid1={section}&date={date_str}&page={page}"
+            print(f"[i] {date_str} 페이지 {page} 크롤링 중: {url}")
+            soup = fetch_page(url)
+            article_tags = soup.select('ul.type06_headline li dt > a') + soup.select('ul.type06 li dt > a')
+            article_links = [a['href'] for a in article_tags if a['href'].startswith(('https://', 'http://'))]
+
+            if not article_links:
+                print(f"[✓] {date_str} 더 이상 기사 없음. 종료.")
+                break
+
+            # 실패한 URL은 완료 처리하지 않음 → 재실행 시 다시 요청
+            page_failed = 0
+            for link in article_links:
+                if link in seen_links:
+                    continue
+                seen_links.add(link)
+                if not ckpt.crawl_url(link, f_out, fetch_record, log_error):
+                    page_failed += 1
+
+            if page_failed:
+                failed += page_failed
+            else:
+                ckpt.finish_unit(unit, f_out.tell())
+
+    # 실패한 기사가 있으면 .tmp와 체크포인트를 남겨 두고 그 날짜를 실패로 보고
+    if failed:
+        ckpt.close()
+        raise RuntimeError(f"기사 {failed}건 수집 실패 ({saved}건 저장, 재실행 시 실패한 기사만 다시 수집)")
+
+    # 하루치가 끝까지 수집된 경우에만 part 파일로 확정
+    os.replace(tmp_path, part_path)
+    ckpt.remove()
+    print(f"[✓] {date_str} 크롤링 완료. ({saved}건)")
+    return date_str, saved
+
+
+def month_days(month):
+    """YYYYMM → 그 달의 모든 날짜 (YYYYMMDD)"""
+    first = datetime.strptime(month, "%Y%m")
+    next_month = (first.replace(day=28) + timedelta(days=4)).replace(day=1)
+    return [(first + timedelta(days=i)).strftime("%Y%m%d") for i in range((next_month - first).days)]
+
+
+# --- 월별 병합: parts의 날짜 파일을 최근 → 과거 순으로 이어 붙임 ---
+# 기존 merged 파일은 parts가 그 달 전체를 갖고 있을 때만 덮어씀 (일부 날짜만 백필한 경우 기존 전체 파일 보존)
+def merge_month(month, parts_dir, output_dir):
+    days = sorted(
+        (name[:8] for name in os.listdir(parts_dir)
+         if name.startswith(month) and name.endswith(".jsonl")),
+        reverse=True,
+    )
+    output_path = os.path.join(output_dir, f"merged_{month}.jsonl")
+    missing = sorted(set(month_days(month)) - set(days))
+    if missing and os.path.exists(output_path):
+        print(f"[!] {month} parts에 없는 날짜 {len(missing)}일 ({missing[0]} 등), "
+              f"기존 {output_path}를 덮어쓰지 않음")
+        return False
+    tmp_path = output_path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f_out:
+        for day in days:
+            with open(os.path.join(parts_dir, f"{day}.jsonl"), 'r', encoding='utf-8') as f_in:
+                for line in f_in:
+                    f_out.write(line)
+    os.replace(tmp_path, output_path)
+    print(f"[✓] {month} 병합 완료: {output_path} ({len(days)}일)")
+    return True
+
+
+# --- 월별 아카이브: parts의 날짜 파일을 원본 아카이브(common/archive.py)의 같은 날짜 파티션으로 ---
+# 같은 날짜를 다시 수집하면 해당 파티션을 교체하므로 중복되지 않는다.
+# (날짜마다 새 세그먼트를 모두 쓴 뒤 manifest를 교체하므로, 중간에 중단돼도 기존 날짜 데이터는 남음)
+def archive_month(month, parts_dir, source):
+    from common.archive import ArchiveWriter  # zstandard는 --archive 사용 시에만 필요
+    days = sorted(name[:8] for name in os.listdir(parts_dir)
+                  if name.startswith(month) and name.endswith(".jsonl"))
+    with ArchiveWriter(source, replace=True) as writer:
+        for day in days:
+            for record in iter_jsonl(os.path.join(parts_dir, f"{day}.jsonl")):
+                writer.write(record, key=day)
+            writer.flush()
+    print(f"[✓] {month} 아카이브 완료: archive:{source}:{month} ({len(days)}일, {writer.count}건)")
+
+
+# --- 날짜 범위 → 일 단위 작업 목록 (최근 → 과거) ---
+def date_range(start_str, end_str):
+    start = datetime.strptime(start_str, "%Y%m%d")
+    end = datetime.strptime(end_str, "%Y%m%d")
+    if start < end:
+        start, end = end, start
+    days = []
+    current = start
+    while current >= end:
+        days.append(current.strftime("%Y%m%d"))
+        current -= timedelta(days=1)
+    return days
+
+
+def backfill(start_str, end_str, workers, worker_backend, output_dir, archive=None):
+    parts_dir = os.path.join(output_dir, "parts")
+    os.makedirs(parts_dir, exist_ok=True)
+
+    days = date_range(start_str, end_str)
+    remaining = defaultdict(int)
+    for day in days:
+        remaining[day[:6]] += 1
+
+    print(f"[=] 백필 시작: {days[-1]} ~ {days[0]} ({len(days)}일, 워커 {workers}개, {worker_backend})")
+    total = 0
+    failed = defaultdict(list)  # 월 → 크롤링에 실패한 날짜
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(worker_backend,)) as pool:
+        futures = {pool.submit(crawl_day, day, parts_dir): day for day in days}
+        for future in as_completed(futures):
+            day = futures[future]
+            try:
+                _, saved = future.result()
+                total += saved
+            except Exception as e:
+                failed[day[:6]].append(day)
+                print(f"[!] {day} 크롤링 실패: {e}")
+
+            # 해당 월의 모든 날짜가 끝나면 바로 병합 (--archive면 아카이브에 적재)
+            # 실패한 날짜가 있는 달은 병합하지 않음 (다시 실행하면 끝난 날짜는 건너뛰고 실패한 날만 수집)
+            month = day[:6]
+            remaining[month] -= 1
+            if remaining[month] == 0:
+                if failed[month]:
+                    print(f"[!] {month} 실패한 날짜 {len(failed[month])}일이 있어 병합하지 않음: "
+                          f"{', '.join(sorted(failed[month]))}")
+                elif archive:
+                    archive_month(month, parts_dir, archive)
+                else:
+                    merge_month(month, parts_dir, output_dir)
+
+    failed_days = sorted(day for month_days_failed in failed.values() for day in month_days_failed)
+    if failed_days:
+        print(f"[!] 크롤링 실패 {len(failed_days)}일: {', '.join(failed_days)} (총 {total}건 수집)")
+    else:
+        print(f"[✓] 전체 날짜 크롤링 완료. (총 {total}건)")
+    return failed_days
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="네이버 정치 뉴스 날짜 범위 백필")
+    parser.add_argument("--start", required=True, help="시작 날짜 (YYYYMMDD)")
+    parser.add_argument("--end", required=True, help="끝 날짜 (YYYYMMDD)")
+    parser.add_argument("--workers", type=int, default=4, help="동시 실행 워커(프로세스) 수")
+    parser.add_argument("--backend", choices=["http", "selenium"], default="http",
+                        help="http: HTTP 우선 + Selenium 대체 / selenium: 모든 페이지를 브라우저로 수집")
+    parser.add_argument("--output-dir", default=DEFAULT_OUTPUT_DIR, help="merged_YYYYMM.jsonl 저장 폴더")
+    parser.add_argument("--archive", metavar="SOURCE",
+                        help="merged 파일 대신 원본 아카이브(data/archive/SOURCE)에 날짜별로 적재 (예: news)")
+    args = parser.parse_args()
+
+    failed_days = backfill(args.start, args.end, args.workers, args.backend, args.output_dir, args.archive)
+    sys.exit(1 if failed_days else 0)
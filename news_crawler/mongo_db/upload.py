@@ -1,9 +1,12 @@
 import os
-import json
+import sys
 import glob
 from pymongo import MongoClient
 from dotenv import load_dotenv
 
+sys.path.append(os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..")))  # data/
+from common.jsonl import iter_jsonl
+
 # MongoDB 연결
 load_dotenv()
 ATLAS_URI = os.getenv("ATLAS_URI")
@@ -32,17 +35,13 @@ for file_path in sorted(jsonl_files):
     collection_name = filename.replace("cleaned_", "").replace(".jsonl", "")
     collection = db[collection_name]
 
-    with open(file_path, "r", encoding="utf-8") as f:
-        records = []
-        for line in f:
-            try:
-                doc = json.loads(line.strip())
-                for field in ["press", "title", "journalist", "date", "time", "content", "url"]:
-                    if field not in doc:
-                        doc[field] = ""
-                records.append(doc)
-            except json.JSONDecodeError:
-                continue
+    # 파싱 실패한 줄은 줄 번호와 함께 경고하고 건너뜀
+    records = []
+    for doc in iter_jsonl(file_path):
+        for field in ["press", "title", "journalist", "date", "time", "content", "url"]:
+            if field not in doc:
+                doc[field] = ""
+        records.append(doc)
 
     # 처음 업로드라면 insert_many로 전체 업로드
     if records:
@@ -1,37 +1,15 @@
 import os
-import json
+import sys
 import re
 
 # 입력/출력 경로
 input_path = "../../output/editorial_202506.jsonl"
 output_path = "../output/editorial_202506_cleaned.jsonl"
 
-# 유니코드 기호 치환 맵
-UNICODE_REPLACEMENTS = {
-    '‘': "'", '’': "'",
-    '“': '', '”': '',  # " 제거
-    '…': '...',
-    '–': '-', '—': '-',
-    '·': '',
-    '″': '', '′': "'",
-    '\u00A0': ' ',  # non-breaking space
-}
-
-# 허용할 특수 문자 (쌍따옴표 제거됨)
-ALLOWED_SPECIALS = ".,?!()':%"
-
-# 한자 정규표현식 범위
-HANJA_RE = r'\u4e00-\u9fff'
-
-# 텍스트 정리 함수
-def clean_text(text):
-    for orig, repl in UNICODE_REPLACEMENTS.items():
-        text = text.replace(orig, repl)
-    cleaned = ''.join(
-        c for c in text
-        if c.isalnum() or c in ALLOWED_SPECIALS or re.match(f'[{HANJA_RE}]', c) or c.isspace()
-    )
-    return cleaned.strip()
+# 유니코드 기호 치환 + 허용 문자 필터 (쌍따옴표 제거, 한자 유지)
+sys.path.append(os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..")))  # data/
+from common.text_filter import clean_editorial_text as clean_text
+from common.jsonl import loads, JsonlWriter
 
 # 제목에서 [] 제거
 def clean_title(title):
@@ -50,10 +28,10 @@ if not os.path.exists(input_path):
 output_dir = os.path.dirname(output_path)
 os.makedirs(output_dir, exist_ok=True)
 
-with open(input_path, 'r', encoding='utf-8') as f_in, open(output_path, 'w', encoding='utf-8') as f_out:
+with open(input_path, 'rb') as f_in, JsonlWriter(output_path) as f_out:
     for line in f_in:
         try:
-            data = json.loads(line)
+            data = loads(line)
             title = data.get("title", "").strip()
             content = data.get("content", "").strip()
             press = data.get("press", "").strip()
@@ -76,7 +54,7 @@ with open(input_path, 'r', encoding='utf-8') as f_in, open(output_path, 'w', enc
 
             data["title"] = title_clean
             data["content"] = content_clean
-            f_out.write(json.dumps(data, ensure_ascii=False) + '\n')
+            f_out.write(data)
 
         except Exception as e:
             print(f"[!] 처리 오류: {e}")
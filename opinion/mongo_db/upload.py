@@ -1,9 +1,12 @@
 import os
-import json
+import sys
 import glob
 from pymongo import MongoClient
 from dotenv import load_dotenv
 
+sys.path.append(os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..")))  # data/
+from common.jsonl import iter_jsonl
+
 # 1. .env 파일에서 MongoDB URI 불러오기
 load_dotenv()
 ATLAS_URI = os.getenv("ATLAS_URI")
@@ -36,18 +39,13 @@ for file_path in sorted(jsonl_files):
     collection = db[collection_name]
 
     # 파일 파싱 및 업로드 준비
-    with open(file_path, "r", encoding="utf-8") as f:
-        records = []
-        for line in f:
-            try:
-                doc = json.loads(line.strip())
-                # 필수 필드 보장
-                for field in ["press", "title", "date", "time", "content", "url"]:
-                    if field not in doc:
-                        doc[field] = ""
-                records.append(doc)
-            except json.JSONDecodeError:
-                continue  # 오류 줄은 무시
+    records = []
+    for doc in iter_jsonl(file_path):  # 오류 줄은 줄 번호와 함께 경고하고 건너뜀
+        # 필수 필드 보장
+        for field in ["press", "title", "date", "time", "content", "url"]:
+            if field not in doc:
+                doc[field] = ""
+        records.append(doc)
 
     # MongoDB에 삽입
     if records:
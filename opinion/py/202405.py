@@ -1,6 +1,6 @@
 import os
+import sys
 import time
-import json
 import re
 from datetime import datetime, timedelta
 from selenium import webdriver
@@ -9,6 +9,9 @@ from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.chrome.service import Service
 from bs4 import BeautifulSoup
 
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))  # data/
+from common.checkpoint import CrawlCheckpoint
+
 # 날짜 설정
 start_date = datetime(2024, 5, 31)
 end_date = datetime(2024, 5, 1)
@@ -22,6 +25,8 @@ os.makedirs(OUT_DIR, exist_ok=True)
 
 log_path = os.path.join(LOG_DIR, "editorial_202405.log")
 out_path = os.path.join(OUT_DIR, "editorial_202405.jsonl")
+# 날짜/기사 단위 진행 기록 (중단 후 재실행 시 이어서 수집)
+ckpt_path = os.path.join(OUT_DIR, "editorial_202405.ckpt")
 
 
 def scroll_to_bottom(driver):
@@ -52,6 +57,34 @@ def clean_content(elem):
     return re.sub(r"\s+", " ", " ".join(result)).strip()
 
 
+# 사설 상세 페이지 → 레코드 (실패 시 예외)
+def fetch_editorial(link, press, title):
+    driver.get(link)
+    time.sleep(1.5)
+    detail = BeautifulSoup(driver.page_source, "html.parser")
+
+    date_raw = detail.select_one("span._ARTICLE_DATE_TIME")["data-date-time"]
+    dt = datetime.strptime(date_raw, "%Y-%m-%d %H:%M:%S")
+
+    content_elem = detail.select_one("article#dic_area")
+    if not content_elem:
+        raise Exception("본문 없음")
+
+    content = clean_content(content_elem)
+    if not content:
+        raise Exception("본문 비어있음")
+
+    print(f"[✓] 저장됨: {title}")
+    return {
+        "press": press,
+        "title": title,
+        "date": dt.strftime("%Y-%m-%d"),
+        "time": dt.strftime("%H:%M"),
+        "content": content,
+        "url": link
+    }
+
+
 # 드라이버 설정
 options = Options()
 options.add_argument("--headless")
@@ -60,10 +93,18 @@ options.add_argument("--disable-dev-shm-usage")
 service = Service(ChromeDriverManager().install())
 driver = webdriver.Chrome(service=service, options=options)
 
+ckpt = CrawlCheckpoint(ckpt_path)
+ckpt.restore_output(out_path)
+if ckpt.units or ckpt.done_urls:
+    print(f"[i] 이어서 수집: 완료 날짜 {len(ckpt.units)}개, 완료 기사 {len(ckpt.done_urls)}개, 재요청 기사 {len(ckpt.in_flight)}개")
+
 with open(out_path, "a", encoding="utf-8") as fout, open(log_path, "a", encoding="utf-8") as flog:
     current = start_date
     while current >= end_date:
         ymd = current.strftime("%Y%m%d")
+        if ckpt.is_unit_done(ymd):
+            current -= timedelta(days=1)
+            continue
         url = f"https://news.naver.com/opinion/editorial?date={ymd}"
         print(f"[=] {ymd} 처리 중: {url}")
         flog.write(f"[=] {ymd} 처리 중\n")
@@ -74,42 +115,28 @@ with open(out_path, "a", encoding="utf-8") as fout, open(log_path, "a", encoding
             soup = BeautifulSoup(driver.page_source, "html.parser")
             items = soup.select("li.opinion_editorial_item")
 
+            def log_error(link, e):
+                flog.write(f"[!] 내부 예외: {link} {e}\n")
+
+            # 기사 수집에 실패한 날짜는 완료로 기록하지 않음 (재실행 시 실패한 기사만 다시 요청)
+            failed = 0
             for item in items:
                 try:
                     press = item.select_one("strong.press_name").get_text(strip=True)
                     title = item.select_one("p.description").get_text(strip=True)
                     link = item.select_one("a.link")["href"]
-
-                    driver.get(link)
-                    time.sleep(1.5)
-                    detail = BeautifulSoup(driver.page_source, "html.parser")
-
-                    date_raw = detail.select_one("span._ARTICLE_DATE_TIME")["data-date-time"]
-                    dt = datetime.strptime(date_raw, "%Y-%m-%d %H:%M:%S")
-                    date_str = dt.strftime("%Y-%m-%d")
-                    time_str = dt.strftime("%H:%M")
-
-                    content_elem = detail.select_one("article#dic_area")
-                    if not content_elem:
-                        raise Exception("본문 없음")
-
-                    content = clean_content(content_elem)
-                    if not content:
-                        raise Exception("본문 비어있음")
-
-                    fout.write(json.dumps({
-                        "press": press,
-                        "title": title,
-                        "date": date_str,
-                        "time": time_str,
-                        "content": content,
-                        "url": link
-                    }, ensure_ascii=False) + "\n")
-
-                    print(f"[✓] 저장됨: {title}")
                 except Exception as e:
-                    flog.write(f"[!] 내부 예외: {e}\n")
+                    flog.write(f"[!] 목록 항목 파싱 실패: {e}\n")
                     continue
+                if not ckpt.crawl_url(link, fout, lambda url: fetch_editorial(url, press, title), log_error):
+                    failed += 1
+
+            if failed:
+                print(f"[!] {ymd} 기사 {failed}건 실패 → 재실행 시 다시 시도")
+                flog.write(f"[!] {ymd} 기사 {failed}건 실패\n")
+            else:
+                fout.flush()
+                ckpt.finish_unit(ymd, fout.tell())
 
         except Exception as e:
             print(f"[!] 날짜 {ymd} 처리 실패: {e}")
@@ -117,5 +144,6 @@ with open(out_path, "a", encoding="utf-8") as fout, open(log_path, "a", encoding
 
         current -= timedelta(days=1)
 
+ckpt.close()
 driver.quit()
 print("[✓] 모든 날짜 완료")
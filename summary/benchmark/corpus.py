@@ -0,0 +1,74 @@
+# ===========================
+# 벤치마크용 합성 한국어 정치 기사 코퍼스 (cleaned_YYYYMM.jsonl 형식)
+# ===========================
+# 같은 seed면 항상 같은 코퍼스가 만들어지므로 실행 간 비교가 가능하다.
+# 통신사 전재처럼 같은 문장이 여러 기사에 반복되는 비율(reprint_ratio)도 조절할 수 있다.
+import json
+import random
+
+PRESSES = ["연합뉴스", "뉴시스", "뉴스1", "한겨레", "조선일보", "중앙일보", "경향신문", "동아일보"]
+SUBJECTS = ["여당", "야당", "대통령실", "국회의장", "원내대표", "정부", "선거관리위원회", "법무부", "기획재정부", "헌법재판소"]
+OBJECTS = ["예산안", "특검법", "선거법 개정안", "청문회 일정", "민생 법안", "국정감사", "추가경정예산", "연금 개혁안"]
+# (목적어 뒤 조사, 서술부). 조사가 "을"이면 받침에 따라 을/를
+ACTIONS = [
+    ("", " 처리를 두고 이견을 좁히지 못했다"),
+    ("에", " 대한 입장을 발표했다"),
+    ("을", " 둘러싼 협상을 이어갔다"),
+    ("", " 관련 기자회견을 열었다"),
+    ("에", " 대해 강하게 반발했다"),
+    ("의", " 신속한 처리를 촉구했다"),
+    ("을", " 본회의에 상정했다"),
+]
+DETAILS = [
+    "관계자는 이날 기자들과 만나 이같이 말했다",
+    "정치권에서는 향후 정국에 미칠 영향에 주목하고 있다",
+    "이번 결정은 다음 주 본회의에서 최종 확정될 예정이다",
+    "전문가들은 여야 합의가 쉽지 않을 것으로 내다봤다",
+    "양측은 다음 달 초 다시 만나 논의를 이어가기로 했다",
+    "이에 대해 반대 측은 절차상 문제가 있다고 지적했다",
+]
+
+
+def has_batchim(word):
+    code = ord(word[-1]) - 0xAC00
+    return 0 <= code < 11172 and code % 28 != 0
+
+
+def make_sentence(rng):
+    subject = rng.choice(SUBJECTS)
+    obj = rng.choice(OBJECTS)
+    particle, action = rng.choice(ACTIONS)
+    if particle == "을" and not has_batchim(obj):
+        particle = "를"
+    topic = "은" if has_batchim(subject) else "는"
+    sentence = f"{subject}{topic} {obj}{particle}{action}."
+    if rng.random() < 0.5:
+        sentence = sentence[:-1] + f"며 {rng.choice(DETAILS)}."
+    if rng.random() < 0.15:
+        # 긴 문장 (패딩 낭비가 드러나도록 길이 분포를 넓힘)
+        sentence = sentence[:-1] + " " + " ".join(f"{rng.choice(DETAILS)}고" for _ in range(rng.randint(2, 6))) + " 덧붙였다."
+    return sentence
+
+
+def generate_corpus(path, articles=500, seed=42, reprint_ratio=0.3, min_sentences=2, max_sentences=40):
+    rng = random.Random(seed)
+    shared = [make_sentence(rng) for _ in range(200)]  # 전재 기사에서 반복되는 문장 풀
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(articles):
+            count = rng.randint(min_sentences, max_sentences)
+            sentences = [
+                rng.choice(shared) if rng.random() < reprint_ratio else make_sentence(rng)
+                for _ in range(count)
+            ]
+            day = 1 + i % 28
+            article = {
+                "press": rng.choice(PRESSES),
+                "title": f"{rng.choice(SUBJECTS)}, {rng.choice(OBJECTS)} 논의",
+                "journalist": [],
+                "date": f"2025-06-{day:02d}",
+                "time": f"{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}",
+                "content": " ".join(sentences),
+                "url": f"https://bench.local/article/{seed}/{i}",
+            }
+            f.write(json.dumps(article, ensure_ascii=False) + "\n")
+    return path
@@ -0,0 +1,252 @@
+import os
+import sys
+import json
+import time
+import platform
+import resource
+import argparse
+import tempfile
+from datetime import datetime
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))  # summary/benchmark/
+SUMMARY_DIR = os.path.dirname(BENCH_DIR)  # summary/
+sys.path.append(os.path.dirname(SUMMARY_DIR))  # data/
+sys.path.append(SUMMARY_DIR)
+sys.path.append(BENCH_DIR)
+
+from corpus import generate_corpus
+
+RESULTS_DIR = os.path.join(BENCH_DIR, "results")
+CORPUS_DIR = os.path.join(BENCH_DIR, "corpus")
+
+
+def peak_rss_mb():
+    # Linux ru_maxrss 단위는 KB (자식 프로세스 = 문장 분리 풀)
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return round(own / 1024, 1), round(children / 1024, 1)
+
+
+def timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def load_articles(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def make_embedder(args, cache):
+    if args.backend == "onnx":
+        from modules.onnx_embedder import ONNXKoBERTEmbedder
+        return ONNXKoBERTEmbedder(quantize=not args.no_quantize, num_threads=args.threads, cache=cache)
+    from modules.sentence_embedder import KoBERTEmbedder
+    return KoBERTEmbedder(device="cpu", cache=cache)
+
+
+def bench_split(articles, split_workers, split_backend):
+    from modules.sentence_splitter import split_sentences, ParallelSplitter
+    texts = [a["content"] for a in articles]
+    if split_workers <= 1:
+        return timed(lambda: [split_sentences(t, backend=split_backend) for t in texts])
+    with ParallelSplitter(workers=split_workers, backend=split_backend) as splitter:
+        return timed(lambda: [sentences for _, sentences in splitter.imap(texts)])
+
+
+def bench_embed(embedder, sentence_lists, chunk_articles, max_tokens):
+    from modules.batch_embedder import embed_articles
+
+    def run():
+        embeddings = []
+        for i in range(0, len(sentence_lists), chunk_articles):
+            chunk = sentence_lists[i:i + chunk_articles]
+            if max_tokens:
+                embeddings.extend(embed_articles(embedder, chunk, max_tokens))
+            else:
+                # 기존 방식: 기사마다 한 번씩 모델 호출
+                embeddings.extend(embedder.get_sentence_embedding(s) for s in chunk)
+        return embeddings
+    return timed(run)
+
+
+def bench_mmr(sentence_lists, embeddings, chunk_articles):
+    import torch
+    from modules.summarizer import mmr, mmr_torch, mmr_torch_batch, pad_embeddings
+
+    def run_numpy():
+        for sentences, emb in zip(sentence_lists, embeddings):
+            e = emb.numpy()
+            mmr(e.mean(axis=0), e, sentences, top_n=3, lambda_param=0.7)
+
+    def run_torch():
+        for sentences, emb in zip(sentence_lists, embeddings):
+            mmr_torch(emb.mean(dim=0), emb, sentences, top_n=3, lambda_param=0.7)
+
+    def run_batch():
+        for i in range(0, len(embeddings), chunk_articles):
+            chunk = embeddings[i:i + chunk_articles]
+            padded, mask = pad_embeddings(chunk)
+            docs = torch.stack([e.mean(dim=0) for e in chunk])
+            mmr_torch_batch(docs, padded, mask, top_n=3, lambda_param=0.7)
+
+    return {
+        "mmr_sec": round(timed(run_numpy)[1], 4),
+        "mmr_torch_sec": round(timed(run_torch)[1], 4),
+        "mmr_torch_batch_sec": round(timed(run_batch)[1], 4),
+    }
+
+
+def bench_end_to_end(corpus_path, args):
+    from modules.runner import SummaryRunner
+    with tempfile.TemporaryDirectory() as tmp:
+        (runner, load_sec) = timed(
+            SummaryRunner,
+            backend=args.backend,
+            chunk_articles=args.chunk_articles,
+            max_batch_tokens=args.max_batch_tokens or 8192,
+            split_workers=max(args.split_workers, 1),
+            split_backend=args.split_backend,
+            onnx_quantize=not args.no_quantize,
+            onnx_threads=args.threads,
+            cache_dir=os.path.join(tmp, "cache"),
+            show_progress=False,
+            state_dir=os.path.join(tmp, "state"),
+        )
+        written, sec = timed(runner.run_file, corpus_path, os.path.join(tmp, "summarized.jsonl"))
+        runner.close()
+    return {"model_load_sec": round(load_sec, 2), "articles": written, "wall_sec": round(sec, 3),
+            "articles_per_sec": round(written / sec, 2) if sec else 0}
+
+
+def run(args):
+    import torch
+    if args.torch_threads:
+        torch.set_num_threads(args.torch_threads)
+
+    os.makedirs(CORPUS_DIR, exist_ok=True)
+    corpus_path = args.corpus or os.path.join(CORPUS_DIR, f"synthetic_{args.articles}_{args.seed}.jsonl")
+    if not os.path.exists(corpus_path):
+        generate_corpus(corpus_path, articles=args.articles, seed=args.seed, reprint_ratio=args.reprint_ratio)
+    articles = load_articles(corpus_path)
+
+    result = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "config": {k: v for k, v in vars(args).items() if k != "compare"},
+        "env": {
+            "python": platform.python_version(),
+            "torch": torch.__version__,
+            "cpu_count": os.cpu_count(),
+            "torch_threads": torch.get_num_threads(),
+            "machine": platform.machine(),
+        },
+        "corpus": {"path": corpus_path, "articles": len(articles)},
+    }
+
+    # 1) 문장 분리
+    sentence_lists, split_sec = bench_split(articles, args.split_workers, args.split_backend)
+    total_sentences = sum(len(s) for s in sentence_lists)
+    result["split"] = {"sec": round(split_sec, 3), "sentences": total_sentences,
+                       "sentences_per_sec": round(total_sentences / split_sec, 1) if split_sec else 0}
+
+    # 2) 임베딩 (요약 대상: 문장 4개 이상)
+    targets = [s for s in sentence_lists if len(s) > 3]
+    cache = None
+    tmp_cache = None
+    if args.cache:
+        from modules.embedding_cache import EmbeddingCache
+        tmp_cache = tempfile.TemporaryDirectory()
+        cache = EmbeddingCache(tmp_cache.name, tag=f"bench:{args.backend}")
+    embedder, load_sec = timed(make_embedder, args, cache)
+    embeddings, embed_sec = bench_embed(embedder, targets, args.chunk_articles, args.max_batch_tokens)
+    embedded = sum(len(s) for s in targets)
+    result["embed"] = {
+        "model_load_sec": round(load_sec, 2),
+        "sec": round(embed_sec, 3),
+        "sentences": embedded,
+        "sentences_per_sec": round(embedded / embed_sec, 1) if embed_sec else 0,
+        "cache": cache.stats() if cache else None,
+    }
+    if cache:
+        cache.close()
+        tmp_cache.cleanup()
+
+    # 3) MMR
+    result["mmr"] = bench_mmr(targets, [e.float().cpu() for e in embeddings], args.chunk_articles)
+
+    stage_sec = split_sec + embed_sec + result["mmr"]["mmr_torch_batch_sec"]
+    result["total"] = {
+        "stage_sec": round(stage_sec, 3),
+        "articles_per_sec": round(len(articles) / stage_sec, 2) if stage_sec else 0,
+        "sentences_per_sec": round(total_sentences / stage_sec, 1) if stage_sec else 0,
+    }
+
+    # 4) 전체 파이프라인 (선택)
+    if args.end_to_end:
+        del embedder
+        result["end_to_end"] = bench_end_to_end(corpus_path, args)
+
+    own, children = peak_rss_mb()
+    result["peak_rss_mb"] = {"main": own, "children": children}
+    return result
+
+
+def compare(paths):
+    # 첫 번째 결과 대비 각 결과의 주요 지표
+    runs = []
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            runs.append((os.path.basename(path), json.load(f)))
+    metrics = [
+        ("split sentences/s", lambda r: r["split"]["sentences_per_sec"]),
+        ("embed sentences/s", lambda r: r["embed"]["sentences_per_sec"]),
+        ("mmr_torch sec", lambda r: r["mmr"]["mmr_torch_sec"]),
+        ("mmr_torch_batch sec", lambda r: r["mmr"]["mmr_torch_batch_sec"]),
+        ("articles/s", lambda r: r["total"]["articles_per_sec"]),
+        ("peak RSS MB", lambda r: r["peak_rss_mb"]["main"]),
+    ]
+    base_name, base = runs[0]
+    print(f"{'metric':<22}" + "".join(f"{name[:28]:>30}" for name, _ in runs))
+    for label, get in metrics:
+        row = f"{label:<22}"
+        for _, r in runs:
+            value, ref = get(r), get(base)
+            ratio = f" ({value / ref:.2f}x)" if ref else ""
+            row += f"{value:>18}{ratio:>12}"
+        print(row)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="요약 단계 처리량 벤치마크")
+    parser.add_argument("--articles", type=int, default=500, help="합성 코퍼스 기사 수")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--reprint-ratio", type=float, default=0.3, help="전재(반복) 문장 비율")
+    parser.add_argument("--corpus", help="합성 코퍼스 대신 사용할 cleaned JSONL")
+    parser.add_argument("--backend", choices=["torch", "onnx"], default="torch")
+    parser.add_argument("--no-quantize", action="store_true")
+    parser.add_argument("--threads", type=int, default=None, help="ONNX Runtime intra-op 스레드 수")
+    parser.add_argument("--torch-threads", type=int, default=None, help="torch.set_num_threads")
+    parser.add_argument("--chunk-articles", type=int, default=64)
+    parser.add_argument("--max-batch-tokens", type=int, default=8192, help="0이면 기사별 임베딩 (기존 방식)")
+    parser.add_argument("--split-workers", type=int, default=1, help="1이면 순차 kss")
+    parser.add_argument("--split-backend", default=None)
+    parser.add_argument("--cache", action="store_true", help="임베딩 캐시 사용 (빈 캐시에서 시작)")
+    parser.add_argument("--end-to-end", action="store_true", help="SummaryRunner 전체 파이프라인도 측정")
+    parser.add_argument("--output", help="결과 JSON 경로 (기본: benchmark/results/<시각>_<backend>.json)")
+    parser.add_argument("--compare", nargs="+", help="저장된 결과 JSON 비교 (첫 파일 기준)")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(args.compare)
+        sys.exit(0)
+
+    result = run(args)
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    output = args.output or os.path.join(
+        RESULTS_DIR, f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{args.backend}.json"
+    )
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    print(f"[INFO] 결과 저장: {output}")
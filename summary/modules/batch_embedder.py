@@ -0,0 +1,20 @@
+# ===========================
+# 여러 기사 문장을 모아 한 번에 임베딩
+# ===========================
+import torch
+
+
+def embed_articles(embedder, sentence_lists, max_tokens=8192):
+    """
+    sentence_lists: 기사별 문장 리스트
+    기사 경계와 관계없이 모든 문장을 길이별 버킷(버킷당 문장 수 × 최대 길이 ≤ max_tokens)으로
+    묶어 모델을 호출하고, CLS 벡터를 기사별 (문장 수, hidden) 텐서로 다시 나눠 반환한다.
+    """
+    flat = [sentence for sentences in sentence_lists for sentence in sentences]
+    if not flat:
+        return [None for _ in sentence_lists]
+
+    embeddings = embedder.encode(flat, max_tokens=max_tokens)
+
+    counts = [len(sentences) for sentences in sentence_lists]
+    return [emb if len(emb) else None for emb in torch.split(embeddings, counts)]
@@ -0,0 +1,144 @@
+# ===========================
+# 문장 임베딩 캐시 (memmap float16 행렬 + 해시 → 행 번호 인덱스)
+# ===========================
+import os
+import json
+import sqlite3
+import hashlib
+import unicodedata
+from collections import OrderedDict
+
+import numpy as np
+
+KEY_BYTES = 16
+
+
+def normalize_sentence(text):
+    # 통신사 전재 기사에서 공백/유니코드 정규화 차이만 있는 문장을 같은 문장으로 본다
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def sentence_key(text):
+    return hashlib.blake2b(normalize_sentence(text).encode("utf-8"), digest_size=KEY_BYTES).digest()
+
+
+class EmbeddingCache:
+    """
+    cache_dir/
+      vectors.f16   (capacity, dim) float16 memmap
+      keys.bin      (capacity, 16) 행마다 저장된 문장 해시 (인덱스와 행 내용 일치 확인용)
+      index.sqlite3 해시 → (행 번호, 마지막 사용 순번)
+      meta.json     dim / capacity / tag (모델이 바뀌면 캐시 초기화)
+    가득 차면 가장 오래 쓰이지 않은 행을 덮어쓴다 (LRU).
+    """
+    def __init__(self, cache_dir, dim=768, capacity=200_000, tag="kobert"):
+        os.makedirs(cache_dir, exist_ok=True)
+        self.cache_dir = cache_dir
+        self.dim = dim
+        self.capacity = capacity
+        self.tag = tag
+        self.hits = 0
+        self.misses = 0
+
+        meta = {"dim": dim, "capacity": capacity, "tag": tag}
+        meta_path = os.path.join(cache_dir, "meta.json")
+        vectors_path = os.path.join(cache_dir, "vectors.f16")
+        keys_path = os.path.join(cache_dir, "keys.bin")
+        index_path = os.path.join(cache_dir, "index.sqlite3")
+
+        fresh = True
+        if os.path.exists(meta_path):
+            with open(meta_path, "r", encoding="utf-8") as f:
+                fresh = json.load(f) != meta
+            if fresh:
+                print(f"[INFO] 임베딩 캐시 설정 변경 → 초기화: {cache_dir}")
+        if fresh:
+            for path in (vectors_path, keys_path, index_path):
+                if os.path.exists(path):
+                    os.remove(path)
+
+        mode = "w+" if fresh else "r+"
+        self.vectors = np.memmap(vectors_path, dtype=np.float16, mode=mode, shape=(capacity, dim))
+        self.keys = np.memmap(keys_path, dtype=np.uint8, mode=mode, shape=(capacity, KEY_BYTES))
+
+        self.conn = sqlite3.connect(index_path, check_same_thread=False)  # 파이프라인 임베딩 스레드에서 사용
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries (key BLOB PRIMARY KEY, row INTEGER NOT NULL, tick INTEGER NOT NULL)"
+        )
+        self.conn.commit()
+
+        # 메모리에는 LRU 순서(오래된 것 → 최근)로 key → row 유지
+        self.lru = OrderedDict(
+            (bytes(key), row)
+            for key, row in self.conn.execute("SELECT key, row FROM entries ORDER BY tick")
+        )
+        self.free_rows = sorted(set(range(capacity)) - set(self.lru.values()), reverse=True)
+        self.tick = self.conn.execute("SELECT COALESCE(MAX(tick), -1) FROM entries").fetchone()[0] + 1
+        self.dirty = set()
+        self.evicted = set()
+
+        with open(meta_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+
+    def __len__(self):
+        return len(self.lru)
+
+    def get(self, key):
+        row = self.lru.get(key)
+        if row is None or self.keys[row].tobytes() != key:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.lru.move_to_end(key)
+        self.dirty.add(key)
+        return np.array(self.vectors[row], dtype=np.float32)
+
+    def put(self, key, vector):
+        row = self.lru.get(key)
+        if row is None:
+            if self.free_rows:
+                row = self.free_rows.pop()
+            else:
+                old_key, row = self.lru.popitem(last=False)
+                self.dirty.discard(old_key)
+                self.evicted.add(old_key)
+            self.evicted.discard(key)
+        self.lru[key] = row
+        self.lru.move_to_end(key)
+        self.vectors[row] = np.asarray(vector, dtype=np.float16)
+        self.keys[row] = np.frombuffer(key, dtype=np.uint8)
+        self.dirty.add(key)
+
+    # 행렬은 memmap으로 바로 기록되고, 인덱스(행 번호 / 사용 순서)는 flush 때 SQLite에 반영
+    def flush(self):
+        self.vectors.flush()
+        self.keys.flush()
+        order = {key: i for i, key in enumerate(self.lru)}
+        self.conn.executemany("DELETE FROM entries WHERE key = ?", ((key,) for key in self.evicted))
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO entries (key, row, tick) VALUES (?, ?, ?)",
+            ((key, self.lru[key], self.tick + order[key]) for key in self.dirty),
+        )
+        self.conn.commit()
+        self.tick += len(self.lru)
+        self.dirty.clear()
+        self.evicted.clear()
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self):
+        return {
+            "entries": len(self.lru),
+            "capacity": self.capacity,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+    def close(self):
+        self.flush()
+        self.conn.close()
@@ -0,0 +1,131 @@
+# ===========================
+# ONNX Runtime 버전 KoBERT 임베더 (CPU 전용)
+# ===========================
+import os
+import argparse
+
+import numpy as np
+import torch
+import torch.nn.functional as F
+from transformers import BertModel
+from kobert_transformers import get_tokenizer
+
+from modules.sentence_embedder import KoBERTEmbedder
+
+MODEL_NAME = "skt/kobert-base-v1"
+DEFAULT_MODEL_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "models", "kobert_onnx"))
+INPUT_NAMES = ["input_ids", "attention_mask", "token_type_ids"]
+
+
+def export_onnx(model_dir=DEFAULT_MODEL_DIR, quantize=True, opset=14):
+    """
+    KoBERT를 한 번만 ONNX로 내보내고(model.onnx), quantize=True면 동적 int8 양자화본(model.int8.onnx)도 만든다.
+    이미 있으면 다시 만들지 않는다. 사용할 모델 경로를 반환.
+    """
+    os.makedirs(model_dir, exist_ok=True)
+    fp32_path = os.path.join(model_dir, "model.onnx")
+    int8_path = os.path.join(model_dir, "model.int8.onnx")
+
+    if not os.path.exists(fp32_path):
+        print(f"[INFO] ONNX 내보내기: {fp32_path}")
+        tokenizer = get_tokenizer()
+        model = BertModel.from_pretrained(MODEL_NAME)
+        model.eval()
+        dummy = tokenizer(["샘플 문장입니다.", "두 번째 샘플 문장"], padding=True, return_tensors="pt")
+        dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in INPUT_NAMES}
+        dynamic_axes["last_hidden_state"] = {0: "batch", 1: "sequence"}
+        with torch.no_grad():
+            torch.onnx.export(
+                model,
+                tuple(dummy[name] for name in INPUT_NAMES),
+                fp32_path,
+                input_names=INPUT_NAMES,
+                output_names=["last_hidden_state"],
+                dynamic_axes=dynamic_axes,
+                opset_version=opset,
+            )
+
+    if not quantize:
+        return fp32_path
+
+    if not os.path.exists(int8_path):
+        from onnxruntime.quantization import quantize_dynamic, QuantType
+        print(f"[INFO] 동적 int8 양자화: {int8_path}")
+        quantize_dynamic(fp32_path, int8_path, weight_type=QuantType.QInt8)
+    return int8_path
+
+
+class ONNXKoBERTEmbedder(KoBERTEmbedder):
+    """
+    KoBERTEmbedder와 같은 인터페이스(get_sentence_embedding / encode / token_lengths)를
+    ONNX Runtime 세션으로 제공한다. 결과는 CPU torch 텐서.
+    """
+    def __init__(self, model_dir=DEFAULT_MODEL_DIR, quantize=True, num_threads=None, cache=None):
+        import onnxruntime as ort
+
+        self.cache = cache
+        self.device = torch.device("cpu")
+        self.tokenizer = get_tokenizer()
+        self.model_path = export_onnx(model_dir, quantize=quantize)
+
+        options = ort.SessionOptions()
+        if num_threads:
+            options.intra_op_num_threads = num_threads
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.session = ort.InferenceSession(self.model_path, options, providers=["CPUExecutionProvider"])
+        self.input_names = {i.name for i in self.session.get_inputs()}
+
+        print(f"[INFO] Using ONNX Runtime: {self.model_path} (threads={num_threads or 'auto'})")
+
+    def _cls_embeddings(self, inputs):
+        feeds = {k: v.cpu().numpy().astype(np.int64) for k, v in inputs.items() if k in self.input_names}
+        last_hidden_state = self.session.run(["last_hidden_state"], feeds)[0]
+        return torch.from_numpy(np.ascontiguousarray(last_hidden_state[:, 0, :]))
+
+
+def check_parity(embedder, reference, sentences, max_tokens=None):
+    """
+    같은 문장에 대한 두 임베더의 CLS 벡터 비교 (코사인 유사도 최소/평균, 최대 절대 오차).
+    """
+    a = embedder.encode(sentences, max_tokens=max_tokens).float().cpu()
+    b = reference.encode(sentences, max_tokens=max_tokens).float().cpu()
+    cosine = F.cosine_similarity(a, b, dim=1)
+    return {
+        "sentences": len(sentences),
+        "cosine_min": cosine.min().item(),
+        "cosine_mean": cosine.mean().item(),
+        "max_abs_diff": (a - b).abs().max().item(),
+    }
+
+
+PARITY_SENTENCES = [
+    "국회는 오늘 본회의를 열고 예산안을 처리했다.",
+    "여야는 특검법을 두고 이견을 좁히지 못했다.",
+    "대통령실은 이번 인사에 대해 별도의 입장을 내지 않았다.",
+    "선거관리위원회는 사전투표율이 역대 최고를 기록했다고 밝혔다.",
+    "정부는 내년부터 청년 주거 지원을 확대하겠다고 발표했다.",
+]
+
+
+# summary 폴더에서: python -m modules.onnx_embedder --quantize --threads 4
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="KoBERT ONNX 내보내기 및 PyTorch 결과와의 일치 확인")
+    parser.add_argument("--model-dir", default=DEFAULT_MODEL_DIR)
+    parser.add_argument("--quantize", action="store_true", help="동적 int8 양자화 모델 사용")
+    parser.add_argument("--threads", type=int, default=None, help="ONNX Runtime intra-op 스레드 수")
+    parser.add_argument("--input", help="비교에 쓸 문장 파일 (한 줄에 한 문장)")
+    parser.add_argument("--min-cosine", type=float, default=0.99, help="허용 최소 코사인 유사도")
+    args = parser.parse_args()
+
+    sentences = PARITY_SENTENCES
+    if args.input:
+        with open(args.input, "r", encoding="utf-8") as f:
+            sentences = [line.strip() for line in f if line.strip()]
+
+    onnx_embedder = ONNXKoBERTEmbedder(args.model_dir, quantize=args.quantize, num_threads=args.threads)
+    torch_embedder = KoBERTEmbedder(device="cpu")
+    result = check_parity(onnx_embedder, torch_embedder, sentences)
+    print(f"[INFO] parity: {result}")
+    if result["cosine_min"] < args.min_cosine:
+        raise SystemExit(f"[ERROR] 코사인 유사도 {result['cosine_min']:.4f} < {args.min_cosine}")
+    print("[INFO] parity OK")
@@ -0,0 +1,272 @@
+# ===========================
+# 스트리밍 요약 파이프라인
+# 읽기 → 문장 분리(프로세스 풀) → 배치 임베딩 → MMR → 기록
+# 단계 사이는 크기가 제한된 큐로 연결되어 메모리가 입력 크기와 무관하게 유지된다.
+# ===========================
+import time
+import queue
+import logging
+import threading
+
+from modules.batch_embedder import embed_articles
+
+_DONE = object()
+
+
+class MonitoredQueue(queue.Queue):
+    """put 시점의 큐 길이를 기록하는 bounded 큐 (최대/평균 대기 길이)"""
+    def __init__(self, name, maxsize):
+        super().__init__(maxsize=maxsize)
+        self.name = name
+        self.max_depth = 0
+        self.depth_sum = 0
+        self.samples = 0
+        self.finished = False  # 종료 표시(_DONE)를 이미 꺼냈는지
+
+    def put(self, item, block=True, timeout=None):
+        super().put(item, block, timeout)
+        depth = self.qsize()
+        self.max_depth = max(self.max_depth, depth)
+        self.depth_sum += depth
+        self.samples += 1
+
+    def stats(self):
+        return {
+            "maxsize": self.maxsize,
+            "max_depth": self.max_depth,
+            "avg_depth": round(self.depth_sum / self.samples, 2) if self.samples else 0,
+        }
+
+
+class StageStats:
+    """단계별 처리 건수와 실제 작업 시간(큐 대기 제외)"""
+    def __init__(self, name):
+        self.name = name
+        self.items = 0
+        self.busy = 0.0
+
+    def add(self, items, seconds):
+        self.items += items
+        self.busy += seconds
+
+    def stats(self):
+        return {
+            "items": self.items,
+            "busy_sec": round(self.busy, 2),
+            "items_per_sec": round(self.items / self.busy, 2) if self.busy > 0 else 0,
+        }
+
+
+def iter_queue(q):
+    while True:
+        item = q.get()
+        if item is _DONE:
+            q.finished = True
+            return
+        yield item
+
+
+def drain(q):
+    # 하위 단계가 실패했을 때 상위 단계가 put에서 멈추지 않도록 남은 항목을 버린다
+    if q.finished:
+        return
+    for _ in iter_queue(q):
+        pass
+
+
+class SummaryPipeline:
+    """
+    splitter: ParallelSplitter
+    summarize(sentences, sentence_embeddings) -> 요약 문자열 (MMR)
+    summarize_batch(sentence_lists, embedding_list) -> 요약 문자열 리스트 (여러 기사 동시 MMR, 선택)
+    문장이 min_sentences 이하인 기사는 임베딩 없이 문장을 그대로 이어 요약으로 쓴다.
+    모든 단계가 입력 순서를 유지하므로 기록 순서는 입력 순서와 같다.
+    """
+    def __init__(self, embedder, splitter, summarize, chunk_articles=64, max_tokens=8192,
+                 queue_size=256, min_sentences=3, on_chunk=None, summarize_batch=None):
+        self.embedder = embedder
+        self.splitter = splitter
+        self.summarize = summarize
+        self.summarize_batch = summarize_batch
+        self.chunk_articles = chunk_articles
+        self.max_tokens = max_tokens
+        self.min_sentences = min_sentences
+        self.on_chunk = on_chunk  # 임베딩 묶음마다 호출 (예: 캐시 flush)
+
+        self.queues = {
+            name: MonitoredQueue(name, queue_size)
+            for name in ("read", "split", "write")
+        }
+        # 임베딩 결과는 묶음(chunk_articles개) 단위로 넘긴다
+        self.queues["embed"] = MonitoredQueue("embed", max(2, queue_size // chunk_articles))
+        self.stages = {name: StageStats(name) for name in ("read", "split", "embed", "mmr", "write")}
+        self.errors = []
+
+    # --- 단계 1: 읽기 ---
+    def _read(self, articles):
+        out = self.queues["read"]
+        stats = self.stages["read"]
+        try:
+            start = time.perf_counter()
+            for article in articles:
+                stats.add(1, time.perf_counter() - start)
+                out.put(article)
+                start = time.perf_counter()
+        finally:
+            out.put(_DONE)
+
+    # --- 단계 2: 문장 분리 (프로세스 풀, 순서 유지) ---
+    def _split(self):
+        src, out = self.queues["read"], self.queues["split"]
+        stats = self.stages["split"]
+        try:
+            start = time.perf_counter()
+            for article, sentences in self.splitter.imap(iter_queue(src), text=lambda a: a["content"].strip()):
+                stats.add(1, time.perf_counter() - start)
+                if not sentences:
+                    logging.warning(f"No sentences after splitting for: {article['url']}")
+                else:
+                    out.put((article, sentences))
+                start = time.perf_counter()
+        except Exception:
+            drain(src)
+            raise
+        finally:
+            out.put(_DONE)
+
+    # --- 단계 3: 여러 기사 문장을 모아 배치 임베딩 ---
+    def _embed_chunk(self, chunk):
+        targets = [(article, sentences) for article, sentences in chunk if len(sentences) > self.min_sentences]
+        try:
+            embeddings = embed_articles(self.embedder, [sentences for _, sentences in targets], self.max_tokens)
+        except Exception as e:
+            # 묶음 전체가 실패하면 기사별로 다시 시도해 문제 기사만 건너뜀
+            logging.warning(f"Batch embedding failed, retrying per article: {e}")
+            embeddings = []
+            for article, sentences in targets:
+                try:
+                    embeddings.append(self.embedder.encode(sentences))
+                except Exception as e:
+                    logging.error(f"Embedding failed for {article['url']}: {e}")
+                    embeddings.append(None)
+
+        by_id = {id(article): emb for (article, _), emb in zip(targets, embeddings)}
+        return [(article, sentences, by_id.get(id(article))) for article, sentences in chunk]
+
+    def _embed(self):
+        src, out = self.queues["split"], self.queues["embed"]
+        stats = self.stages["embed"]
+        try:
+            chunk = []
+            items = iter_queue(src)
+            while True:
+                item = next(items, _DONE)
+                if item is not _DONE:
+                    chunk.append(item)
+                if chunk and (len(chunk) >= self.chunk_articles or item is _DONE):
+                    start = time.perf_counter()
+                    results = self._embed_chunk(chunk)
+                    stats.add(len(chunk), time.perf_counter() - start)
+                    out.put(results)
+                    if self.on_chunk:
+                        self.on_chunk()
+                    chunk = []
+                if item is _DONE:
+                    break
+        except Exception:
+            drain(src)
+            raise
+        finally:
+            out.put(_DONE)
+
+    # --- 단계 4: MMR (묶음 단위) ---
+    def _summarize_chunk(self, results):
+        summaries = [None] * len(results)
+        targets = []
+        for i, (article, sentences, embedding) in enumerate(results):
+            if len(sentences) <= self.min_sentences:
+                summaries[i] = " ".join(sentences)
+            elif embedding is not None:
+                targets.append(i)
+
+        if self.summarize_batch and targets:
+            try:
+                batch = self.summarize_batch(
+                    [results[i][1] for i in targets],
+                    [results[i][2] for i in targets],
+                )
+                for i, summary in zip(targets, batch):
+                    summaries[i] = summary
+                return summaries
+            except Exception as e:
+                logging.warning(f"Batched MMR failed, retrying per article: {e}")
+
+        for i in targets:
+            article, sentences, embedding = results[i]
+            try:
+                summaries[i] = self.summarize(sentences, embedding)
+            except Exception as e:
+                logging.error(f"Summarizing failed for {article['url']}: {e}")
+        return summaries
+
+    def _mmr(self):
+        src, out = self.queues["embed"], self.queues["write"]
+        stats = self.stages["mmr"]
+        try:
+            for results in iter_queue(src):
+                start = time.perf_counter()
+                summaries = self._summarize_chunk(results)
+                stats.add(len(results), time.perf_counter() - start)
+                for (article, _, _), summary in zip(results, summaries):
+                    if summary is not None:
+                        article["summary"] = summary
+                        out.put(article)
+        except Exception:
+            drain(src)
+            raise
+        finally:
+            out.put(_DONE)
+
+    def _run_stage(self, target, *args):
+        try:
+            target(*args)
+        except Exception as e:
+            logging.exception(f"Pipeline stage {target.__name__} failed")
+            self.errors.append(e)
+
+    # --- 단계 5: 기록 (호출한 스레드에서 실행) ---
+    def run(self, articles, write):
+        """articles: 요약할 기사 dict iterable / write(article): 결과 기록 함수. 기록한 건수를 반환"""
+        threads = [
+            threading.Thread(target=self._run_stage, args=(self._read, articles), daemon=True),
+            threading.Thread(target=self._run_stage, args=(self._split,), daemon=True),
+            threading.Thread(target=self._run_stage, args=(self._embed,), daemon=True),
+            threading.Thread(target=self._run_stage, args=(self._mmr,), daemon=True),
+        ]
+        for thread in threads:
+            thread.start()
+
+        stats = self.stages["write"]
+        written = 0
+        try:
+            for article in iter_queue(self.queues["write"]):
+                start = time.perf_counter()
+                write(article)
+                written += 1
+                stats.add(1, time.perf_counter() - start)
+        except Exception:
+            drain(self.queues["write"])
+            raise
+        finally:
+            for thread in threads:
+                thread.join()
+
+        if self.errors:
+            raise self.errors[0]
+        return written
+
+    def stats(self):
+        return {
+            "stages": {name: stage.stats() for name, stage in self.stages.items()},
+            "queues": {name: q.stats() for name, q in self.queues.items()},
+        }
@@ -0,0 +1,68 @@
+# ===========================
+# 요약 실행 진행 상황 (재시작 시 이어서 처리)
+# ===========================
+# - 입력 파일 워터마크: 마지막으로 처리가 끝난 입력 byte offset + 출력 파일 크기
+# - 처리 완료 URL 인덱스 (SQLite): 입력 파일이 다시 만들어져 처음부터 읽을 때만 중복 판단에 쓰임
+# 저장 순서는 출력 flush → 워터마크 → URL 인덱스. 워터마크 이후에 기록된 출력 줄은 재시작 시 잘라내고 다시 요약한다.
+import os
+
+from common.url_index import UrlIndex
+from common.watermark import Watermark
+from common.jsonl import iter_urls
+
+STATE_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "state"))
+
+
+def load_output_urls(path):
+    if os.path.exists(path):
+        yield from iter_urls(path)
+
+
+class SummaryProgress:
+    def __init__(self, input_path, output_path, state_dir=STATE_DIR, url_index=None):
+        name = os.path.basename(output_path)
+        self.input_path = input_path
+        self.output_path = output_path
+        self.ns = f"summary:{name}"
+        self.watermark = Watermark(os.path.join(state_dir, f"{name}.watermark.json"))
+        self.own_index = url_index is None
+        # 읽기 스레드(중복 확인)와 기록 스레드(추가)에서 함께 사용
+        self.url_index = url_index or UrlIndex(os.path.join(state_dir, "processed_urls.sqlite3"), check_same_thread=False)
+        self.pending_urls = []
+        self.offset = 0
+
+    def start(self):
+        """이어서 읽을 입력 offset을 반환하고, 처리 완료 URL을 집합 형태로 준비한다."""
+        # 인덱스 도입 전 출력 파일은 처음 한 번만 읽어서 채움
+        if self.url_index.seed(self.ns, lambda: load_output_urls(self.output_path)):
+            print(f"[INFO] 처리 완료 URL 인덱스 생성: {self.url_index.count(self.ns)}건 ({self.ns})")
+
+        output_offset = self.watermark.get("output_offset")
+        if output_offset is not None and os.path.exists(self.output_path) \
+                and os.path.getsize(self.output_path) > output_offset:
+            # 워터마크 저장 전에 중단된 실행이 덧붙인 줄 제거 (해당 URL은 인덱스에도 없음)
+            with open(self.output_path, "r+b") as f:
+                f.truncate(output_offset)
+
+        self.offset = self.watermark.resume_offset(self.input_path)
+        self.processed = self.url_index.view(self.ns)
+        return self.offset
+
+    def record(self, url, offset):
+        """출력에 한 건을 쓴 뒤 호출 (offset: 해당 기사 입력 줄의 끝)"""
+        self.pending_urls.append(url)
+        self.offset = max(self.offset, offset)
+
+    def commit(self, outfile, offset=None):
+        """출력 파일을 flush하고 현재 위치를 저장. offset을 주면 그 위치까지 처리 완료로 기록."""
+        if offset is not None:
+            self.offset = max(self.offset, offset)
+        outfile.flush()
+        os.fsync(outfile.fileno())
+        self.watermark.save(self.input_path, self.offset, output_offset=os.fstat(outfile.fileno()).st_size)
+        self.url_index.add_many(self.ns, self.pending_urls)
+        self.pending_urls = []
+
+    def close(self):
+        if self.own_index:
+            self.url_index.close()
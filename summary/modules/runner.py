@@ -0,0 +1,160 @@
+# ===========================
+# 요약 실행기: 모델 / 캐시 / 문장 분리 풀을 한 번만 만들고 여러 입력 파일을 처리
+# ===========================
+import os
+import time
+import logging
+
+import torch
+from tqdm import tqdm
+
+from common.watermark import read_new_lines
+from common.jsonl import loads, JsonlWriter
+from modules.sentence_splitter import ParallelSplitter
+from modules.sentence_embedder import KoBERTEmbedder
+from modules.pipeline import SummaryPipeline
+from modules.embedding_cache import EmbeddingCache
+from modules.progress import SummaryProgress, STATE_DIR
+from modules.summarizer import mmr_torch as mmr
+from modules.summarizer import mmr_torch_batch, pad_embeddings
+
+BASE_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), ".."))  # summary/
+
+TOP_N = 3
+LAMBDA_PARAM = 0.7
+
+
+# ===== 기사별 요약 (MMR) =====
+def summarize_embedding(sentences, sentence_embeddings):
+    doc_embedding = sentence_embeddings.mean(dim=0)
+    summary_sentences = mmr(
+        doc_embedding,
+        sentence_embeddings,
+        sentences,
+        top_n=TOP_N,
+        lambda_param=LAMBDA_PARAM
+    )
+    summary_sentences = list(dict.fromkeys(summary_sentences))
+    return " ".join(s.strip() for s in summary_sentences)
+
+# 한 임베딩 묶음의 기사들을 패딩된 텐서로 한꺼번에 MMR
+def summarize_embedding_batch(sentence_lists, embedding_list):
+    doc_embeddings = torch.stack([e.mean(dim=0) for e in embedding_list])
+    padded, mask = pad_embeddings(embedding_list)
+    selections = mmr_torch_batch(doc_embeddings, padded, mask, top_n=TOP_N, lambda_param=LAMBDA_PARAM)
+    summaries = []
+    for sentences, selected in zip(sentence_lists, selections):
+        summary_sentences = list(dict.fromkeys(sentences[i] for i in selected))
+        summaries.append(" ".join(s.strip() for s in summary_sentences))
+    return summaries
+
+
+class SummaryRunner:
+    def __init__(self, backend="torch", device=None, chunk_articles=64, max_batch_tokens=8192,
+                 split_workers=4, split_backend=None, split_chunk=16, queue_size=256,
+                 commit_every=200, onnx_quantize=True, onnx_threads=None,
+                 cache_dir=None, cache_capacity=200_000, show_progress=True, state_dir=STATE_DIR):
+        self.chunk_articles = chunk_articles
+        self.max_batch_tokens = max_batch_tokens
+        self.queue_size = queue_size
+        self.commit_every = commit_every
+        self.show_progress = show_progress
+        self.state_dir = state_dir
+
+        # 문장 분리 프로세스 풀은 모델을 올리기 전에 띄움
+        self.splitter = ParallelSplitter(workers=split_workers, backend=split_backend, chunk_size=split_chunk)
+
+        cache_dir = cache_dir or os.path.join(BASE_DIR, "cache", f"embeddings_{backend}")
+        self.cache = EmbeddingCache(cache_dir, capacity=cache_capacity, tag=f"{backend}:quantize={onnx_quantize}")
+
+        load_start = time.time()
+        if backend == "onnx":
+            from modules.onnx_embedder import ONNXKoBERTEmbedder
+            self.embedder = ONNXKoBERTEmbedder(quantize=onnx_quantize, num_threads=onnx_threads, cache=self.cache)
+        else:
+            device = device or ("cuda" if torch.cuda.is_available() else "cpu")
+            self.embedder = KoBERTEmbedder(device=device, cache=self.cache)
+        logging.info(f"[INFO] 임베더 로드: {backend}, {time.time() - load_start:.1f}초")
+
+    def _read_articles(self, input_path, start_offset, processed, state):
+        # 기사에 입력 줄 끝 offset(_offset)을 붙여 넘기고, 기록할 때 떼어 진행 위치로 쓴다
+        lines = read_new_lines(input_path, start_offset)
+        if self.show_progress:
+            lines = tqdm(lines, desc=f"Summarizing {os.path.basename(input_path)}")
+        for line, offset in lines:
+            state["last_read_offset"] = offset
+            try:
+                article = loads(line)
+            except Exception as e:
+                logging.error(f"Error for article: {e}")
+                continue
+
+            url = article.get("url")
+            content = (article.get("content") or "").strip()
+            if not content or not url or url in processed:
+                continue
+
+            processed.add(url)  # 같은 파일 안의 중복 URL 방지
+            article["_offset"] = offset
+            yield article
+
+    def run_file(self, input_path, output_path, on_written=None):
+        """
+        input_path의 처리되지 않은 부분을 요약해 output_path에 이어 쓴다.
+        on_written(article): 기록한 기사마다 호출 (예: 업로드 대기열). 요약한 건수를 반환.
+        """
+        if not os.path.exists(input_path):
+            logging.warning(f"[WARN] 입력 파일 없음: {input_path}")
+            return 0
+
+        os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+        progress = SummaryProgress(input_path, output_path, state_dir=self.state_dir)
+        start_offset = progress.start()
+        if start_offset:
+            logging.info(f"[INFO] {input_path}: 입력 {start_offset}바이트부터 이어서 처리")
+
+        pipeline = SummaryPipeline(
+            self.embedder,
+            self.splitter,
+            summarize_embedding,
+            chunk_articles=self.chunk_articles,
+            max_tokens=self.max_batch_tokens,
+            queue_size=self.queue_size,
+            on_chunk=self.cache.flush,
+            summarize_batch=summarize_embedding_batch,
+        )
+        state = {"last_read_offset": start_offset, "since_commit": 0}
+        start_time = time.time()
+
+        with JsonlWriter(output_path, "a") as outfile:
+            def write_summary(article):
+                offset = article.pop("_offset")
+                outfile.write(article)
+                progress.record(article["url"], offset)
+                logging.info(f"Summarized: {article['url']}")
+                if on_written:
+                    on_written(article)
+                state["since_commit"] += 1
+                if state["since_commit"] >= self.commit_every:
+                    progress.commit(outfile)
+                    state["since_commit"] = 0
+
+            try:
+                articles = self._read_articles(input_path, start_offset, progress.processed, state)
+                written = pipeline.run(articles, write_summary)
+                # 끝까지 처리했으면 건너뛴 줄까지 포함해 마지막으로 읽은 위치 저장
+                progress.commit(outfile, state["last_read_offset"])
+            finally:
+                self.cache.flush()
+                progress.close()
+
+        elapsed = time.time() - start_time
+        rate = written / elapsed if elapsed > 0 else 0
+        logging.info(f"[INFO] {output_path}: {written}건 요약, {elapsed:.1f}초 ({rate:.2f} articles/s)")
+        logging.info(f"[INFO] 파이프라인: {pipeline.stats()}")
+        return written
+
+    def close(self):
+        self.splitter.close()
+        self.cache.close()
+        logging.info(f"[INFO] 임베딩 캐시: {self.cache.stats()}")
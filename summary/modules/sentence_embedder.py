@@ -1,9 +1,33 @@
+import numpy as np
 import torch
 from transformers import BertModel
 from kobert_transformers import get_tokenizer
 
+from modules.embedding_cache import sentence_key
+
+
+def make_batches(lengths, max_tokens=8192):
+    """
+    입력 순서를 유지하며 (문장 수 × 가장 긴 문장 길이)가 max_tokens를 넘지 않도록 자른
+    (시작, 끝) 구간 리스트를 반환한다.
+    """
+    batches = []
+    start = 0
+    longest = 0
+    for i, length in enumerate(lengths):
+        if i > start and (i - start + 1) * max(longest, length) > max_tokens:
+            batches.append((start, i))
+            start = i
+            longest = 0
+        longest = max(longest, length)
+    if start < len(lengths):
+        batches.append((start, len(lengths)))
+    return batches
+
+
 class KoBERTEmbedder:
-    def __init__(self, device=None):
+    def __init__(self, device=None, cache=None):
+        self.cache = cache  # EmbeddingCache (없으면 매번 모델 실행)
         if device is None:
             self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
         else:
@@ -16,6 +40,15 @@ class KoBERTEmbedder:
 
         print(f"[INFO] Using device: {self.device}")  # ← 선택적 확인용 출력
 
+    def _cls_embeddings(self, inputs):
+        # 정확하고 안전한 방식으로 device에 올림
+        inputs = {k: v.to(self.device) for k, v in inputs.items()}
+
+        with torch.no_grad():
+            outputs = self.model(**inputs)
+
+        return outputs.last_hidden_state[:, 0, :]
+
     def get_sentence_embedding(self, sentences):
         if isinstance(sentences, str):
             sentences = [sentences]
@@ -26,15 +59,67 @@ class KoBERTEmbedder:
             truncation=True,
             return_tensors="pt"
         )
+        return self._cls_embeddings(inputs)
 
-        # 정확하고 안전한 방식으로 device에 올림
-        inputs = {k: v.to(self.device) for k, v in inputs.items()}
+    def get_bucketed_embedding(self, sentences, max_tokens=8192):
+        """
+        토큰 길이순으로 정렬해 비슷한 길이끼리 묶고(버킷당 문장 수 × 최대 길이 ≤ max_tokens),
+        버킷마다 그 안의 최대 길이까지만 패딩해 임베딩한 뒤 원래 순서로 되돌린다.
+        """
+        if isinstance(sentences, str):
+            sentences = [sentences]
 
-        with torch.no_grad():
-            outputs = self.model(**inputs)
+        encoded = self.tokenizer(sentences, truncation=True)
+        lengths = [len(ids) for ids in encoded["input_ids"]]
+        order = sorted(range(len(sentences)), key=lambda i: lengths[i])
+
+        chunks = []
+        for start, end in make_batches([lengths[i] for i in order], max_tokens):
+            features = [{k: encoded[k][i] for k in encoded.keys()} for i in order[start:end]]
+            inputs = self.tokenizer.pad(features, padding=True, return_tensors="pt")
+            chunks.append(self._cls_embeddings(inputs))
+
+        sorted_embeddings = torch.cat(chunks, dim=0)
+        embeddings = torch.empty_like(sorted_embeddings)
+        embeddings[torch.tensor(order, device=sorted_embeddings.device)] = sorted_embeddings
+        return embeddings
 
-        cls_embeddings = outputs.last_hidden_state[:, 0, :]
-        return cls_embeddings
+    def token_lengths(self, sentences):
+        # 특수 토큰([CLS], [SEP]) 포함, 최대 길이로 자른 뒤의 토큰 수
+        return [len(ids) for ids in self.tokenizer(sentences, truncation=True)["input_ids"]]
 
-    def encode(self, sentences):
+    def _encode(self, sentences, max_tokens=None):
+        # max_tokens를 주면 길이별 버킷 단위로 패딩 (결과는 입력 순서 그대로)
+        if max_tokens:
+            return self.get_bucketed_embedding(sentences, max_tokens)
         return self.get_sentence_embedding(sentences)
+
+    def encode(self, sentences, max_tokens=None):
+        if self.cache is None:
+            return self._encode(sentences, max_tokens)
+        if isinstance(sentences, str):
+            sentences = [sentences]
+
+        # 캐시에 없는 문장만 (중복 없이) 모델에 넣고 결과를 캐시에 저장
+        keys = [sentence_key(s) for s in sentences]
+        vectors = {}
+        missing = {}
+        for key, sentence in zip(keys, sentences):
+            if key in vectors or key in missing:
+                continue
+            vector = self.cache.get(key)
+            if vector is None:
+                missing[key] = sentence
+            else:
+                vectors[key] = vector
+
+        if missing:
+            new = self._encode(list(missing.values()), max_tokens).float().cpu().numpy()
+            # 캐시에서 읽은 값과 같도록 float16으로 반올림
+            new = new.astype(np.float16).astype(np.float32)
+            for key, vector in zip(missing, new):
+                self.cache.put(key, vector)
+                vectors[key] = vector
+
+        embeddings = np.stack([vectors[key] for key in keys])
+        return torch.from_numpy(embeddings).to(self.device)
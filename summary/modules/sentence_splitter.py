@@ -1,6 +1,79 @@
 import kss
+from collections import deque
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor
 
-def split_sentences(text):
+# kss 백엔드: None(kss 기본값), "pecab", "mecab"(python-mecab-ko 필요), "punct"
+_backend = None
+
+
+def split_sentences(text, backend=None):
     if not isinstance(text, str) or not text.strip():
         return []
+    backend = backend or _backend
+    if backend:
+        return kss.split_sentences(text, backend=backend)
     return kss.split_sentences(text)
+
+
+# ===========================
+# 프로세스 풀 문장 분리
+# ===========================
+def _init_worker(backend):
+    global _backend
+    _backend = backend
+
+
+def _split_one(text):
+    try:
+        return split_sentences(text)
+    except Exception:
+        # 한 기사의 분리 실패가 묶음 전체를 버리지 않도록 빈 결과로 처리
+        return []
+
+
+def _split_chunk(texts):
+    return [_split_one(text) for text in texts]
+
+
+class ParallelSplitter:
+    """
+    기사 묶음(chunk_size개) 단위로 여러 프로세스에서 kss를 돌린다.
+    결과는 입력 순서대로 나오며, 동시에 처리 중인 묶음은 max_pending개로 제한해
+    메인 프로세스가 임베딩하는 동안 다음 기사들이 미리 분리된다.
+    """
+    def __init__(self, workers=4, backend=None, chunk_size=32, max_pending=None):
+        self.chunk_size = chunk_size
+        self.max_pending = max_pending or workers * 2
+        self.pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(backend,))
+        # 임베딩 모델을 올리기 전에 워커를 미리 띄워 둔다 (모델/torch 스레드가 있는 상태로 fork 되지 않도록)
+        for future in [self.pool.submit(_init_worker, backend) for _ in range(workers)]:
+            future.result()
+
+    def imap(self, items, text=lambda item: item):
+        """items의 각 원소에 대해 (item, 문장 리스트)를 순서대로 반환"""
+        items = iter(items)
+        pending = deque()
+
+        def submit():
+            chunk = list(islice(items, self.chunk_size))
+            if not chunk:
+                return False
+            pending.append((chunk, self.pool.submit(_split_chunk, [text(item) for item in chunk])))
+            return True
+
+        while len(pending) < self.max_pending and submit():
+            pass
+        while pending:
+            chunk, future = pending.popleft()
+            submit()
+            yield from zip(chunk, future.result())
+
+    def close(self):
+        self.pool.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
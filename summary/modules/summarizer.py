@@ -1,33 +1,41 @@
 # ===========================
-# CPU 버전 MMR (기존 코드)
+# CPU 버전 MMR
 # ===========================
+# 선택된 문장과의 최대 유사도(max_sim)를 누적해 두고, 문장을 하나 고를 때마다
+# 그 문장 한 줄의 유사도만 계산해 갱신한다 (N×N 유사도 행렬을 만들지 않음, O(k·N)).
 import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity
+
+
+def _normalize_rows(x):
+    norms = np.linalg.norm(x, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0  # 영벡터는 유사도 0 (sklearn cosine_similarity와 동일)
+    return x / norms
+
 
 def mmr(doc_embedding, sentence_embeddings, sentences, top_n=3, lambda_param=0.5):
-    selected = []
-    doc_embedding = doc_embedding.reshape(1, -1)
-    sim_to_doc = cosine_similarity(sentence_embeddings, doc_embedding).reshape(-1)
-    sim_between_sentences = cosine_similarity(sentence_embeddings)
+    sentence_embeddings = _normalize_rows(np.asarray(sentence_embeddings, dtype=np.float64))
+    doc_embedding = _normalize_rows(np.asarray(doc_embedding, dtype=np.float64).reshape(1, -1))[0]
+    sim_to_doc = sentence_embeddings @ doc_embedding
 
-    n = min(top_n, len(sentences))  # ← 여기만 명시적으로 수정
+    n = min(top_n, len(sentences))
+    selected = []
+    max_sim = np.full(len(sentences), -np.inf)
 
     for _ in range(n):
         if len(selected) == 0:
-            idx = sim_to_doc.argmax()
-            selected.append(idx)
-            continue
-
-        mmr_score = sim_to_doc - lambda_param * np.max(sim_between_sentences[selected], axis=0)
-        mmr_score[selected] = -np.inf
-        idx = mmr_score.argmax()
+            idx = int(sim_to_doc.argmax())
+        else:
+            mmr_score = sim_to_doc - lambda_param * max_sim
+            mmr_score[selected] = -np.inf
+            idx = int(mmr_score.argmax())
         selected.append(idx)
+        np.maximum(max_sim, sentence_embeddings @ sentence_embeddings[idx], out=max_sim)
 
     return [sentences[i] for i in sorted(selected)]
 
 
 # ===========================
-# GPU 버전 MMR (추가 코드)
+# GPU 버전 MMR
 # ===========================
 import torch
 import torch.nn.functional as F
@@ -38,23 +46,70 @@ def cosine_sim_matrix(a, b):
     return torch.mm(a_norm, b_norm.T)
 
 def mmr_torch(doc_embedding, sentence_embeddings, sentences, top_n=3, lambda_param=0.5):
-    sim_to_doc = cosine_sim_matrix(sentence_embeddings, doc_embedding.unsqueeze(0)).squeeze(1)
-    sim_between = cosine_sim_matrix(sentence_embeddings, sentence_embeddings)
+    sentence_embeddings = F.normalize(sentence_embeddings, p=2, dim=1)
+    doc_embedding = F.normalize(doc_embedding, p=2, dim=0)
+    sim_to_doc = sentence_embeddings @ doc_embedding
 
-    selected = []
     n = min(top_n, len(sentences))
+    selected = []
+    max_sim = torch.full_like(sim_to_doc, -float("inf"))
 
     for _ in range(n):
         if len(selected) == 0:
             idx = torch.argmax(sim_to_doc).item()
-            selected.append(idx)
-            continue
-
-        sim_selected = sim_between[selected]
-        max_sim = torch.max(sim_selected, dim=0).values
-        mmr_score = sim_to_doc - lambda_param * max_sim
-        mmr_score[selected] = -float("inf")
-        idx = torch.argmax(mmr_score).item()
+        else:
+            mmr_score = sim_to_doc - lambda_param * max_sim
+            mmr_score[selected] = -float("inf")
+            idx = torch.argmax(mmr_score).item()
         selected.append(idx)
+        max_sim = torch.maximum(max_sim, sentence_embeddings @ sentence_embeddings[idx])
 
     return [sentences[i] for i in sorted(selected)]
+
+
+# ===========================
+# 여러 기사 동시 MMR (패딩된 텐서)
+# ===========================
+def pad_embeddings(embeddings_list):
+    """기사별 (n_i, D) 텐서 리스트 → (B, N, D) 패딩 텐서와 (B, N) 유효 문장 마스크"""
+    batch = len(embeddings_list)
+    longest = max(len(e) for e in embeddings_list)
+    dim = embeddings_list[0].shape[1]
+    padded = embeddings_list[0].new_zeros((batch, longest, dim))
+    mask = torch.zeros((batch, longest), dtype=torch.bool, device=padded.device)
+    for i, e in enumerate(embeddings_list):
+        padded[i, :len(e)] = e
+        mask[i, :len(e)] = True
+    return padded, mask
+
+def mmr_torch_batch(doc_embeddings, sentence_embeddings, mask, top_n=3, lambda_param=0.5):
+    """
+    doc_embeddings: (B, D), sentence_embeddings: (B, N, D), mask: (B, N)
+    B개 기사에서 각각 min(top_n, 문장 수)개를 mmr_torch와 같은 규칙으로 한꺼번에 고른다.
+    기사별로 고른 문장 인덱스(오름차순) 리스트를 반환.
+    """
+    sentence_embeddings = F.normalize(sentence_embeddings, p=2, dim=2)
+    doc_embeddings = F.normalize(doc_embeddings, p=2, dim=1)
+    sim_to_doc = torch.bmm(sentence_embeddings, doc_embeddings.unsqueeze(2)).squeeze(2)
+    sim_to_doc = sim_to_doc.masked_fill(~mask, -float("inf"))
+
+    batch = torch.arange(len(mask), device=mask.device)
+    counts = mask.sum(dim=1)
+    selected = torch.zeros_like(mask)
+    max_sim = torch.full_like(sim_to_doc, -float("inf"))
+
+    for step in range(min(top_n, int(counts.max()))):
+        if step == 0:
+            mmr_score = sim_to_doc
+        else:
+            mmr_score = sim_to_doc - lambda_param * max_sim
+        mmr_score = mmr_score.masked_fill(selected | ~mask, -float("inf"))
+        idx = torch.argmax(mmr_score, dim=1)
+
+        # 문장 수가 step 이하인 기사는 더 고르지 않음
+        active = counts > step
+        selected[batch[active], idx[active]] = True
+        chosen = sentence_embeddings[batch, idx].unsqueeze(2)
+        max_sim = torch.maximum(max_sim, torch.bmm(sentence_embeddings, chosen).squeeze(2))
+
+    return [row.nonzero().flatten().tolist() for row in selected]
@@ -1,9 +1,12 @@
 import os
-import json
+import sys
 import glob
 from pymongo import MongoClient
 from dotenv import load_dotenv
 
+sys.path.append(os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..")))  # data/
+from common.jsonl import iter_jsonl
+
 # 1. .env 파일에서 MongoDB 연결 URI 불러오기
 load_dotenv()
 ATLAS_URI = os.getenv("ATLAS_URI")
@@ -36,21 +39,14 @@ for file_path in sorted(jsonl_files):
     collection = db[collection_name]
 
     # 5. 파일을 라인 단위로 읽고 JSON 파싱
+    # (파싱 에러 발생한 줄은 줄 번호와 함께 경고하고 건너뜀)
     records = []
-    with open(file_path, "r", encoding="utf-8") as f:
-        for line in f:
-            try:
-                doc = json.loads(line.strip())
-
-                # 필수 필드 보장: 없으면 빈 문자열로 채움
-                for field in ["press", "title", "journalist", "date", "time", "content", "url", "summary"]:
-                    if field not in doc:
-                        doc[field] = ""
-                records.append(doc)
-
-            except json.JSONDecodeError:
-                # 파싱 에러 발생한 줄은 무시
-                continue
+    for doc in iter_jsonl(file_path):
+        # 필수 필드 보장: 없으면 빈 문자열로 채움
+        for field in ["press", "title", "journalist", "date", "time", "content", "url", "summary"]:
+            if field not in doc:
+                doc[field] = ""
+        records.append(doc)
 
     # 6. MongoDB에 문서 삽입
     if records:
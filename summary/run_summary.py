@@ -0,0 +1,121 @@
+import os
+import sys
+import glob
+import time
+import logging
+import argparse
+from datetime import datetime
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))  # summary/
+DATA_DIR = os.path.normpath(os.path.join(BASE_DIR, ".."))  # data/
+sys.path.append(DATA_DIR)
+sys.path.append(BASE_DIR)
+
+# ===== 소스별 입력 / 출력 경로 =====
+# news, editorial: 월별 입력 파일 → 월별 요약 파일
+# party: 정당별 누적 파일 → 정당별 요약 파일 (월 범위와 무관하게 전체, 이어서 처리)
+SOURCES = {
+    "news": {
+        "input": os.path.join(DATA_DIR, "news_crawler", "clean", "data", "cleaned_{month}.jsonl"),
+        "output": "summarized_{month}.jsonl",
+    },
+    "editorial": {
+        "input": os.path.join(DATA_DIR, "opinion", "clean", "output", "editorial_{month}_cleaned.jsonl"),
+        "output": "summarized_opinion_{month}.jsonl",
+    },
+    "party": {
+        "input": os.path.join(DATA_DIR, "automatic", "a_clean", "data", "*_all_cleaned.jsonl"),
+        "output": "summarized_party_{name}.jsonl",
+    },
+}
+OUTPUT_DIR = os.path.join(BASE_DIR, "output")
+
+
+def month_range(start, end):
+    start_dt = datetime.strptime(start, "%Y%m")
+    end_dt = datetime.strptime(end, "%Y%m")
+    if start_dt > end_dt:
+        start_dt, end_dt = end_dt, start_dt
+    months = []
+    year, month = start_dt.year, start_dt.month
+    while (year, month) <= (end_dt.year, end_dt.month):
+        months.append(f"{year}{month:02d}")
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+
+def output_name(source, input_path):
+    # 입력 파일 이름에서 월(YYYYMM) 또는 정당 이름을 뽑아 출력 파일 이름을 만든다
+    name = os.path.basename(input_path)
+    if source == "party":
+        return SOURCES["party"]["output"].format(name=name.replace("_all_cleaned.jsonl", ""))
+    digits = "".join(ch for ch in name if ch.isdigit())
+    if len(digits) >= 6:
+        return SOURCES[source]["output"].format(month=digits[:6])
+    return f"summarized_{os.path.splitext(name)[0]}.jsonl"
+
+
+def resolve_jobs(source, inputs, start, end, output_dir):
+    if inputs:
+        paths = inputs
+    elif source == "party":
+        paths = sorted(glob.glob(SOURCES["party"]["input"]))
+    else:
+        if not (start and end):
+            raise SystemExit("[ERROR] 입력 파일 또는 --start/--end(YYYYMM)를 지정하세요.")
+        paths = [SOURCES[source]["input"].format(month=month) for month in month_range(start, end)]
+    return [(path, os.path.join(output_dir, output_name(source, path))) for path in paths]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="기사 요약 실행기 (모델은 한 번만 로드)")
+    parser.add_argument("inputs", nargs="*", help="요약할 JSONL 파일 (생략하면 --start/--end 또는 party 전체)")
+    parser.add_argument("--source", choices=SOURCES.keys(), default="news", help="입력 종류")
+    parser.add_argument("--start", help="시작 월 (YYYYMM)")
+    parser.add_argument("--end", help="끝 월 (YYYYMM)")
+    parser.add_argument("--output-dir", default=OUTPUT_DIR)
+    parser.add_argument("--backend", choices=["torch", "onnx"], default=os.getenv("EMBED_BACKEND", "torch"))
+    parser.add_argument("--threads", type=int, default=None, help="ONNX Runtime intra-op 스레드 수")
+    parser.add_argument("--no-quantize", action="store_true", help="onnx 백엔드에서 int8 양자화 모델을 쓰지 않음")
+    parser.add_argument("--split-workers", type=int, default=4, help="kss 문장 분리 프로세스 수")
+    parser.add_argument("--split-backend", default=None, help="kss 백엔드 (pecab, mecab 등)")
+    parser.add_argument("--chunk-articles", type=int, default=64, help="한 번에 모아서 임베딩할 기사 수")
+    parser.add_argument("--max-batch-tokens", type=int, default=8192, help="모델 1회 호출당 (문장 수 × 최대 토큰 길이) 상한")
+    args = parser.parse_args()
+
+    jobs = resolve_jobs(args.source, args.inputs, args.start, args.end, args.output_dir)
+
+    os.makedirs(os.path.join(BASE_DIR, "log"), exist_ok=True)
+    logging.basicConfig(
+        filename=os.path.join(BASE_DIR, "log", f"summarizer_{args.source}.log"),
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        encoding="utf-8"
+    )
+
+    from modules.runner import SummaryRunner
+
+    start_time = time.time()
+    runner = SummaryRunner(
+        backend=args.backend,
+        chunk_articles=args.chunk_articles,
+        max_batch_tokens=args.max_batch_tokens,
+        split_workers=args.split_workers,
+        split_backend=args.split_backend,
+        onnx_quantize=not args.no_quantize,
+        onnx_threads=args.threads,
+    )
+    total = 0
+    try:
+        for input_path, output_path in jobs:
+            print(f"[INFO] {input_path} → {output_path}")
+            count = runner.run_file(input_path, output_path)
+            print(f"[INFO] {os.path.basename(output_path)}: {count}건 요약")
+            total += count
+    finally:
+        runner.close()
+
+    elapsed = time.time() - start_time
+    print(f"[INFO] 전체 {len(jobs)}개 파일, {total}건 요약, {elapsed:.1f}초")
+    logging.info(f"[INFO] 전체 {len(jobs)}개 파일, {total}건 요약, {elapsed:.1f}초")
+    print("[INFO] 모든 요약 완료. 스크립트 정상 종료.")
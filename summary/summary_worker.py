@@ -0,0 +1,188 @@
+import os
+import re
+import sys
+import glob
+import json
+import time
+import signal
+import logging
+import argparse
+from datetime import datetime, timedelta
+
+import pytz
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))  # summary/
+DATA_DIR = os.path.normpath(os.path.join(BASE_DIR, ".."))  # data/
+sys.path.append(DATA_DIR)
+sys.path.append(BASE_DIR)
+
+from common.watermark import Watermark, read_new_lines
+from common.jsonl import loads
+
+# ===== 감시 대상: 시간별 파이프라인의 전처리 결과 (추가되는 줄을 바로 요약) =====
+# kind: (입력 glob, 날짜 추출 정규식, 업로드 DB)
+TARGETS = {
+    "news": (os.path.join(DATA_DIR, "automatic", "clean", "data", "cleaned_*.jsonl"),
+             r"cleaned_(\d{8})\.jsonl$", "news_article_daily"),
+    "editorial": (os.path.join(DATA_DIR, "automatic", "b_clean", "data", "*.jsonl"),
+                  r"(\d{8})\.jsonl$", "opinion_daily"),
+}
+OUTPUT_DIR = os.path.join(BASE_DIR, "output", "daily")
+STATE_DIR = os.path.join(BASE_DIR, "state")
+UPLOAD_BATCH = 500
+
+korea = pytz.timezone("Asia/Seoul")
+stopping = False
+
+
+def request_stop(signum, frame):
+    global stopping
+    stopping = True
+    logging.info(f"[INFO] 종료 신호 수신({signum}) → 현재 파일 처리 후 종료")
+
+
+def find_inputs(days):
+    """최근 days일치 입력 파일 [(kind, 날짜, 입력 경로)]"""
+    oldest = (datetime.now(korea) - timedelta(days=days - 1)).strftime("%Y%m%d")
+    found = []
+    for kind, (pattern, date_re, _) in TARGETS.items():
+        for path in glob.glob(pattern):
+            match = re.search(date_re, os.path.basename(path))
+            if match and match.group(1) >= oldest:
+                found.append((kind, match.group(1), path))
+    return sorted(found, key=lambda item: item[1])
+
+
+# ===== 요약 결과 업로드: 출력 파일의 워터마크 이후 줄만 =====
+# 업로더가 먼저 올린 문서에는 summary만 추가하고, 아직 없으면 문서 전체를 넣는다.
+# 뉴스/사설 업로더도 같은 컬렉션에 url 고유 인덱스 + upsert($setOnInsert)로 쓰므로,
+# 둘이 동시에 같은 기사를 올려도 순서와 관계없이 한 건만 남는다.
+indexed_collections = set()
+
+
+def ensure_url_index(collection):
+    key = (collection.database.name, collection.name)
+    if key in indexed_collections:
+        return
+    from pymongo.errors import OperationFailure
+    try:
+        collection.create_index("url", unique=True)
+    except OperationFailure as e:
+        logging.warning(f"[WARN] {key[0]}.{key[1]} url 고유 인덱스 생성 실패 (upsert 필터로만 중복 방지): {e}")
+    indexed_collections.add(key)
+
+
+def upload_summaries(client, kind, date_str, output_path):
+    from pymongo import UpdateOne
+
+    watermark = Watermark(os.path.join(STATE_DIR, f"{os.path.basename(output_path)}.upload.json"))
+    start = watermark.resume_offset(output_path)
+    collection = client[TARGETS[kind][2]][date_str]
+    ensure_url_index(collection)
+    uploaded = 0
+    requests = []
+    end = start
+
+    def flush():
+        nonlocal uploaded, requests
+        if requests:
+            collection.bulk_write(requests, ordered=False)
+            uploaded += len(requests)
+            requests = []
+        watermark.save(output_path, end)
+
+    for line, end in read_new_lines(output_path, start):
+        try:
+            doc = loads(line)
+        except json.JSONDecodeError:
+            continue
+        url = doc.get("url")
+        if not url:
+            continue
+        rest = {k: v for k, v in doc.items() if k not in ("summary", "_id")}
+        requests.append(UpdateOne(
+            {"url": url},
+            {"$set": {"summary": doc.get("summary", "")}, "$setOnInsert": rest},
+            upsert=True,
+        ))
+        if len(requests) >= UPLOAD_BATCH:
+            flush()
+    flush()
+    return uploaded
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="상주 요약 워커: KoBERT를 한 번 로드하고 전처리 결과에 추가되는 기사를 바로 요약")
+    parser.add_argument("--interval", type=float, default=5.0, help="파일 변경 확인 주기 (초)")
+    parser.add_argument("--days", type=int, default=2, help="감시할 최근 날짜 수")
+    parser.add_argument("--backend", choices=["torch", "onnx"], default=os.getenv("EMBED_BACKEND", "torch"))
+    parser.add_argument("--threads", type=int, default=None, help="ONNX Runtime intra-op 스레드 수")
+    parser.add_argument("--split-workers", type=int, default=2, help="kss 문장 분리 프로세스 수")
+    parser.add_argument("--no-upload", action="store_true", help="MongoDB 업로드 없이 요약 파일만 작성")
+    args = parser.parse_args()
+
+    os.makedirs(os.path.join(BASE_DIR, "log"), exist_ok=True)
+    logging.basicConfig(
+        filename=os.path.join(BASE_DIR, "log", "summary_worker.log"),
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        encoding="utf-8"
+    )
+    signal.signal(signal.SIGTERM, request_stop)
+    signal.signal(signal.SIGINT, request_stop)
+
+    client = None
+    if not args.no_upload:
+        from dotenv import load_dotenv
+        from pymongo import MongoClient
+        load_dotenv()
+        ATLAS_URI = os.getenv("ATLAS_URI")
+        if not ATLAS_URI:
+            raise ValueError("ATLAS_URI 환경변수가 비어 있습니다. (.env 파일 확인 필요)")
+        client = MongoClient(ATLAS_URI)
+
+    from modules.runner import SummaryRunner
+
+    runner = SummaryRunner(
+        backend=args.backend,
+        onnx_threads=args.threads,
+        split_workers=args.split_workers,
+        show_progress=False,
+        commit_every=50,
+    )
+    logging.info(f"[INFO] 요약 워커 시작 (backend={args.backend}, interval={args.interval}s)")
+
+    # 입력 파일별 마지막으로 확인한 (크기, 수정 시각)
+    seen = {}
+    try:
+        while not stopping:
+            for kind, date_str, input_path in find_inputs(args.days):
+                if stopping:
+                    break
+                try:
+                    stat = os.stat(input_path)
+                except FileNotFoundError:
+                    continue
+                signature = (stat.st_size, stat.st_mtime_ns)
+                if seen.get(input_path) == signature:
+                    continue
+
+                output_path = os.path.join(OUTPUT_DIR, f"summarized_{kind}_{date_str}.jsonl")
+                try:
+                    start = time.time()
+                    count = runner.run_file(input_path, output_path)
+                    if client is not None:
+                        uploaded = upload_summaries(client, kind, date_str, output_path)
+                    else:
+                        uploaded = 0
+                    seen[input_path] = signature
+                    if count or uploaded:
+                        logging.info(f"[INFO] {kind} {date_str}: {count}건 요약, {uploaded}건 업로드 ({time.time() - start:.1f}초)")
+                except Exception as e:
+                    # 다음 주기에 다시 시도 (진행 위치는 요약/업로드 워터마크에 남아 있음)
+                    logging.exception(f"[ERROR] {input_path} 처리 실패: {e}")
+
+            time.sleep(args.interval)
+    finally:
+        runner.close()
+        logging.info("[INFO] 요약 워커 종료")